@@ -0,0 +1,193 @@
+from __future__ import annotations
+
+import random
+
+from benchmarks.dataset import DatasetLayout
+from benchmarks.harness import BenchmarkCase
+from event.application.list_event_use_case import ListEventInputDto
+from event.application.list_staffs_with_email_and_name_use_case import (
+    ListStaffsInputDto,
+)
+from friendship.application.list_friendships_with_user_email_and_name_use_case import (
+    ListFriendshipsInputDto,
+)
+from friendship.application.send_friendship_invite_use_case import (
+    SendFriendshipInviteInputDto,
+)
+from friendship.domain.friendship_status import FriendshipStatus
+from shared.application.pagination import PageCursor
+from shared.composition_root import CompositionRoot
+from ticket.application.dtos import (
+    CountFriendsAttendingInputDto,
+    RedeemTicketInputDto,
+    ValidateTicketInputDto,
+    ValidateTicketsInputDto,
+)
+from user.domain.user_role import UserRole
+
+PAGE_SIZE = 8
+BULK_VALIDATION_SIZE = 10
+
+
+def _pending_codes(app: CompositionRoot, event_id: int, count: int) -> list[str]:
+    with app.db.connect() as conn:
+        rows = conn.execute(
+            "SELECT code FROM tickets WHERE event_id = ? AND status = 'PENDING' "
+            "ORDER BY id LIMIT ?",
+            (event_id, count),
+        ).fetchall()
+    if len(rows) < count:
+        raise ValueError(
+            f"Event {event_id} has {len(rows)} pending tickets, {count} needed; "
+            "rebuild the dataset or lower --iterations"
+        )
+    return [code for (code,) in rows]
+
+
+class UseCaseBenchmarks:
+    """Inputs drawn up front so each timed call only runs the use case."""
+
+    def __init__(
+        self, app: CompositionRoot, layout: DatasetLayout, calls: int, seed: int
+    ) -> None:
+        if calls > layout.invite_pairs:
+            raise ValueError(f"At most {layout.invite_pairs} calls per case")
+
+        rng = random.Random(seed)
+        event_pages = max(1, (layout.events + 1) // PAGE_SIZE)
+        self._app = app
+        self._layout = layout
+        self._pages = [rng.randint(1, event_pages) for _ in range(calls)]
+        self._event_ids = [rng.randint(1, layout.events) for _ in range(calls)]
+        self._clients = [
+            layout.first_client_id + rng.randrange(layout.clients) for _ in range(calls)
+        ]
+        codes = _pending_codes(
+            app, layout.ongoing_event_id, calls * (1 + BULK_VALIDATION_SIZE)
+        )
+        self._codes, self._bulk_codes = codes[:calls], codes[calls:]
+
+    def cases(self) -> list[BenchmarkCase]:
+        cold = self.clear_page_cache
+        return [
+            BenchmarkCase("list_event.offset_page", self.list_event_offset, cold),
+            BenchmarkCase("list_event.keyset_page", self.list_event_keyset, cold),
+            BenchmarkCase(
+                "list_event.with_tickets", self.list_event_with_tickets, cold
+            ),
+            BenchmarkCase("list_friendships.accepted", self.list_friendships, cold),
+            BenchmarkCase("list_staffs.event", self.list_staffs, cold),
+            BenchmarkCase("friendship_graph.mutual_count", self.mutual_friend_count),
+            BenchmarkCase("friendship_graph.suggestions", self.suggest_friends),
+            BenchmarkCase(
+                "count_friends_attending.page", self.count_friends_attending, cold
+            ),
+            BenchmarkCase("validate_ticket", self.validate_ticket),
+            BenchmarkCase("validate_ticket.bulk_10", self.validate_tickets_bulk),
+            BenchmarkCase("redeem_ticket", self.redeem_ticket),
+            BenchmarkCase("send_friendship_invite", self.send_friendship_invite),
+        ]
+
+    def clear_page_cache(self, _i: int) -> None:
+        # Measure the database path, not the page cache.
+        self._app.page_cache.clear()
+
+    def list_event_offset(self, i: int):
+        return self._app.list_event_use_case.list_event(
+            ListEventInputDto(page=self._pages[i], page_size=PAGE_SIZE)
+        )
+
+    def list_event_keyset(self, i: int):
+        return self._app.list_event_use_case.list_event(
+            ListEventInputDto(
+                page=self._pages[i],
+                page_size=PAGE_SIZE,
+                cursor=PageCursor.after(self._event_ids[i]).encode(),
+            )
+        )
+
+    def list_event_with_tickets(self, i: int):
+        return self._app.list_event_use_case.list_event(
+            ListEventInputDto(
+                page=self._pages[i] // 2 + 1,
+                page_size=PAGE_SIZE,
+                filter_mode="WITH_TICKETS",
+                user_id=self._clients[i],
+            )
+        )
+
+    def list_friendships(self, i: int):
+        return self._app.list_friendships_use_case.execute(
+            ListFriendshipsInputDto(
+                page=1,
+                size=10,
+                participant_client_id=self._clients[i],
+                status=FriendshipStatus.ACCEPTED,
+            )
+        )
+
+    def list_staffs(self, _i: int):
+        return self._app.list_staffs_use_case.execute(
+            ListStaffsInputDto(page=1, size=10, event_id=self._layout.ongoing_event_id)
+        )
+
+    # The graph loads on its first call, which lands in the warmup.
+
+    def mutual_friend_count(self, i: int):
+        client = self._clients[i]
+        return self._app.friendship_graph.mutual_friend_count(client, client + 1)
+
+    def suggest_friends(self, i: int):
+        return self._app.friendship_graph.suggest_friends(self._clients[i])
+
+    def count_friends_attending(self, i: int):
+        first = min(self._event_ids[i], max(1, self._layout.events - PAGE_SIZE + 1))
+        return self._app.count_friends_attending_use_case.execute(
+            CountFriendsAttendingInputDto(
+                client_id=self._clients[i],
+                event_ids=tuple(range(first, first + PAGE_SIZE)),
+            )
+        )
+
+    def validate_ticket(self, i: int):
+        return self._app.validate_ticket_use_case.execute(
+            ValidateTicketInputDto(
+                user_id=self._layout.staff_id,
+                user_role=UserRole.STAFF,
+                code=self._codes[i],
+            )
+        )
+
+    def validate_tickets_bulk(self, i: int):
+        start = i * BULK_VALIDATION_SIZE
+        return self._app.validate_ticket_use_case.validate_many(
+            ValidateTicketsInputDto(
+                user_id=self._layout.staff_id,
+                user_role=UserRole.STAFF,
+                codes=self._bulk_codes[start : start + BULK_VALIDATION_SIZE],
+            )
+        )
+
+    def redeem_ticket(self, i: int):
+        return self._app.redeem_ticket_use_case.redeem_ticket(
+            RedeemTicketInputDto(
+                event_id=self._layout.redeem_event_id,
+                client_id=self._clients[i],
+                redeem_ticket_count=1,
+            )
+        )
+
+    def send_friendship_invite(self, i: int):
+        requester, requested = self._layout.invite_emails(i)
+        return self._app.send_friendship_invite_use_case.execute(
+            SendFriendshipInviteInputDto(
+                requester_client_email=requester, requested_client_email=requested
+            )
+        )
+
+
+def build_cases(
+    app: CompositionRoot, layout: DatasetLayout, calls: int, seed: int
+) -> list[BenchmarkCase]:
+    """Every case, each able to run ``calls`` times (warmup included)."""
+    return UseCaseBenchmarks(app, layout, calls, seed).cases()
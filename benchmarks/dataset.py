@@ -0,0 +1,235 @@
+from __future__ import annotations
+
+import os
+import sqlite3
+from collections.abc import Iterable, Iterator
+from dataclasses import dataclass
+from datetime import UTC, datetime, timedelta
+from itertools import islice
+
+from shared.composition_root import build_application
+
+_CHUNK_SIZE = 50_000
+_PASSWORD_HASH = "0" * 64
+
+
+@dataclass(frozen=True)
+class DatasetLayout:
+    """Shape of a benchmark database, derived only from ``rows``.
+
+    ``rows`` is the number of tickets; users, events and friendships scale
+    with it. Ids are assigned in insertion order on a fresh database, so
+    they can be computed here instead of being looked up.
+    """
+
+    rows: int
+    invite_pairs: int = 1_000
+    friends_per_client: int = 5
+
+    @property
+    def organizers(self) -> int:
+        return max(5, self.rows // 2_000)
+
+    @property
+    def staffs(self) -> int:
+        return max(5, self.rows // 2_000)
+
+    @property
+    def clients(self) -> int:
+        return max(200, self.rows // 20)
+
+    @property
+    def events(self) -> int:
+        return max(20, self.rows // 500)
+
+    @property
+    def validation_tickets(self) -> int:
+        """Tickets on the event that is running now, used by validation."""
+        return min(self.rows // 2, 5_000)
+
+    # Users are inserted organizers, staffs, clients, then invite clients.
+
+    @property
+    def organizer_id(self) -> int:
+        return 1
+
+    @property
+    def staff_id(self) -> int:
+        return self.organizers + 1
+
+    @property
+    def first_client_id(self) -> int:
+        return self.organizers + self.staffs + 1
+
+    @property
+    def first_invite_client_id(self) -> int:
+        return self.first_client_id + self.clients
+
+    @property
+    def ongoing_event_id(self) -> int:
+        """The event staff can validate tickets for right now."""
+        return 1
+
+    @property
+    def redeem_event_id(self) -> int:
+        """An event with no tickets and room for every redeem iteration."""
+        return self.events + 1
+
+    def client_email(self, index: int) -> str:
+        return f"client{index}@bench.local"
+
+    def invite_emails(self, pair: int) -> tuple[str, str]:
+        return (
+            f"invite{2 * pair}@bench.local",
+            f"invite{2 * pair + 1}@bench.local",
+        )
+
+
+def _chunks(rows: Iterable[tuple], size: int = _CHUNK_SIZE) -> Iterator[list[tuple]]:
+    iterator = iter(rows)
+    while chunk := list(islice(iterator, size)):
+        yield chunk
+
+
+def _insert(conn: sqlite3.Connection, sql: str, rows: Iterable[tuple]) -> None:
+    for chunk in _chunks(rows):
+        conn.executemany(sql, chunk)
+
+
+def _users(layout: DatasetLayout) -> Iterator[tuple]:
+    for i in range(layout.organizers):
+        yield (f"Organizer {i}", f"organizer{i}@bench.local", "ORGANIZER")
+    for i in range(layout.staffs):
+        yield (f"Staff {i}", f"staff{i}@bench.local", "STAFF")
+    for i in range(layout.clients):
+        yield (f"Client {i}", layout.client_email(i), "CLIENT")
+    for i in range(2 * layout.invite_pairs):
+        yield (f"Invite {i}", f"invite{i}@bench.local", "CLIENT")
+
+
+def _ticket_event_id(layout: DatasetLayout, index: int) -> int:
+    if index < layout.validation_tickets:
+        return layout.ongoing_event_id
+    return 2 + index % (layout.events - 1)
+
+
+def _events(layout: DatasetLayout, now: datetime) -> Iterator[tuple]:
+    sold = [0] * (layout.events + 2)
+    for index in range(layout.rows):
+        sold[_ticket_event_id(layout, index)] += 1
+
+    for event_id in range(1, layout.events + 2):
+        if event_id == layout.ongoing_event_id:
+            start, end = now - timedelta(days=1), now + timedelta(days=30)
+        else:
+            start = now + timedelta(days=30 + event_id % 300)
+            end = start + timedelta(hours=6)
+        redeemed = sold[event_id]
+        # Every third event is sold out so the ticket filters have both sides.
+        if event_id == layout.redeem_event_id:
+            max_tickets = 10_000_000
+        elif event_id % 3 == 0:
+            max_tickets = redeemed
+        else:
+            max_tickets = redeemed + 100
+        organizer_id = 1 + event_id % layout.organizers
+        if event_id in (layout.ongoing_event_id, layout.redeem_event_id):
+            organizer_id = layout.organizer_id
+        yield (
+            f"Event {event_id}",
+            now.isoformat(sep=" "),
+            end.isoformat(sep=" "),
+            f"Venue {event_id % 50}",
+            start.isoformat(sep=" "),
+            max_tickets,
+            max_tickets,
+            organizer_id,
+            redeemed,
+        )
+
+
+def _tickets(layout: DatasetLayout, now: datetime) -> Iterator[tuple]:
+    created_at = now.isoformat()
+    for index in range(layout.rows):
+        client_id = layout.first_client_id + index % layout.clients
+        yield (
+            _ticket_event_id(layout, index),
+            client_id,
+            f"B{index:09X}",
+            "PENDING",
+            created_at,
+        )
+
+
+def _friendships(layout: DatasetLayout, now: datetime) -> Iterator[tuple]:
+    accepted_at = now.isoformat()
+    first = layout.first_client_id
+    for offset in range(1, layout.friends_per_client + 1):
+        for index in range(layout.clients - offset):
+            pending = (index + offset) % 7 == 0
+            yield (
+                first + index,
+                first + index + offset,
+                "PENDING" if pending else "ACCEPTED",
+                None if pending else accepted_at,
+            )
+
+
+def build_dataset(path: str, layout: DatasetLayout) -> None:
+    """Create a fresh database at ``path`` filled according to ``layout``."""
+    for suffix in ("", "-wal", "-shm"):
+        if os.path.exists(path + suffix):
+            os.remove(path + suffix)
+
+    app = build_application(db_path=path)
+    now = datetime.now(UTC)
+    try:
+        with app.db.transaction() as conn:
+            _insert(
+                conn,
+                "INSERT INTO users (name, email, hashed_password, role) "
+                f"VALUES (?, ?, '{_PASSWORD_HASH}', ?)",
+                _users(layout),
+            )
+            _insert(
+                conn,
+                "INSERT INTO events (name, created_at, end_date, location, "
+                "start_date, max_tickets, initial_max_tickets, organizer_id, "
+                "tickets_redeemed) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)",
+                _events(layout, now),
+            )
+            _insert(
+                conn,
+                "INSERT INTO tickets (event_id, client_id, code, status, created_at) "
+                "VALUES (?, ?, ?, ?, ?)",
+                _tickets(layout, now),
+            )
+            _insert(
+                conn,
+                "INSERT INTO friendships (requester_client_id, "
+                "requested_client_id, status, accepted_at) VALUES (?, ?, ?, ?)",
+                _friendships(layout, now),
+            )
+            _insert(
+                conn,
+                "INSERT INTO event_staff (event_id, user_id) VALUES (?, ?)",
+                (
+                    (layout.ongoing_event_id, layout.staff_id + i)
+                    for i in range(layout.staffs)
+                ),
+            )
+        with app.db.connect() as conn:
+            conn.execute("ANALYZE")
+    finally:
+        app.close()
+
+
+def copy_database(source: str, target: str) -> None:
+    """Copy a (possibly WAL-mode) database with SQLite's online backup."""
+    for suffix in ("", "-wal", "-shm"):
+        if os.path.exists(target + suffix):
+            os.remove(target + suffix)
+    with sqlite3.connect(source) as src, sqlite3.connect(target) as dst:
+        src.backup(dst)
+    src.close()
+    dst.close()
@@ -0,0 +1,190 @@
+"""
+Friendship pair lookups before and after the canonical-pair index (v006).
+
+Builds a database at schema version 5 with --friendships random pairs (a
+few stored in both directions, as the old schema allowed), measures the
+old two-query existence check, applies the v006 migration and measures the
+single canonical-pair probe, both as raw SQL on one connection and through
+SqliteFriendshipRepository.get_between (pooled connection, entity built).
+
+    PYTHONPATH=src python -m benchmarks.friendship_pairs --friendships 2000000
+"""
+
+from __future__ import annotations
+
+import argparse
+import os
+import random
+import sqlite3
+import sys
+import time
+
+from benchmarks.harness import BenchmarkCase, run_case
+from benchmarks.run import BENCHMARKS_DIR, print_results
+from shared.composition_root import build_application
+from shared.infra.persistence.migrations import MIGRATIONS
+from shared.infra.persistence.migrations.sqlite_migration_runner import (
+    SQLiteMigrationRunner,
+)
+
+_LEGACY_EXISTS = """
+SELECT 1
+FROM friendships
+WHERE (requester_client_id = ? AND requested_client_id = ?)
+   OR (requester_client_id = ? AND requested_client_id = ?)
+"""
+_LEGACY_PENDING = """
+SELECT 1
+FROM friendships
+WHERE ((requester_client_id = ? AND requested_client_id = ?)
+   OR (requester_client_id = ? AND requested_client_id = ?))
+  AND status = 'PENDING'
+"""
+_CANONICAL = """
+SELECT id, requester_client_id, requested_client_id, status, accepted_at
+FROM friendships
+WHERE client_low_id = ? AND client_high_id = ?
+"""
+
+
+def parse_args(argv: list[str] | None = None) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--friendships", type=int, default=2_000_000)
+    parser.add_argument("--avg-friends", type=int, default=20)
+    parser.add_argument(
+        "--mirrored", type=float, default=0.001, help="share stored twice"
+    )
+    parser.add_argument("--iterations", type=int, default=5_000)
+    parser.add_argument("--warmup", type=int, default=500)
+    parser.add_argument("--seed", type=int, default=42)
+    parser.add_argument(
+        "--data-dir", default=os.path.join(BENCHMARKS_DIR, ".data"), help="datasets"
+    )
+    return parser.parse_args(argv)
+
+
+def build_legacy_database(path: str, args: argparse.Namespace) -> list[tuple[int, int]]:
+    """A schema-v5 database; returns the stored pairs."""
+    for suffix in ("", "-wal", "-shm"):
+        if os.path.exists(path + suffix):
+            os.remove(path + suffix)
+
+    rng = random.Random(args.seed)
+    clients = max(2, 2 * args.friendships // args.avg_friends)
+    pairs: set[tuple[int, int]] = set()
+    while len(pairs) < args.friendships:
+        a, b = rng.randint(1, clients), rng.randint(1, clients)
+        if a != b and (b, a) not in pairs:
+            pairs.add((a, b))
+    stored = list(pairs)
+    stored += [(b, a) for a, b in rng.sample(stored, int(len(stored) * args.mirrored))]
+
+    conn = sqlite3.connect(path, isolation_level=None)
+    try:
+        SQLiteMigrationRunner(MIGRATIONS[:5]).migrate(conn)
+        conn.execute("BEGIN")
+        conn.executemany(
+            "INSERT INTO users (name, email, hashed_password, role) "
+            "VALUES (?, ?, '', 'CLIENT')",
+            ((f"Client {i}", f"client{i}@bench.local") for i in range(clients)),
+        )
+        conn.executemany(
+            "INSERT INTO friendships (requester_client_id, requested_client_id, "
+            "status, accepted_at) VALUES (?, ?, ?, NULL)",
+            ((a, b, "PENDING" if (a + b) % 5 == 0 else "ACCEPTED") for a, b in stored),
+        )
+        conn.execute("COMMIT")
+        conn.execute("ANALYZE")
+    finally:
+        conn.close()
+    return stored
+
+
+def probe_pairs(
+    stored: list[tuple[int, int]], count: int, seed: int
+) -> list[tuple[int, int]]:
+    """Half existing pairs (either direction), half random ones."""
+    rng = random.Random(seed + 1)
+    clients = max(max(pair) for pair in rng.sample(stored, min(len(stored), 1000)))
+    probes = []
+    for i in range(count):
+        if i % 2:
+            a, b = rng.choice(stored)
+            probes.append((b, a) if rng.random() < 0.5 else (a, b))
+        else:
+            probes.append((rng.randint(1, clients), rng.randint(1, clients)))
+    return probes
+
+
+def main(argv: list[str] | None = None) -> int:
+    args = parse_args(argv)
+    os.makedirs(args.data_dir, exist_ok=True)
+    path = os.path.join(args.data_dir, "friendship_pairs.db")
+    calls = args.warmup + args.iterations
+
+    print(f"Building {args.friendships:,} friendships at schema version 5...")
+    started_at = time.perf_counter()
+    stored = build_legacy_database(path, args)
+    print(f"  done in {time.perf_counter() - started_at:.1f} s")
+    probes = probe_pairs(stored, calls, args.seed)
+
+    results = {}
+    conn = sqlite3.connect(path)
+    try:
+
+        def legacy_check(i: int):
+            a, b = probes[i]
+            if conn.execute(_LEGACY_EXISTS, (a, b, b, a)).fetchone() is None:
+                return None
+            return conn.execute(_LEGACY_PENDING, (b, a, a, b)).fetchone()
+
+        result = run_case(
+            BenchmarkCase("legacy.exists_then_pending", legacy_check),
+            args.iterations,
+            args.warmup,
+        )
+        results[result.name] = result.to_dict()
+
+        started_at = time.perf_counter()
+        SQLiteMigrationRunner(MIGRATIONS).migrate(conn)
+        migration_seconds = time.perf_counter() - started_at
+        remaining = conn.execute("SELECT COUNT(*) FROM friendships").fetchone()[0]
+
+        def canonical_probe(i: int):
+            a, b = probes[i]
+            return conn.execute(_CANONICAL, (min(a, b), max(a, b))).fetchone()
+
+        result = run_case(
+            BenchmarkCase("canonical.probe", canonical_probe),
+            args.iterations,
+            args.warmup,
+        )
+        results[result.name] = result.to_dict()
+    finally:
+        conn.close()
+    print(
+        f"v006 migration: {migration_seconds:.1f} s, "
+        f"{len(stored) - remaining:,} mirrored rows merged, {remaining:,} left"
+    )
+
+    app = build_application(db_path=path)
+    try:
+        repo = app.friendship_repo
+        result = run_case(
+            BenchmarkCase(
+                "canonical.get_between",
+                lambda i: repo.get_between(*probes[i]),
+            ),
+            args.iterations,
+            args.warmup,
+        )
+        results[result.name] = result.to_dict()
+    finally:
+        app.close()
+
+    print_results(results)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
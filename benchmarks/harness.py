@@ -0,0 +1,113 @@
+from __future__ import annotations
+
+import math
+import time
+from collections.abc import Callable, Sequence
+from dataclasses import asdict, dataclass
+
+
+@dataclass(frozen=True)
+class BenchmarkCase:
+    """One measured operation.
+
+    ``operation`` and ``setup`` receive the iteration index, so a case can
+    hand out a distinct input (ticket code, client pair) per call. ``setup``
+    runs before each call and is not timed.
+    """
+
+    name: str
+    operation: Callable[[int], object]
+    setup: Callable[[int], object] | None = None
+
+
+@dataclass(frozen=True)
+class BenchmarkResult:
+    name: str
+    iterations: int
+    mean_ms: float
+    min_ms: float
+    p50_ms: float
+    p90_ms: float
+    p99_ms: float
+    max_ms: float
+    ops_per_sec: float
+
+    def to_dict(self) -> dict:
+        return asdict(self)
+
+
+@dataclass(frozen=True)
+class Regression:
+    name: str
+    metric: str
+    baseline_ms: float
+    current_ms: float
+
+    @property
+    def change(self) -> float:
+        return self.current_ms / self.baseline_ms - 1
+
+
+def percentile(sorted_samples: Sequence[float], q: float) -> float:
+    """Linear-interpolated percentile of already sorted samples (0 <= q <= 100)."""
+    if not sorted_samples:
+        return 0.0
+    rank = (len(sorted_samples) - 1) * q / 100
+    lower, upper = math.floor(rank), math.ceil(rank)
+    if lower == upper:
+        return sorted_samples[lower]
+    weight = rank - lower
+    return sorted_samples[lower] * (1 - weight) + sorted_samples[upper] * weight
+
+
+def run_case(case: BenchmarkCase, iterations: int, warmup: int) -> BenchmarkResult:
+    samples = []
+    for index in range(warmup + iterations):
+        if case.setup is not None:
+            case.setup(index)
+        started_at = time.perf_counter()
+        case.operation(index)
+        elapsed = time.perf_counter() - started_at
+        if index >= warmup:
+            samples.append(elapsed)
+
+    samples.sort()
+    total = sum(samples)
+    return BenchmarkResult(
+        name=case.name,
+        iterations=len(samples),
+        mean_ms=total / len(samples) * 1000,
+        min_ms=samples[0] * 1000,
+        p50_ms=percentile(samples, 50) * 1000,
+        p90_ms=percentile(samples, 90) * 1000,
+        p99_ms=percentile(samples, 99) * 1000,
+        max_ms=samples[-1] * 1000,
+        ops_per_sec=len(samples) / total if total else math.inf,
+    )
+
+
+def find_regressions(
+    baseline: dict[str, dict],
+    current: dict[str, dict],
+    threshold: float,
+    min_delta_ms: float = 0.05,
+    metrics: Sequence[str] = ("p50_ms", "p99_ms"),
+) -> list[Regression]:
+    """Cases whose ``metrics`` grew by more than ``threshold`` (0.2 = 20%).
+
+    Differences below ``min_delta_ms`` are ignored so sub-millisecond noise
+    on very fast cases does not fail the check. Cases missing from either
+    side are skipped.
+    """
+    regressions = []
+    for name, result in current.items():
+        previous = baseline.get(name)
+        if previous is None:
+            continue
+        for metric in metrics:
+            before, after = previous[metric], result[metric]
+            if after - before < min_delta_ms:
+                continue
+            if before > 0 and after > before * (1 + threshold):
+                regressions.append(Regression(name, metric, before, after))
+    return regressions
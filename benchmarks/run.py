@@ -0,0 +1,166 @@
+"""
+Headless benchmarks for the repositories and use cases.
+
+Builds (once per size) a database of --rows tickets with proportional users,
+events and friendships, copies it so every run starts from the same data,
+and measures latency percentiles and throughput of the list, validate,
+redeem and friendship-invite use cases through build_application.
+
+Results are written as JSON; with --baseline, any case whose p50 or p99
+grew by more than --threshold fails the run (exit code 1).
+
+    PYTHONPATH=src python -m benchmarks.run --rows 100000
+    PYTHONPATH=src python -m benchmarks.run --baseline benchmarks/results/abc123.json
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import os
+import platform
+import sqlite3
+import subprocess
+import sys
+import time
+from datetime import UTC, datetime
+
+from benchmarks.cases import build_cases
+from benchmarks.dataset import DatasetLayout, build_dataset, copy_database
+from benchmarks.harness import find_regressions, run_case
+from shared.composition_root import build_application
+
+BENCHMARKS_DIR = os.path.dirname(os.path.abspath(__file__))
+
+
+def parse_args(argv: list[str] | None = None) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--rows", type=int, default=10_000, help="tickets to generate")
+    parser.add_argument("--iterations", type=int, default=300)
+    parser.add_argument("--warmup", type=int, default=30)
+    parser.add_argument("--seed", type=int, default=42)
+    parser.add_argument(
+        "--only", default=None, help="run only cases whose name contains this"
+    )
+    parser.add_argument(
+        "--data-dir", default=os.path.join(BENCHMARKS_DIR, ".data"), help="datasets"
+    )
+    parser.add_argument("--rebuild", action="store_true", help="regenerate the dataset")
+    parser.add_argument("--output", default=None, help="results JSON path")
+    parser.add_argument("--baseline", default=None, help="results JSON to compare")
+    parser.add_argument(
+        "--threshold", type=float, default=0.2, help="allowed slowdown (0.2 = 20%%)"
+    )
+    parser.add_argument(
+        "--min-delta-ms", type=float, default=0.05, help="ignore smaller slowdowns"
+    )
+    return parser.parse_args(argv)
+
+
+def git_commit() -> str | None:
+    try:
+        return subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"],
+            capture_output=True,
+            text=True,
+            check=True,
+            cwd=BENCHMARKS_DIR,
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def prepare_database(args: argparse.Namespace, layout: DatasetLayout) -> str:
+    os.makedirs(args.data_dir, exist_ok=True)
+    pristine = os.path.join(args.data_dir, f"bench_{layout.rows}.db")
+    if args.rebuild or not os.path.exists(pristine):
+        print(f"Building dataset with {layout.rows:,} tickets...")
+        started_at = time.perf_counter()
+        build_dataset(pristine, layout)
+        print(f"  done in {time.perf_counter() - started_at:.1f} s")
+
+    work = os.path.join(args.data_dir, f"bench_{layout.rows}.work.db")
+    copy_database(pristine, work)
+    return work
+
+
+def print_results(results: dict[str, dict]) -> None:
+    print(f"\n{'case':<28}{'p50 ms':>10}{'p90 ms':>10}{'p99 ms':>10}{'ops/s':>12}")
+    for name, result in results.items():
+        print(
+            f"{name:<28}{result['p50_ms']:>10.3f}{result['p90_ms']:>10.3f}"
+            f"{result['p99_ms']:>10.3f}{result['ops_per_sec']:>12,.0f}"
+        )
+
+
+def main(argv: list[str] | None = None) -> int:
+    args = parse_args(argv)
+    layout = DatasetLayout(rows=args.rows)
+    db_path = prepare_database(args, layout)
+
+    app = build_application(db_path=db_path)
+    results: dict[str, dict] = {}
+    try:
+        cases = build_cases(app, layout, args.warmup + args.iterations, args.seed)
+        for case in cases:
+            if args.only and args.only not in case.name:
+                continue
+            result = run_case(case, args.iterations, args.warmup)
+            results[case.name] = result.to_dict()
+    finally:
+        app.close()
+
+    print_results(results)
+
+    commit = git_commit()
+    report = {
+        "meta": {
+            "commit": commit,
+            "created_at": datetime.now(UTC).isoformat(),
+            "python": platform.python_version(),
+            "sqlite": sqlite3.sqlite_version,
+            "platform": platform.platform(),
+            "rows": args.rows,
+            "iterations": args.iterations,
+            "warmup": args.warmup,
+            "seed": args.seed,
+        },
+        "results": results,
+    }
+    output = args.output or os.path.join(
+        BENCHMARKS_DIR, "results", f"{commit or 'local'}-{args.rows}.json"
+    )
+    os.makedirs(os.path.dirname(os.path.abspath(output)), exist_ok=True)
+    with open(output, "w", encoding="utf-8") as f:
+        json.dump(report, f, indent=2)
+    print(f"\nResults written to {output}")
+
+    if not args.baseline:
+        return 0
+
+    with open(args.baseline, encoding="utf-8") as f:
+        baseline = json.load(f)
+    if baseline["meta"].get("rows") != args.rows:
+        print(
+            f"Warning: baseline was measured with {baseline['meta'].get('rows')} "
+            f"rows, this run with {args.rows}"
+        )
+    regressions = find_regressions(
+        baseline["results"], results, args.threshold, args.min_delta_ms
+    )
+    if not regressions:
+        print(f"No regressions above {args.threshold:.0%} against {args.baseline}")
+        return 0
+
+    print(f"Regressions above {args.threshold:.0%} against {args.baseline}:")
+    for regression in regressions:
+        print(
+            f"  {regression.name} {regression.metric}: "
+            f"{regression.baseline_ms:.3f} -> {regression.current_ms:.3f} ms "
+            f"({regression.change:+.0%})"
+        )
+    return 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
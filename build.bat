@@ -33,7 +33,7 @@ echo   install     - Create venv, install fonts, and install production dependen
 echo   install-dev - Create venv, install fonts, and install all dependencies (prod + dev)
 echo   run         - Start the application
 echo   clean       - Remove caches and build artifacts
-echo   play ^<name^> - Run playground script (e.g., build.bat play friendship)
+echo   play ^<name^> - Run playground script (e.g., build.bat play generate_data)
 goto end
 
 :install_fonts
@@ -97,7 +97,7 @@ goto end
 :play
 if "%2"=="" (
     echo Usage: build.bat play ^<script_name^>
-    echo Example: build.bat play friendship
+    echo Example: build.bat play generate_data
     goto end
 )
 set script_file=src\scripts\play_%2.py
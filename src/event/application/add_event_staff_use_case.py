@@ -0,0 +1,48 @@
+from __future__ import annotations
+
+from dataclasses import dataclass
+
+from event.application.dtos import StaffDto
+from event.application.errors import EventNotFoundError, StaffNotFoundError
+from event.domain.errors import StaffAlreadyAddedError
+from event.infra.persistence.sqlite_event_repository import SqliteEventRepository
+from shared.application.page_cache import PageCache, PageCacheScope
+from user.domain.user_role import UserRole
+from user.infra.persistence.sqlite_users_repository import SqliteUsersRepository
+
+
+@dataclass(frozen=True)
+class AddEventStaffInputDto:
+    event_id: int
+    staff_email: str
+
+
+class AddEventStaffUseCase:
+    def __init__(
+        self,
+        events_repository: SqliteEventRepository,
+        users_repository: SqliteUsersRepository,
+        page_cache: PageCache | None = None,
+    ) -> None:
+        self._events_repository = events_repository
+        self._users_repository = users_repository
+        self._page_cache = page_cache
+
+    def execute(self, input_dto: AddEventStaffInputDto) -> StaffDto:
+        event = self._events_repository.get_by_id(input_dto.event_id)
+        if not event:
+            raise EventNotFoundError(input_dto.event_id)
+
+        staff = self._users_repository.get_by_email_and_role(
+            input_dto.staff_email, UserRole.STAFF
+        )
+        if not staff:
+            raise StaffNotFoundError(input_dto.staff_email)
+
+        if not self._events_repository.add_staff(event.id, staff.id):
+            raise StaffAlreadyAddedError(staff.id)
+
+        if self._page_cache is not None:
+            self._page_cache.invalidate(PageCacheScope.STAFFS)
+
+        return StaffDto(name=staff.name, email=staff.email, id=staff.id)
@@ -5,6 +5,7 @@ from datetime import UTC, datetime
 
 from event.domain.event import Event
 from event.infra.persistence.sqlite_event_repository import SqliteEventRepository
+from shared.application.page_cache import PageCache, PageCacheScope
 
 
 @dataclass(frozen=True)
@@ -18,8 +19,13 @@ class CreateEventInputDto:
 
 
 class CreateEventUseCase:
-    def __init__(self, events_repository: SqliteEventRepository) -> None:
+    def __init__(
+        self,
+        events_repository: SqliteEventRepository,
+        page_cache: PageCache | None = None,
+    ) -> None:
         self._events_repository = events_repository
+        self._page_cache = page_cache
 
     def create_event(self, input_dto: CreateEventInputDto) -> Event:
         event = Event.create(
@@ -33,4 +39,6 @@ class CreateEventUseCase:
         )
 
         created_event = self._events_repository.add(event)
+        if self._page_cache is not None:
+            self._page_cache.invalidate(PageCacheScope.EVENTS)
         return created_event
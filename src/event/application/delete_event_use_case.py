@@ -5,6 +5,7 @@ from dataclasses import dataclass
 from event.application.errors import EventNotFoundError
 from event.domain.event import Event
 from event.infra.persistence.sqlite_event_repository import SqliteEventRepository
+from shared.application.page_cache import PageCache, PageCacheScope
 from user.infra.persistence.sqlite_users_repository import SqliteUsersRepository
 
 
@@ -18,9 +19,11 @@ class DeleteEventUseCase:
         self,
         events_repository: SqliteEventRepository,
         users_repository: SqliteUsersRepository,
+        page_cache: PageCache | None = None,
     ) -> None:
         self._events_repository = events_repository
         self._users_repository = users_repository
+        self._page_cache = page_cache
 
     def execute(self, input_dto: DeleteEventInputDto) -> Event:
         event = self._events_repository.get_by_id(input_dto.event_id)
@@ -28,4 +31,6 @@ class DeleteEventUseCase:
             raise EventNotFoundError(input_dto.event_id)
 
         self._events_repository.delete(event.id)
+        if self._page_cache is not None:
+            self._page_cache.invalidate(PageCacheScope.EVENTS, PageCacheScope.STAFFS)
         return event
@@ -20,6 +20,8 @@ class EventDto:
 class PaginatedEventsDto:
     event_list: list[Event]
     total_event_count: int
+    next_cursor: str | None = None
+    previous_cursor: str | None = None
 
 
 @dataclass(frozen=True)
@@ -51,3 +51,9 @@ class TicketsLowerThanAcceptedError(AppError):
     def __init__(self) -> None:
         message = "The number of tickets needs to be greater than zero."
         super().__init__(message)
+
+
+class StaffNotFoundError(AppError):
+    def __init__(self, staff_email: str) -> None:
+        message = f'Staff with email "{staff_email}" does not exist.'
+        super().__init__(message)
@@ -1,9 +1,11 @@
 from __future__ import annotations
 
-from dataclasses import dataclass
+from dataclasses import dataclass, replace
 
 from event.application.dtos import PaginatedEventsDto
 from event.infra.persistence.sqlite_event_repository import SqliteEventRepository
+from shared.application.page_cache import PageCache, PageCacheScope
+from shared.application.pagination import CursorDirection, PageCursor
 
 
 @dataclass(frozen=True)
@@ -13,19 +15,50 @@ class ListEventInputDto:
     filter_mode: str | None = None
     organizer_id: int | None = None
     user_id: int | None = None
+    cursor: str | None = None
 
 
 class ListEventUseCase:
-    def __init__(self, events_repository: SqliteEventRepository) -> PaginatedEventsDto:
+    def __init__(
+        self,
+        events_repository: SqliteEventRepository,
+        page_cache: PageCache | None = None,
+    ) -> None:
         self._events_repository = events_repository
+        self._page_cache = page_cache
 
     def list_event(self, input_dto: ListEventInputDto) -> PaginatedEventsDto:
+        if self._page_cache is None:
+            return self._list_event(input_dto)
+        return self._page_cache.get_or_load(
+            PageCacheScope.EVENTS, input_dto, lambda: self._list_event(input_dto)
+        )
+
+    def _list_event(self, input_dto: ListEventInputDto) -> PaginatedEventsDto:
+        after_id, before_id = None, None
+        if input_dto.cursor:
+            cursor = PageCursor.decode(input_dto.cursor)
+            if cursor.direction == CursorDirection.AFTER:
+                after_id = cursor.id
+            else:
+                before_id = cursor.id
+
         paginated_events = self._events_repository.list(
             page=input_dto.page,
             page_size=input_dto.page_size,
             filter_mode=input_dto.filter_mode,
             organizer_id=input_dto.organizer_id,
             user_id=input_dto.user_id,
+            after_id=after_id,
+            before_id=before_id,
         )
 
-        return paginated_events
+        event_list = paginated_events.event_list
+        if not event_list:
+            return paginated_events
+
+        return replace(
+            paginated_events,
+            next_cursor=PageCursor.after(event_list[-1].id).encode(),
+            previous_cursor=PageCursor.before(event_list[0].id).encode(),
+        )
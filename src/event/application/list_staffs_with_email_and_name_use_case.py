@@ -3,6 +3,7 @@ from __future__ import annotations
 from dataclasses import dataclass
 
 from event.application.dtos import PaginatedStaffsDto
+from shared.application.page_cache import PageCache, PageCacheScope
 from user.infra.persistence.sqlite_users_repository import SqliteUsersRepository
 
 
@@ -16,10 +17,22 @@ class ListStaffsInputDto:
 
 
 class ListStaffWithEmailAndNameUseCase:
-    def __init__(self, user_repository: SqliteUsersRepository) -> None:
+    def __init__(
+        self,
+        user_repository: SqliteUsersRepository,
+        page_cache: PageCache | None = None,
+    ) -> None:
         self._user_repository = user_repository
+        self._page_cache = page_cache
 
     def execute(self, input_dto: ListStaffsInputDto) -> PaginatedStaffsDto:
+        if self._page_cache is None:
+            return self._list(input_dto)
+        return self._page_cache.get_or_load(
+            PageCacheScope.STAFFS, input_dto, lambda: self._list(input_dto)
+        )
+
+    def _list(self, input_dto: ListStaffsInputDto) -> PaginatedStaffsDto:
         paginated_staffs = self._user_repository.list_with_email_and_name(
             page=input_dto.page,
             size=input_dto.size,
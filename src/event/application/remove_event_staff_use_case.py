@@ -0,0 +1,30 @@
+from __future__ import annotations
+
+from dataclasses import dataclass
+
+from event.infra.persistence.sqlite_event_repository import SqliteEventRepository
+from shared.application.page_cache import PageCache, PageCacheScope
+
+
+@dataclass(frozen=True)
+class RemoveEventStaffInputDto:
+    event_id: int
+    staff_id: int
+
+
+class RemoveEventStaffUseCase:
+    def __init__(
+        self,
+        events_repository: SqliteEventRepository,
+        page_cache: PageCache | None = None,
+    ) -> None:
+        self._events_repository = events_repository
+        self._page_cache = page_cache
+
+    def execute(self, input_dto: RemoveEventStaffInputDto) -> bool:
+        removed = self._events_repository.remove_staff(
+            input_dto.event_id, input_dto.staff_id
+        )
+        if removed and self._page_cache is not None:
+            self._page_cache.invalidate(PageCacheScope.STAFFS)
+        return removed
@@ -11,6 +11,7 @@ from event.application.errors import (
 from event.domain.errors import InvalidOrganizerIdError
 from event.domain.event import Event
 from event.infra.persistence.sqlite_event_repository import SqliteEventRepository
+from shared.application.page_cache import PageCache, PageCacheScope
 from user.infra.persistence.sqlite_users_repository import SqliteUsersRepository
 
 
@@ -30,9 +31,11 @@ class UpdateEventUseCase:
         self,
         events_repository: SqliteEventRepository,
         users_repository: SqliteUsersRepository,
+        page_cache: PageCache | None = None,
     ) -> None:
         self._events_repository = events_repository
         self._users_repository = users_repository
+        self._page_cache = page_cache
 
     def execute(self, input_dto: UpdateEventInputDto) -> Event:
         event = self._events_repository.get_by_id(input_dto.event_id)
@@ -70,5 +73,7 @@ class UpdateEventUseCase:
         updated_event = replace(updated_event, id=event.id)
 
         self._events_repository.update(updated_event)
+        if self._page_cache is not None:
+            self._page_cache.invalidate(PageCacheScope.EVENTS)
 
         return updated_event
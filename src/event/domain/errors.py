@@ -66,14 +66,6 @@ class EventHasNoTicketsAvailableError(DomainError):
 
 
 class InvalidOrganizerIdError(DomainError):
-    def _init_(self, organizer_id) -> None:
+    def __init__(self, organizer_id) -> None:
         message = f'Invalid organizer_id: "{organizer_id}".'
-        super()._init_(message)
-
-
-# TODO: Remove unused error
-# @ArthurPRodrigues
-class InvalidStaffsIdError(DomainError):
-    def _init_(self, staffs_id) -> None:
-        message = f'Invalid staffs_id: "{staffs_id}".'
-        super()._init_(message)
+        super().__init__(message)
@@ -1,6 +1,6 @@
 from __future__ import annotations
 
-from dataclasses import dataclass, replace
+from dataclasses import dataclass
 from datetime import datetime
 
 from event.application.errors import (
@@ -15,7 +15,6 @@ from event.domain.errors import (
     InvalidNameError,
     InvalidOrganizerIdError,
     InvalidStartDateError,
-    StaffAlreadyAddedError,
 )
 
 
@@ -30,7 +29,6 @@ class Event:
     max_tickets: int
     initial_max_tickets: int = 0
     tickets_redeemed: int = 0
-    staffs_id: list[str] = None
     id: int | None = None
 
     @staticmethod
@@ -57,24 +55,6 @@ class Event:
                 organizer_id=organizer_id,
             )
 
-    def add_staff(self, staff_id: str) -> Event:
-        if self.staffs_id is None:
-            return replace(self, staffs_id=[staff_id])
-        if staff_id in self.staffs_id:
-            raise StaffAlreadyAddedError(staff_id)
-        return replace(self, staffs_id=[*self.staffs_id, staff_id])
-
-    def remove_staff(self, staff_id: str) -> Event:
-        if self.staffs_id is None or staff_id not in self.staffs_id:
-            return self
-        return replace(self, staffs_id=[s for s in self.staffs_id if s != staff_id])
-
-    def get_staffs(self) -> list[str]:
-        return self.staffs_id or []
-
-    def has_staff(self, staff_id: str) -> bool:
-        return self.staffs_id is not None and staff_id in self.staffs_id
-
     @staticmethod
     def all_validations(
         name,
@@ -6,11 +6,17 @@ from datetime import UTC, datetime
 from event.application.dtos import PaginatedEventsDto
 from event.domain.event import Event
 from shared.infra.persistence.sqlite import SQLiteDatabase
+from shared.infra.persistence.sqlite_pagination import CountStrategy, SQLitePaginator
 
 
 class SqliteEventRepository:
-    def __init__(self, db: SQLiteDatabase) -> None:
+    def __init__(
+        self,
+        db: SQLiteDatabase,
+        count_strategy: CountStrategy = CountStrategy.CACHED,
+    ) -> None:
         self._db = db
+        self._paginator = SQLitePaginator(db.count_cache, count_strategy)
 
     def list(
         self,
@@ -28,7 +34,15 @@ class SqliteEventRepository:
         id: int | None = None,
         filter_mode: str | None = None,
         user_id: int | None = None,
+        after_id: int | None = None,
+        before_id: int | None = None,
     ) -> PaginatedEventsDto | None:
+        """List events ordered by id.
+
+        ``after_id``/``before_id`` switch to keyset pagination (``id > ?`` or
+        ``id < ?``), which costs the same on every page; without them the
+        page is located with OFFSET, which is kept for jumping to a page.
+        """
         base_query = "FROM events"
         conditions = ["1=1"]
         params = []
@@ -56,23 +70,27 @@ class SqliteEventRepository:
             conditions.append("(max_tickets - tickets_redeemed) = 0")
 
         where_clause = " WHERE " + " AND ".join(conditions)
-
-        count_query = "SELECT COUNT(*) " + base_query + where_clause
         select_query = (
             "SELECT id, name, location, created_at, start_date, end_date, "
             "initial_max_tickets, max_tickets, tickets_redeemed, organizer_id "
             + base_query
             + where_clause
-            + " ORDER BY id ASC LIMIT ? OFFSET ?"
         )
 
-        count_params = params.copy()
-
-        params.extend([page_size, (page - 1) * page_size])
-
         with self._db.connect() as conn:
-            rows = conn.execute(select_query, params).fetchall()
-            total_event_count = conn.execute(count_query, count_params).fetchone()[0]
+            result_page = self._paginator.fetch_page(
+                conn,
+                select_query,
+                params,
+                tables=("events",),
+                order_by="id",
+                limit=page_size,
+                offset=(page - 1) * page_size,
+                after=after_id,
+                before=before_id,
+            )
+
+        rows, total_event_count = result_page.rows, result_page.total_count
 
         event_list: list[Event] = [
             Event(
@@ -115,6 +133,7 @@ class SqliteEventRepository:
                     ),
                 )
                 conn.commit()
+                self._db.count_cache.invalidate("events")
                 return replace(event, id=cursor.lastrowid)
 
             except Exception as e:
@@ -173,6 +192,7 @@ class SqliteEventRepository:
                 ),
             )
             conn.commit()
+        self._db.count_cache.invalidate("events")
 
     def delete(self, id: int) -> None:
         with self._db.connect() as conn:
@@ -184,3 +204,58 @@ class SqliteEventRepository:
                 (id,),
             )
             conn.commit()
+        # Tickets and staff go with the event through ON DELETE CASCADE.
+        self._db.count_cache.invalidate("events", "tickets", "event_staff")
+
+    def add_staff(self, event_id: int, user_id: int) -> bool:
+        """Associate a staff member with an event; False if already associated."""
+        with self._db.connect() as conn:
+            cursor = conn.execute(
+                "INSERT OR IGNORE INTO event_staff (event_id, user_id) VALUES (?, ?)",
+                (event_id, user_id),
+            )
+            conn.commit()
+        self._db.count_cache.invalidate("event_staff")
+        return cursor.rowcount > 0
+
+    def remove_staff(self, event_id: int, user_id: int) -> bool:
+        with self._db.connect() as conn:
+            cursor = conn.execute(
+                "DELETE FROM event_staff WHERE event_id = ? AND user_id = ?",
+                (event_id, user_id),
+            )
+            conn.commit()
+        self._db.count_cache.invalidate("event_staff")
+        return cursor.rowcount > 0
+
+    def list_staff_ids(self, event_id: int) -> list[int]:
+        with self._db.connect() as conn:
+            rows = conn.execute(
+                "SELECT user_id FROM event_staff WHERE event_id = ? ORDER BY user_id",
+                (event_id,),
+            ).fetchall()
+        return [row[0] for row in rows]
+
+    def list_event_ids_by_staff(self, user_id: int) -> list[int]:
+        with self._db.connect() as conn:
+            rows = conn.execute(
+                "SELECT event_id FROM event_staff WHERE user_id = ? ORDER BY event_id",
+                (user_id,),
+            ).fetchall()
+        return [row[0] for row in rows]
+
+    def list_event_ids_by_organizer(self, organizer_id: int) -> list[int]:
+        with self._db.connect() as conn:
+            rows = conn.execute(
+                "SELECT id FROM events WHERE organizer_id = ? ORDER BY id",
+                (organizer_id,),
+            ).fetchall()
+        return [row[0] for row in rows]
+
+    def is_staff(self, event_id: int, user_id: int) -> bool:
+        with self._db.connect() as conn:
+            row = conn.execute(
+                "SELECT 1 FROM event_staff WHERE event_id = ? AND user_id = ?",
+                (event_id, user_id),
+            ).fetchone()
+        return row is not None
@@ -5,6 +5,7 @@ from shared.ui.components.action_buttons_component import ActionButtonsComponent
 from shared.ui.components.header_component import HeaderComponent
 from shared.ui.components.table_component import TableComponent
 from shared.ui.styles import BUTTON_SIZES, COLORS, WINDOW_SIZES
+from ticket.application.dtos import CountFriendsAttendingInputDto
 from ticket.ui.redeem_ticket_gui import RedeemTicketGUI
 
 
@@ -61,12 +62,17 @@ class ListEventClientGui(BaseGUI):
                 "END DATE",
                 "STATUS",
                 "TICKETS",
+                "FRIENDS GOING",
             ],
             data_callback=self._load_events_callback,
             key="-TABLE-",
             items_per_page=8,
             has_hidden_id_column=True,
+            cursor_pagination=True,
             filters=event_filters,
+            error_callback=lambda e: self.show_error_popup(
+                f"Error loading events: {e}"
+            ),
         )
 
         self.action_buttons = ActionButtonsComponent([
@@ -118,8 +124,8 @@ class ListEventClientGui(BaseGUI):
         selected = self.table.get_selected_row_data(self.window)
 
         event_id = selected[0]
-        max_tickets = selected[7]
-        tickets_redeemed = selected[8]
+        max_tickets = selected[8]
+        tickets_redeemed = selected[9]
 
         self.navigator.push_screen(
             RedeemTicketGUI,
@@ -137,30 +143,43 @@ class ListEventClientGui(BaseGUI):
         ]
         return layout
 
-    def _load_events_callback(self, page: int, items_per_page: int, filter_mode: str):
-        try:
-            input_dto = ListEventInputDto(
-                page=page,
-                page_size=items_per_page,
-                filter_mode=filter_mode,
-                user_id=self.auth_context.id,
-            )
-            paginated_events = self.use_cases.list_event_use_case.list_event(input_dto)
-
-            event_list, total_event_count = (
-                paginated_events.event_list,
-                paginated_events.total_event_count,
-            )
+    def _load_events_callback(
+        self,
+        page: int,
+        items_per_page: int,
+        filter_mode: str,
+        cursor: str | None = None,
+    ):
+        input_dto = ListEventInputDto(
+            page=page,
+            page_size=items_per_page,
+            filter_mode=filter_mode,
+            user_id=self.auth_context.id,
+            cursor=cursor,
+        )
+        paginated_events = self.use_cases.list_event_use_case.list_event(input_dto)
 
-            table_data = self._convert_events_to_table_data(event_list)
+        event_list, total_event_count = (
+            paginated_events.event_list,
+            paginated_events.total_event_count,
+        )
 
-            return {"data": table_data, "total": total_event_count}
+        friends_going = self.use_cases.count_friends_attending_use_case.execute(
+            CountFriendsAttendingInputDto(
+                client_id=self.auth_context.id,
+                event_ids=tuple(event.id for event in event_list),
+            )
+        )
+        table_data = self._convert_events_to_table_data(event_list, friends_going)
 
-        except Exception as e:
-            self.show_error_popup(f"Error loading events: {e}")
-            return {"data": [], "total": 0}
+        return {
+            "data": table_data,
+            "total": total_event_count,
+            "next_cursor": paginated_events.next_cursor,
+            "previous_cursor": paginated_events.previous_cursor,
+        }
 
-    def _convert_events_to_table_data(self, events):
+    def _convert_events_to_table_data(self, events, friends_going):
         table_data = []
         for event in events:
             table_data.append([
@@ -173,6 +192,7 @@ class ListEventClientGui(BaseGUI):
                     event.initial_max_tickets, event.max_tickets, event.tickets_redeemed
                 ),
                 self._tickets_available(event.max_tickets, event.tickets_redeemed),
+                friends_going.get(event.id, 0),
                 event.max_tickets,
                 event.tickets_redeemed,
             ])
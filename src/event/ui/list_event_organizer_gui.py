@@ -57,6 +57,10 @@ class ListEventOrganizerGui(BaseGUI):
             key="-TABLE-",
             items_per_page=10,
             has_hidden_id_column=True,
+            cursor_pagination=True,
+            error_callback=lambda e: self.show_error_popup(
+                f"Error loading events: {e}"
+            ),
         )
         self.action_buttons = ActionButtonsComponent([
             {
@@ -96,8 +100,7 @@ class ListEventOrganizerGui(BaseGUI):
             elif values.get("-ORG_F_SOLD-"):
                 self.current_filter_mode = "SOLD_OUT"
             if self.window:
-                self.table.current_page = 1
-                self.table.refresh(self.window)
+                self.table.go_to_page(1, self.window)
             return
 
         if self.table.handle_event(event, self.window):
@@ -173,27 +176,31 @@ class ListEventOrganizerGui(BaseGUI):
         ]
         return layout
 
-    def _load_events_callback(self, page: int, items_per_page: int):
-        try:
-            input_dto = ListEventInputDto(
-                page=page,
-                page_size=items_per_page,
-                organizer_id=self.auth_context.id,
-                filter_mode=self.current_filter_mode,
-            )
+    def _load_events_callback(
+        self, page: int, items_per_page: int, cursor: str | None = None
+    ):
+        input_dto = ListEventInputDto(
+            page=page,
+            page_size=items_per_page,
+            organizer_id=self.auth_context.id,
+            filter_mode=self.current_filter_mode,
+            cursor=cursor,
+        )
 
-            paginated_events = self.use_cases.list_event_use_case.list_event(input_dto)
+        paginated_events = self.use_cases.list_event_use_case.list_event(input_dto)
 
-            event_list, total_event_count = (
-                paginated_events.event_list,
-                paginated_events.total_event_count,
-            )
+        event_list, total_event_count = (
+            paginated_events.event_list,
+            paginated_events.total_event_count,
+        )
 
-            table_data = self._convert_events_to_table_data(event_list)
-            return {"data": table_data, "total": total_event_count}
-        except Exception as e:
-            self.show_error_popup(f"Error loading events: {e}")
-            return {"data": [], "total": 0}
+        table_data = self._convert_events_to_table_data(event_list)
+        return {
+            "data": table_data,
+            "total": total_event_count,
+            "next_cursor": paginated_events.next_cursor,
+            "previous_cursor": paginated_events.previous_cursor,
+        }
 
     def _convert_events_to_table_data(self, events):
         table_data = []
@@ -1,6 +1,8 @@
+from event.application.add_event_staff_use_case import AddEventStaffInputDto
 from event.application.list_staffs_with_email_and_name_use_case import (
     ListStaffsInputDto,
 )
+from event.application.remove_event_staff_use_case import RemoveEventStaffInputDto
 from shared.ui.base_gui import BaseGUI
 from shared.ui.components.action_buttons_component import ActionButtonsComponent
 from shared.ui.components.header_component import HeaderComponent
@@ -29,6 +31,7 @@ class StaffManagerGUI(BaseGUI):
             key="-STAFF_TABLE-",
             items_per_page=10,
             has_hidden_id_column=True,
+            error_callback=lambda e: self.show_error_popup(f"Error loading staff: {e}"),
         )
 
         self.action_buttons = ActionButtonsComponent([
@@ -52,15 +55,57 @@ class StaffManagerGUI(BaseGUI):
         }
 
     def handle_events(self, event, values):
+        if self.table.handle_event(event, self.window):
+            return
+
         handler = self.event_map.get(event)
         if handler:
             handler(values)
 
     def _handle_add_staff(self, values):
-        self.show_warning_popup("Method not implemented")
+        confirmed, staff_email = self.show_input_dialog(
+            dialog_title="Add staff",
+            instruction_label="Enter Staff Email",
+            input_tooltip="Enter the email address of the staff member (e.g., staff@example.com)",
+            confirm_button="Add Staff",
+            cancel_button="Cancel",
+        )
+
+        if confirmed:
+            if not staff_email or not staff_email.strip():
+                self.show_warning_popup("Please enter a valid email address!")
+                return
+
+            try:
+                input_dto = AddEventStaffInputDto(
+                    event_id=self.event_id, staff_email=staff_email.strip()
+                )
+                staff = self.use_cases.add_event_staff_use_case.execute(input_dto)
+                self.show_success_popup(f"{staff.name} added to the event staff!")
+                self.table.refresh(self.window)
+            except Exception as e:
+                self.show_error_popup(f"Error adding staff: {e!s}")
 
     def _handle_remove_staff(self, values):
-        self.show_warning_popup("Method not implemented")
+        selected_data = self.table.get_selected_row_data(self.window)
+        if selected_data:
+            staff_id = selected_data[0]
+            staff_name = selected_data[1]
+
+            if self.show_confirmation_popup(
+                f"Are you sure you want to disassociate {staff_name} from this event?"
+            ):
+                try:
+                    input_dto = RemoveEventStaffInputDto(
+                        event_id=self.event_id, staff_id=staff_id
+                    )
+                    self.use_cases.remove_event_staff_use_case.execute(input_dto)
+                    self.show_success_popup(f"{staff_name} disassociated successfully!")
+                    self.table.refresh(self.window)
+                except Exception as e:
+                    self.show_error_popup(f"Error disassociating staff: {e!s}")
+        else:
+            self.show_warning_popup("No row selected!")
 
     def create_layout(self):
         layout = [
@@ -71,21 +116,17 @@ class StaffManagerGUI(BaseGUI):
         return layout
 
     def _load_staffs_callback(self, page: int, items_per_page: int):
-        try:
-            input_dto = ListStaffsInputDto(
-                page=page, size=items_per_page, event_id=self.event_id
-            )
+        input_dto = ListStaffsInputDto(
+            page=page, size=items_per_page, event_id=self.event_id
+        )
 
-            staffs = self.use_cases.list_staffs_use_case.execute(input_dto)
+        staffs = self.use_cases.list_staffs_use_case.execute(input_dto)
 
-            if not staffs:
-                return {"data": [], "total": 0}
+        if not staffs:
+            return {"data": [], "total": 0}
 
-            table_data = [
-                [staff.id, staff.name, staff.email] for staff in staffs.staff_list
-            ]
+        table_data = [
+            [staff.id, staff.name, staff.email] for staff in staffs.staff_list
+        ]
 
-            return {"data": table_data, "total": staffs.total_staffs_count}
-        except Exception as e:
-            self.show_error_popup(f"Error loading staff: {e}")
-            return {"data": [], "total": 0}
+        return {"data": table_data, "total": staffs.total_staffs_count}
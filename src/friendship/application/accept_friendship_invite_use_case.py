@@ -2,11 +2,15 @@ from __future__ import annotations
 
 from dataclasses import dataclass
 
-from friendship.application.errors import FriendshipNotFoundError
+from friendship.application.dtos import FriendshipAcceptResultDto
+from friendship.application.errors import AppError, FriendshipNotFoundError
+from friendship.application.friendship_graph import FriendshipGraph
+from friendship.domain.errors import DomainError, FriendshipAlreadyAcceptedError
 from friendship.domain.friendship import Friendship
 from friendship.infra.persistence.sqlite_friendship_repository import (
     SqliteFriendshipRepository,
 )
+from shared.application.page_cache import PageCache, PageCacheScope
 
 
 @dataclass(frozen=True)
@@ -14,9 +18,21 @@ class AcceptFriendshipInviteInputDto:
     friendship_id: int
 
 
+@dataclass(frozen=True)
+class AcceptFriendshipInvitesInputDto:
+    friendship_ids: list[int]
+
+
 class AcceptFriendshipInviteUseCase:
-    def __init__(self, friendship_repository: SqliteFriendshipRepository) -> None:
+    def __init__(
+        self,
+        friendship_repository: SqliteFriendshipRepository,
+        page_cache: PageCache | None = None,
+        friendship_graph: FriendshipGraph | None = None,
+    ) -> None:
         self._friendship_repository = friendship_repository
+        self._page_cache = page_cache
+        self._friendship_graph = friendship_graph
 
     def execute(self, input_dto: AcceptFriendshipInviteInputDto) -> Friendship:
         friendship = self._friendship_repository.get_by_id(input_dto.friendship_id)
@@ -25,4 +41,71 @@ class AcceptFriendshipInviteUseCase:
 
         accepted_friendship = friendship.accept()
         self._friendship_repository.edit(accepted_friendship)
+        self._after_accept([accepted_friendship])
         return accepted_friendship
+
+    def execute_many(
+        self, input_dto: AcceptFriendshipInvitesInputDto
+    ) -> list[FriendshipAcceptResultDto]:
+        """Accept a batch of invites, returning one result per id.
+
+        The invites are read with one query and every status change is
+        written in a single transaction. A failing id does not stop the
+        others; its result carries the error ``execute`` would have raised.
+        An id repeated in the batch, or accepted elsewhere meanwhile, is
+        reported as already accepted.
+        """
+        friendships = self._friendship_repository.get_many_by_ids(
+            input_dto.friendship_ids
+        )
+        checked = {
+            friendship_id: self._accept(friendship_id, friendships.get(friendship_id))
+            for friendship_id in dict.fromkeys(input_dto.friendship_ids)
+        }
+        accepted_ids = self._friendship_repository.accept_many([
+            result.friendship for result in checked.values() if result.accepted
+        ])
+
+        results: list[FriendshipAcceptResultDto] = []
+        seen: set[int] = set()
+        for friendship_id in input_dto.friendship_ids:
+            result = checked[friendship_id]
+            if result.accepted and (
+                friendship_id in seen or friendship_id not in accepted_ids
+            ):
+                result = FriendshipAcceptResultDto(
+                    friendship_id,
+                    error=FriendshipAlreadyAcceptedError(friendship_id),
+                )
+            seen.add(friendship_id)
+            results.append(result)
+
+        self._after_accept([
+            checked[friendship_id].friendship for friendship_id in accepted_ids
+        ])
+        return results
+
+    def _accept(
+        self, friendship_id: int, friendship: Friendship | None
+    ) -> FriendshipAcceptResultDto:
+        try:
+            if friendship is None:
+                raise FriendshipNotFoundError(friendship_id)
+            return FriendshipAcceptResultDto(
+                friendship_id, friendship=friendship.accept()
+            )
+        except (AppError, DomainError) as e:
+            return FriendshipAcceptResultDto(friendship_id, error=e)
+
+    def _after_accept(self, accepted: list[Friendship]) -> None:
+        if not accepted:
+            return
+        if self._page_cache is not None:
+            self._page_cache.invalidate(
+                PageCacheScope.FRIENDSHIPS, PageCacheScope.FRIENDS_ATTENDING
+            )
+        if self._friendship_graph is not None:
+            for friendship in accepted:
+                self._friendship_graph.add_friendship(
+                    friendship.requester_client_id, friendship.requested_client_id
+                )
@@ -3,10 +3,12 @@ from __future__ import annotations
 from dataclasses import dataclass
 
 from friendship.application.errors import FriendshipNotFoundError
+from friendship.application.friendship_graph import FriendshipGraph
 from friendship.domain.friendship import Friendship
 from friendship.infra.persistence.sqlite_friendship_repository import (
     SqliteFriendshipRepository,
 )
+from shared.application.page_cache import PageCache, PageCacheScope
 
 
 @dataclass(frozen=True)
@@ -15,8 +17,15 @@ class DeleteFriendshipInputDto:
 
 
 class DeleteFriendshipUseCase:
-    def __init__(self, friendship_repository: SqliteFriendshipRepository) -> None:
+    def __init__(
+        self,
+        friendship_repository: SqliteFriendshipRepository,
+        page_cache: PageCache | None = None,
+        friendship_graph: FriendshipGraph | None = None,
+    ) -> None:
         self._friendship_repository = friendship_repository
+        self._page_cache = page_cache
+        self._friendship_graph = friendship_graph
 
     def execute(self, input_dto: DeleteFriendshipInputDto) -> Friendship:
         friendship = self._friendship_repository.get_by_id(input_dto.friendship_id)
@@ -24,4 +33,12 @@ class DeleteFriendshipUseCase:
             raise FriendshipNotFoundError(input_dto.friendship_id)
 
         self._friendship_repository.delete(friendship.id)
+        if self._page_cache is not None:
+            self._page_cache.invalidate(
+                PageCacheScope.FRIENDSHIPS, PageCacheScope.FRIENDS_ATTENDING
+            )
+        if self._friendship_graph is not None:
+            self._friendship_graph.remove_friendship(
+                friendship.requester_client_id, friendship.requested_client_id
+            )
         return friendship
@@ -1,6 +1,7 @@
 from dataclasses import dataclass
 from datetime import datetime
 
+from friendship.domain.friendship import Friendship
 from friendship.domain.friendship_status import FriendshipStatus
 
 
@@ -21,3 +22,25 @@ class FriendshipSummary:
 class PaginatedFriendshipsDto:
     friendship_summaries: list[FriendshipSummary]
     total_friendships_count: int
+
+
+@dataclass(frozen=True)
+class FriendshipInviteResultDto:
+    requested_client_email: str
+    friendship: Friendship | None = None
+    error: Exception | None = None
+
+    @property
+    def sent(self) -> bool:
+        return self.error is None
+
+
+@dataclass(frozen=True)
+class FriendshipAcceptResultDto:
+    friendship_id: int
+    friendship: Friendship | None = None
+    error: Exception | None = None
+
+    @property
+    def accepted(self) -> bool:
+        return self.error is None
@@ -0,0 +1,199 @@
+from __future__ import annotations
+
+import heapq
+import sys
+import threading
+import time
+from array import array
+from bisect import bisect_left, insort
+from collections import Counter, defaultdict
+from dataclasses import dataclass
+
+from friendship.infra.persistence.sqlite_friendship_repository import (
+    SqliteFriendshipRepository,
+)
+
+# Unsigned 32-bit ids: 4 bytes per adjacency entry.
+_ID_TYPECODE = "I"
+# Past this size ratio, probing the larger list beats a set intersection.
+_BISECT_RATIO = 16
+# Friend-of-friend entries counted per suggestion query; keeps clients whose
+# friends are hubs from scanning millions of entries.
+_SUGGESTION_SCAN_BUDGET = 100_000
+
+
+def _by_count(item: tuple[int, int]) -> tuple[int, int]:
+    return item[1], -item[0]
+
+
+@dataclass(frozen=True)
+class FriendSuggestion:
+    client_id: int
+    mutual_friend_count: int
+
+
+@dataclass(frozen=True)
+class FriendshipGraphInfo:
+    loaded: bool
+    clients: int
+    friendships: int
+    max_degree: int
+    adjacency_bytes: int
+    total_bytes: int
+    load_seconds: float
+
+
+class FriendshipGraph:
+    """Accepted friendships held in memory as a sorted id array per client.
+
+    Loaded from ``friendships`` on the first query, then kept current by
+    the accept and delete use cases, which call ``add_friendship`` and
+    ``remove_friendship`` after their write commits. Both are idempotent,
+    so an update racing the initial load is applied correctly either way.
+    Changes made by another process are only picked up after
+    ``invalidate``.
+    """
+
+    def __init__(self, friendship_repository: SqliteFriendshipRepository) -> None:
+        self._friendship_repository = friendship_repository
+        self._lock = threading.RLock()
+        self._adjacency: dict[int, array] | None = None
+        self._load_seconds = 0.0
+
+    def _ensure_loaded(self) -> dict[int, array]:
+        with self._lock:
+            if self._adjacency is None:
+                started_at = time.perf_counter()
+                friends: defaultdict[int, list[int]] = defaultdict(list)
+                for a, b in self._friendship_repository.iter_accepted_pairs():
+                    friends[a].append(b)
+                    friends[b].append(a)
+                self._adjacency = {
+                    client_id: array(_ID_TYPECODE, sorted(ids))
+                    for client_id, ids in friends.items()
+                }
+                self._load_seconds = time.perf_counter() - started_at
+            return self._adjacency
+
+    def invalidate(self) -> None:
+        """Drop the graph; the next query reloads it from the database."""
+        with self._lock:
+            self._adjacency = None
+
+    def add_friendship(self, client_a_id: int, client_b_id: int) -> None:
+        with self._lock:
+            if self._adjacency is None:
+                return
+            for client_id, friend_id in (
+                (client_a_id, client_b_id),
+                (client_b_id, client_a_id),
+            ):
+                friends = self._adjacency.setdefault(client_id, array(_ID_TYPECODE))
+                index = bisect_left(friends, friend_id)
+                if index == len(friends) or friends[index] != friend_id:
+                    insort(friends, friend_id)
+
+    def remove_friendship(self, client_a_id: int, client_b_id: int) -> None:
+        with self._lock:
+            if self._adjacency is None:
+                return
+            for client_id, friend_id in (
+                (client_a_id, client_b_id),
+                (client_b_id, client_a_id),
+            ):
+                friends = self._adjacency.get(client_id)
+                if friends is None:
+                    continue
+                index = bisect_left(friends, friend_id)
+                if index < len(friends) and friends[index] == friend_id:
+                    del friends[index]
+                if not friends:
+                    del self._adjacency[client_id]
+
+    def _friends(self, client_id: int) -> array:
+        return self._ensure_loaded().get(client_id, array(_ID_TYPECODE))
+
+    def friends(self, client_id: int) -> list[int]:
+        with self._lock:
+            return self._friends(client_id).tolist()
+
+    def are_friends(self, client_a_id: int, client_b_id: int) -> bool:
+        with self._lock:
+            friends = self._friends(client_a_id)
+            index = bisect_left(friends, client_b_id)
+            return index < len(friends) and friends[index] == client_b_id
+
+    def mutual_friends(self, client_a_id: int, client_b_id: int) -> list[int]:
+        with self._lock:
+            smaller, larger = sorted(
+                (self._friends(client_a_id), self._friends(client_b_id)), key=len
+            )
+            if len(larger) > _BISECT_RATIO * len(smaller):
+                mutual = []
+                for friend_id in smaller:
+                    index = bisect_left(larger, friend_id)
+                    if index < len(larger) and larger[index] == friend_id:
+                        mutual.append(friend_id)
+                return mutual
+            return sorted(set(smaller).intersection(larger))
+
+    def mutual_friend_count(self, client_a_id: int, client_b_id: int) -> int:
+        return len(self.mutual_friends(client_a_id, client_b_id))
+
+    def suggest_friends(
+        self, client_id: int, limit: int = 10
+    ) -> list[FriendSuggestion]:
+        """Friends of friends ranked by mutual friends, then by lowest id.
+
+        Friends are visited from the fewest friends up until
+        ``_SUGGESTION_SCAN_BUDGET`` entries have been counted, so for a
+        client whose friends are hubs the ranking is approximate; the
+        counts returned are always exact.
+        """
+        with self._lock:
+            adjacency = self._ensure_loaded()
+            friends = adjacency.get(client_id, array(_ID_TYPECODE))
+            counts: Counter[int] = Counter()
+            scanned = 0
+            for friend_id in sorted(friends, key=lambda f: len(adjacency[f])):
+                if scanned >= _SUGGESTION_SCAN_BUDGET:
+                    break
+                counts.update(adjacency[friend_id])
+                scanned += len(adjacency[friend_id])
+            counts.pop(client_id, None)
+            for friend_id in friends:
+                counts.pop(friend_id, None)
+
+            if scanned >= _SUGGESTION_SCAN_BUDGET:
+                shortlist = heapq.nlargest(4 * limit, counts.items(), key=_by_count)
+                counts = Counter({
+                    candidate: self.mutual_friend_count(client_id, candidate)
+                    for candidate, _ in shortlist
+                })
+        best = heapq.nsmallest(
+            limit, counts.items(), key=lambda item: (-item[1], item[0])
+        )
+        return [FriendSuggestion(candidate, count) for candidate, count in best]
+
+    def info(self) -> FriendshipGraphInfo:
+        with self._lock:
+            if self._adjacency is None:
+                return FriendshipGraphInfo(False, 0, 0, 0, 0, 0, 0.0)
+            adjacency = self._adjacency
+            degrees = [len(friends) for friends in adjacency.values()]
+            adjacency_bytes = sum(
+                friends.itemsize * len(friends) for friends in adjacency.values()
+            )
+            total_bytes = sys.getsizeof(adjacency) + sum(
+                sys.getsizeof(client_id) + sys.getsizeof(friends)
+                for client_id, friends in adjacency.items()
+            )
+            return FriendshipGraphInfo(
+                loaded=True,
+                clients=len(adjacency),
+                friendships=sum(degrees) // 2,
+                max_degree=max(degrees, default=0),
+                adjacency_bytes=adjacency_bytes,
+                total_bytes=total_bytes,
+                load_seconds=self._load_seconds,
+            )
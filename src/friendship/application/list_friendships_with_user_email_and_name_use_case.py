@@ -10,6 +10,7 @@ from friendship.domain.friendship_status import FriendshipStatus
 from friendship.infra.persistence.sqlite_friendship_repository import (
     SqliteFriendshipRepository,
 )
+from shared.application.page_cache import PageCache, PageCacheScope
 
 
 @dataclass(frozen=True)
@@ -26,10 +27,22 @@ class ListFriendshipsInputDto:
 
 
 class ListFriendshipsWithUserEmailAndNameUseCase:
-    def __init__(self, friendship_repository: SqliteFriendshipRepository) -> None:
+    def __init__(
+        self,
+        friendship_repository: SqliteFriendshipRepository,
+        page_cache: PageCache | None = None,
+    ) -> None:
         self._friendship_repository = friendship_repository
+        self._page_cache = page_cache
 
     def execute(self, input_dto: ListFriendshipsInputDto) -> PaginatedFriendshipsDto:
+        if self._page_cache is None:
+            return self._list(input_dto)
+        return self._page_cache.get_or_load(
+            PageCacheScope.FRIENDSHIPS, input_dto, lambda: self._list(input_dto)
+        )
+
+    def _list(self, input_dto: ListFriendshipsInputDto) -> PaginatedFriendshipsDto:
         paginated_friendships = (
             self._friendship_repository.list_with_user_email_and_name(
                 page=input_dto.page,
@@ -2,16 +2,21 @@ from __future__ import annotations
 
 from dataclasses import dataclass
 
+from friendship.application.dtos import FriendshipInviteResultDto
 from friendship.application.errors import (
+    AppError,
     FriendshipAlreadyExistsError,
     FriendshipPendingError,
     RequestedNotFoundError,
     RequesterNotFoundError,
 )
+from friendship.domain.errors import DomainError
 from friendship.domain.friendship import Friendship
+from friendship.domain.friendship_status import FriendshipStatus
 from friendship.infra.persistence.sqlite_friendship_repository import (
     SqliteFriendshipRepository,
 )
+from shared.application.page_cache import PageCache, PageCacheScope
 from user.domain.user_role import UserRole
 from user.infra.persistence.sqlite_users_repository import SqliteUsersRepository
 
@@ -22,14 +27,22 @@ class SendFriendshipInviteInputDto:
     requested_client_email: str
 
 
+@dataclass(frozen=True)
+class SendFriendshipInvitesInputDto:
+    requester_client_email: str
+    requested_client_emails: list[str]
+
+
 class SendFriendshipInviteUseCase:
     def __init__(
         self,
         friendship_repository: SqliteFriendshipRepository,
         user_repository: SqliteUsersRepository,
+        page_cache: PageCache | None = None,
     ) -> None:
         self._friendship_repository = friendship_repository
         self._user_repository = user_repository
+        self._page_cache = page_cache
 
     def execute(self, input_dto: SendFriendshipInviteInputDto) -> Friendship:
         requester_email, requested_email = (
@@ -49,14 +62,68 @@ class SendFriendshipInviteUseCase:
         if not requested:
             raise RequestedNotFoundError(requested_email)
 
-        if self._friendship_repository.friendship_exists(requester.id, requested.id):
-            if self._friendship_repository.is_friendship_pending(
-                requested.id, requester.id
-            ):
-                raise FriendshipPendingError(requester_email, requested_email)
+        friendship, created = self._friendship_repository.add_if_absent(
+            Friendship.create(requester.id, requested.id)
+        )
+        if not created:
+            raise self._existing_error(friendship, requester_email, requested_email)
+
+        if self._page_cache is not None:
+            self._page_cache.invalidate(PageCacheScope.FRIENDSHIPS)
+        return friendship
+
+    def execute_many(
+        self, input_dto: SendFriendshipInvitesInputDto
+    ) -> list[FriendshipInviteResultDto]:
+        """Invite every email in the list, returning one result per email.
+
+        The requester and all invited clients are resolved in one query, and
+        every pair is probed and inserted in a single transaction. A failing
+        email does not stop the others; its result carries the error
+        ``execute`` would have raised. Only an unknown requester raises.
+        """
+        requester_email = input_dto.requester_client_email
+        requested_emails = input_dto.requested_client_emails
+        users = self._user_repository.get_many_by_emails_and_role(
+            [requester_email, *requested_emails], UserRole.CLIENT
+        )
+        requester = users.get(requester_email)
+        if requester is None:
+            raise RequesterNotFoundError(requester_email)
+
+        results: dict[int, FriendshipInviteResultDto] = {}
+        invites: list[tuple[int, Friendship]] = []
+        for index, email in enumerate(requested_emails):
+            try:
+                requested = users.get(email)
+                if requested is None:
+                    raise RequestedNotFoundError(email)
+                invites.append((index, Friendship.create(requester.id, requested.id)))
+            except (AppError, DomainError) as e:
+                results[index] = FriendshipInviteResultDto(email, error=e)
+
+        added = self._friendship_repository.add_many_if_absent([
+            friendship for _, friendship in invites
+        ])
+        for (index, _), (friendship, created) in zip(invites, added, strict=True):
+            email = requested_emails[index]
+            results[index] = (
+                FriendshipInviteResultDto(email, friendship=friendship)
+                if created
+                else FriendshipInviteResultDto(
+                    email,
+                    error=self._existing_error(friendship, requester_email, email),
+                )
+            )
 
-            raise FriendshipAlreadyExistsError(requester_email, requested_email)
+        if self._page_cache is not None and any(r.sent for r in results.values()):
+            self._page_cache.invalidate(PageCacheScope.FRIENDSHIPS)
+        return [results[index] for index in range(len(requested_emails))]
 
-        friendship = Friendship.create(requester.id, requested.id)
-        added_friendship = self._friendship_repository.add(friendship)
-        return added_friendship
+    @staticmethod
+    def _existing_error(
+        friendship: Friendship, requester_email: str, requested_email: str
+    ) -> AppError:
+        if friendship.status == FriendshipStatus.PENDING:
+            return FriendshipPendingError(requester_email, requested_email)
+        return FriendshipAlreadyExistsError(requester_email, requested_email)
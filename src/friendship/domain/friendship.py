@@ -35,7 +35,7 @@ class Friendship:
 
     def accept(self) -> Friendship:
         if self.status == FriendshipStatus.ACCEPTED:
-            raise FriendshipAlreadyAcceptedError()
+            raise FriendshipAlreadyAcceptedError(self.id)
         return replace(
             self,
             status=FriendshipStatus.ACCEPTED,
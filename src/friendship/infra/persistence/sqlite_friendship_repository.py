@@ -1,5 +1,7 @@
 from __future__ import annotations
 
+import sqlite3
+from collections.abc import Iterator
 from dataclasses import replace
 from datetime import datetime
 
@@ -9,12 +11,42 @@ from friendship.application.dtos import (
 )
 from friendship.domain.friendship import Friendship
 from friendship.domain.friendship_status import FriendshipStatus
-from shared.infra.persistence.sqlite import SQLiteDatabase
+from shared.infra.persistence.sqlite import IN_CHUNK_SIZE, SQLiteDatabase
+from shared.infra.persistence.sqlite_pagination import CountStrategy, SQLitePaginator
+
+_FRIENDSHIP_COLUMNS = (
+    "id, requester_client_id, requested_client_id, status, accepted_at"
+)
+
+
+def _row_to_friendship(row: tuple) -> Friendship:
+    friendship_id, requester_client_id, requested_client_id, status, accepted_at = row
+
+    parsed_accepted_at = None
+    if accepted_at:
+        parsed_accepted_at = datetime.fromisoformat(accepted_at.replace("Z", "+00:00"))
+
+    return Friendship(
+        id=friendship_id,
+        requester_client_id=requester_client_id,
+        requested_client_id=requested_client_id,
+        status=FriendshipStatus(status),
+        accepted_at=parsed_accepted_at,
+    )
+
+
+def _pair_key(client_a_id: int, client_b_id: int) -> tuple[int, int]:
+    return min(client_a_id, client_b_id), max(client_a_id, client_b_id)
 
 
 class SqliteFriendshipRepository:
-    def __init__(self, db: SQLiteDatabase) -> None:
+    def __init__(
+        self,
+        db: SQLiteDatabase,
+        count_strategy: CountStrategy = CountStrategy.CACHED,
+    ) -> None:
         self._db = db
+        self._paginator = SQLitePaginator(db.count_cache, count_strategy)
 
     def add(self, friendship: Friendship) -> Friendship:
         with self._db.connect() as conn:
@@ -28,39 +60,152 @@ class SqliteFriendshipRepository:
                 ),
             )
             conn.commit()
-            return replace(friendship, id=cursor.lastrowid)
+        self._db.count_cache.invalidate("friendships")
+        return replace(friendship, id=cursor.lastrowid)
+
+    def add_if_absent(self, friendship: Friendship) -> tuple[Friendship, bool]:
+        """Insert ``friendship`` unless its pair already has a row, in either direction.
+
+        Returns the inserted friendship and True, or the existing one and
+        False. The probe and the insert share one ``BEGIN IMMEDIATE``
+        transaction, so two clients inviting each other at once cannot both
+        get in.
+        """
+        with self._db.transaction() as conn:
+            existing = self._get_between(
+                conn, friendship.requester_client_id, friendship.requested_client_id
+            )
+            if existing is not None:
+                return existing, False
+            cursor = conn.execute(
+                "INSERT INTO friendships (requester_client_id, requested_client_id, status, accepted_at) VALUES (?, ?, ?, ?)",
+                (
+                    friendship.requester_client_id,
+                    friendship.requested_client_id,
+                    friendship.status.value,
+                    friendship.accepted_at,
+                ),
+            )
+        self._db.count_cache.invalidate("friendships")
+        return replace(friendship, id=cursor.lastrowid), True
 
     def get_by_id(self, id: int) -> Friendship | None:
         with self._db.connect() as conn:
             row = conn.execute(
-                """
-                SELECT id, requester_client_id, requested_client_id, status, accepted_at
-                FROM friendships
-                WHERE id = ?
-                """,
+                f"SELECT {_FRIENDSHIP_COLUMNS} FROM friendships WHERE id = ?",
                 (id,),
             ).fetchone()
 
-        if not row:
-            return None
+        return _row_to_friendship(row) if row else None
 
-        friendship_id, requester_client_id, requested_client_id, status, accepted_at = (
-            row
-        )
+    def get_between(self, client_a_id: int, client_b_id: int) -> Friendship | None:
+        """The friendship between two clients, whoever sent the invite."""
+        with self._db.connect() as conn:
+            return self._get_between(conn, client_a_id, client_b_id)
 
-        parsed_accepted_at = None
-        if accepted_at:
-            parsed_accepted_at = datetime.fromisoformat(
-                accepted_at.replace("Z", "+00:00")
+    def _get_between(
+        self, conn: sqlite3.Connection, client_a_id: int, client_b_id: int
+    ) -> Friendship | None:
+        row = conn.execute(
+            f"""
+            SELECT {_FRIENDSHIP_COLUMNS}
+            FROM friendships
+            WHERE client_low_id = ? AND client_high_id = ?
+            """,
+            _pair_key(client_a_id, client_b_id),
+        ).fetchone()
+        return _row_to_friendship(row) if row else None
+
+    def add_many_if_absent(
+        self, friendships: list[Friendship]
+    ) -> list[tuple[Friendship, bool]]:
+        """``add_if_absent`` for a batch, in one ``BEGIN IMMEDIATE`` transaction.
+
+        Every pair is probed with one query per chunk, then the missing ones
+        are inserted. Results follow the input order; a pair repeated in the
+        batch (in either direction) is inserted once and reported as
+        existing after that.
+        """
+        results: list[tuple[Friendship, bool]] = []
+        with self._db.transaction() as conn:
+            existing = self._get_many_between(
+                conn,
+                [(f.requester_client_id, f.requested_client_id) for f in friendships],
             )
+            for friendship in friendships:
+                key = _pair_key(
+                    friendship.requester_client_id, friendship.requested_client_id
+                )
+                if key in existing:
+                    results.append((existing[key], False))
+                    continue
+                cursor = conn.execute(
+                    "INSERT INTO friendships (requester_client_id, requested_client_id, status, accepted_at) VALUES (?, ?, ?, ?)",
+                    (
+                        friendship.requester_client_id,
+                        friendship.requested_client_id,
+                        friendship.status.value,
+                        friendship.accepted_at,
+                    ),
+                )
+                existing[key] = replace(friendship, id=cursor.lastrowid)
+                results.append((existing[key], True))
+        if any(created for _, created in results):
+            self._db.count_cache.invalidate("friendships")
+        return results
 
-        return Friendship(
-            id=friendship_id,
-            requester_client_id=requester_client_id,
-            requested_client_id=requested_client_id,
-            status=FriendshipStatus(status),
-            accepted_at=parsed_accepted_at,
-        )
+    def get_many_by_ids(self, ids: list[int]) -> dict[int, Friendship]:
+        unique_ids = list(dict.fromkeys(ids))
+        friendships: dict[int, Friendship] = {}
+        with self._db.connect() as conn:
+            for start in range(0, len(unique_ids), IN_CHUNK_SIZE):
+                chunk = unique_ids[start : start + IN_CHUNK_SIZE]
+                placeholders = ", ".join("?" * len(chunk))
+                rows = conn.execute(
+                    f"SELECT {_FRIENDSHIP_COLUMNS} FROM friendships "
+                    f"WHERE id IN ({placeholders})",
+                    chunk,
+                )
+                for row in rows:
+                    friendship = _row_to_friendship(row)
+                    friendships[friendship.id] = friendship
+        return friendships
+
+    def get_many_between(
+        self, pairs: list[tuple[int, int]]
+    ) -> dict[tuple[int, int], Friendship]:
+        """Friendships keyed by ``(lower client id, higher client id)``."""
+        with self._db.connect() as conn:
+            return self._get_many_between(conn, pairs)
+
+    def _get_many_between(
+        self, conn: sqlite3.Connection, pairs: list[tuple[int, int]]
+    ) -> dict[tuple[int, int], Friendship]:
+        keys = list(dict.fromkeys(_pair_key(a, b) for a, b in pairs))
+        friendships: dict[tuple[int, int], Friendship] = {}
+        # Joining a VALUES list probes idx_friendships_client_pair on both
+        # columns; a row-value IN (...) only uses client_low_id.
+        pairs_per_chunk = IN_CHUNK_SIZE // 2
+        for start in range(0, len(keys), pairs_per_chunk):
+            chunk = keys[start : start + pairs_per_chunk]
+            values = ", ".join(["(?, ?)"] * len(chunk))
+            rows = conn.execute(
+                f"""
+                WITH pairs(low_id, high_id) AS (VALUES {values})
+                SELECT {_FRIENDSHIP_COLUMNS}
+                FROM pairs
+                JOIN friendships
+                  ON client_low_id = pairs.low_id AND client_high_id = pairs.high_id
+                """,
+                [client_id for key in chunk for client_id in key],
+            )
+            for row in rows:
+                friendship = _row_to_friendship(row)
+                key = _pair_key(
+                    friendship.requester_client_id, friendship.requested_client_id
+                )
+                friendships[key] = friendship
+        return friendships
 
     # NOTE (Clean Architecture VIOLATION): JOIN com users para evitar N+1
     def list_with_user_email_and_name(
@@ -112,21 +257,20 @@ class SqliteFriendshipRepository:
             params.append(accepted_at)
 
         where_clause = " WHERE " + " AND ".join(conditions)
-
-        count_query = "SELECT COUNT(*) " + base_query + where_clause
-        select_query = (
-            select_columns
-            + base_query
-            + where_clause
-            + " ORDER BY f.id ASC LIMIT ? OFFSET ?"
-        )
-
-        count_params = params.copy()
-        params.extend([size, (page - 1) * size])
+        select_query = select_columns + base_query + where_clause
 
         with self._db.connect() as conn:
-            rows = conn.execute(select_query, params).fetchall()
-            total_count = conn.execute(count_query, count_params).fetchone()[0]
+            result_page = self._paginator.fetch_page(
+                conn,
+                select_query,
+                params,
+                tables=("friendships", "users"),
+                order_by="id",
+                limit=size,
+                offset=(page - 1) * size,
+            )
+
+        rows, total_count = result_page.rows, result_page.total_count
 
         converted_rows: list[FriendshipSummary] = []
         for row in rows:
@@ -171,44 +315,29 @@ class SqliteFriendshipRepository:
     def friendship_exists(
         self, requester_client_id: int, requested_client_id: int
     ) -> bool:
-        with self._db.connect() as conn:
-            cursor = conn.execute(
-                """
-                SELECT 1
-                FROM friendships
-                WHERE (requester_client_id = ? AND requested_client_id = ?)
-                   OR (requester_client_id = ? AND requested_client_id = ?)
-                """,
-                (
-                    requester_client_id,
-                    requested_client_id,
-                    requested_client_id,
-                    requester_client_id,
-                ),
-            )
-            return cursor.fetchone() is not None
+        return self.get_between(requester_client_id, requested_client_id) is not None
 
     def is_friendship_pending(
         self, requester_client_id: int, requested_client_id: int
     ) -> bool:
+        friendship = self.get_between(requester_client_id, requested_client_id)
+        return friendship is not None and friendship.status == FriendshipStatus.PENDING
+
+    def iter_accepted_pairs(
+        self, batch_size: int = 50_000
+    ) -> Iterator[tuple[int, int]]:
+        """Stream ``(requester, requested)`` of every accepted friendship."""
         with self._db.connect() as conn:
             cursor = conn.execute(
                 """
-                SELECT 1
+                SELECT requester_client_id, requested_client_id
                 FROM friendships
-                WHERE ((requester_client_id = ? AND requested_client_id = ?)
-                   OR (requester_client_id = ? AND requested_client_id = ?))
-                  AND status = ?
+                WHERE status = ?
                 """,
-                (
-                    requester_client_id,
-                    requested_client_id,
-                    requested_client_id,
-                    requester_client_id,
-                    FriendshipStatus.PENDING.value,
-                ),
+                (FriendshipStatus.ACCEPTED.value,),
             )
-            return cursor.fetchone() is not None
+            while rows := cursor.fetchmany(batch_size):
+                yield from rows
 
     def edit(self, friendship: Friendship) -> None:
         accepted_at_str = None
@@ -230,8 +359,37 @@ class SqliteFriendshipRepository:
                 ),
             )
             conn.commit()
+        self._db.count_cache.invalidate("friendships")
+
+    def accept_many(self, friendships: list[Friendship]) -> set[int]:
+        """Write accepted ``friendships`` that are still pending, in one transaction.
+
+        Returns the ids actually updated; one accepted or deleted
+        concurrently is left out.
+        """
+        accepted_ids: set[int] = set()
+        with self._db.transaction() as conn:
+            for friendship in friendships:
+                cursor = conn.execute(
+                    """
+                    UPDATE friendships SET status = ?, accepted_at = ?
+                    WHERE id = ? AND status = ?
+                    """,
+                    (
+                        friendship.status.value,
+                        friendship.accepted_at.isoformat(),
+                        friendship.id,
+                        FriendshipStatus.PENDING.value,
+                    ),
+                )
+                if cursor.rowcount:
+                    accepted_ids.add(friendship.id)
+        if accepted_ids:
+            self._db.count_cache.invalidate("friendships")
+        return accepted_ids
 
     def delete(self, friendship_id: int) -> None:
         with self._db.connect() as conn:
             conn.execute("DELETE FROM friendships WHERE id = ?", (friendship_id,))
             conn.commit()
+        self._db.count_cache.invalidate("friendships")
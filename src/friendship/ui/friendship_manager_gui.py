@@ -4,6 +4,7 @@ from friendship.application.list_friendships_with_user_email_and_name_use_case i
 )
 from friendship.application.send_friendship_invite_use_case import (
     SendFriendshipInviteInputDto,
+    SendFriendshipInvitesInputDto,
 )
 from friendship.domain.friendship_status import FriendshipStatus
 from friendship.ui.friendship_pending_invites_gui import FriendshipPendingInvitesGUI
@@ -39,6 +40,9 @@ class FriendshipManagerGUI(BaseGUI):
             key="-TABLE-",
             items_per_page=10,
             has_hidden_id_column=True,
+            error_callback=lambda e: self.show_error_popup(
+                f"Error loading friendships: {e}"
+            ),
         )
 
         self.action_buttons = ActionButtonsComponent([
@@ -94,30 +98,59 @@ class FriendshipManagerGUI(BaseGUI):
     def _handle_add_friend(self, _):
         confirmed, friend_email = self.show_input_dialog(
             dialog_title="Add friend",
-            instruction_label="Enter Friend Email",
-            input_tooltip="Enter the email address of the friend you want to add (e.g., friend@example.com)",
+            instruction_label="Enter Friend Email(s)",
+            input_tooltip="Enter the email address of the friend you want to add (e.g., friend@example.com); separate several with commas",
             confirm_button="Add Friend",
             cancel_button="Cancel",
         )
 
         if confirmed:
-            if not friend_email or not friend_email.strip():
+            emails = [
+                email.strip()
+                for email in (friend_email or "").replace(";", ",").split(",")
+                if email.strip()
+            ]
+            if not emails:
                 self.show_warning_popup("Please enter a valid email address!")
                 return
+            if len(emails) > 1:
+                self._send_invites(emails)
+                return
 
             try:
                 input_dto = SendFriendshipInviteInputDto(
                     requester_client_email=self.auth_context.email,
-                    requested_client_email=friend_email.strip(),
+                    requested_client_email=emails[0],
                 )
                 self.use_cases.send_friendship_invite_use_case.execute(input_dto)
-                self.show_success_popup(
-                    f"Friendship invite sent to: {friend_email.strip()}"
-                )
+                self.show_success_popup(f"Friendship invite sent to: {emails[0]}")
                 self.table.refresh(self.window)
             except Exception as e:
                 self.show_error_popup(f"Error sending friendship invite: {e!s}")
 
+    def _send_invites(self, emails):
+        try:
+            results = self.use_cases.send_friendship_invite_use_case.execute_many(
+                SendFriendshipInvitesInputDto(
+                    requester_client_email=self.auth_context.email,
+                    requested_client_emails=emails,
+                )
+            )
+        except Exception as e:
+            self.show_error_popup(f"Error sending friendship invites: {e!s}")
+            return
+
+        failed = [result for result in results if not result.sent]
+        if failed:
+            errors = "\n".join(str(result.error) for result in failed)
+            self.show_warning_popup(
+                f"{len(results) - len(failed)} invites sent, "
+                f"{len(failed)} failed:\n{errors}"
+            )
+        else:
+            self.show_success_popup(f"{len(results)} friendship invites sent!")
+        self.table.refresh(self.window)
+
     def _handle_remove_selected(self, _):
         selected_data = self.table.get_selected_row_data(self.window)
         if selected_data:
@@ -150,30 +183,25 @@ class FriendshipManagerGUI(BaseGUI):
             self.show_warning_popup("No row selected!")
 
     def _load_friendships_callback(self, page: int, items_per_page: int):
-        try:
-            input_dto = ListFriendshipsInputDto(
-                page=page,
-                size=items_per_page,
-                participant_client_id=self.auth_context.id,
-                status=FriendshipStatus.ACCEPTED,
-            )
-
-            paginated_friendships = self.use_cases.list_friendships_use_case.execute(
-                input_dto
-            )
+        input_dto = ListFriendshipsInputDto(
+            page=page,
+            size=items_per_page,
+            participant_client_id=self.auth_context.id,
+            status=FriendshipStatus.ACCEPTED,
+        )
 
-            friendship_summaries, total_friendships_count = (
-                paginated_friendships.friendship_summaries,
-                paginated_friendships.total_friendships_count,
-            )
+        paginated_friendships = self.use_cases.list_friendships_use_case.execute(
+            input_dto
+        )
 
-            table_data = self._convert_friendships_to_table_data(friendship_summaries)
+        friendship_summaries, total_friendships_count = (
+            paginated_friendships.friendship_summaries,
+            paginated_friendships.total_friendships_count,
+        )
 
-            return {"data": table_data, "total": total_friendships_count}
+        table_data = self._convert_friendships_to_table_data(friendship_summaries)
 
-        except Exception as e:
-            self.show_error_popup(f"Error loading friendships: {e}")
-            return {"data": [], "total": 0}
+        return {"data": table_data, "total": total_friendships_count}
 
     def _convert_friendships_to_table_data(self, friendships):
         table_data = []
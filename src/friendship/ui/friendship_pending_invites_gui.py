@@ -1,5 +1,6 @@
 from friendship.application.accept_friendship_invite_use_case import (
     AcceptFriendshipInviteInputDto,
+    AcceptFriendshipInvitesInputDto,
 )
 from friendship.application.delete_friendship_use_case import DeleteFriendshipInputDto
 from friendship.application.list_friendships_with_user_email_and_name_use_case import (
@@ -29,6 +30,9 @@ class FriendshipPendingInvitesGUI(BaseGUI):
             key="-TABLE-",
             items_per_page=10,
             has_hidden_id_column=True,
+            error_callback=lambda e: self.show_error_popup(
+                f"Error loading friendships: {e}"
+            ),
         )
 
         self.action_buttons = ActionButtonsComponent([
@@ -38,6 +42,12 @@ class FriendshipPendingInvitesGUI(BaseGUI):
                 "button_color": (COLORS["white"], COLORS["success"]),
                 "size": BUTTON_SIZES["MEDIUM"],
             },
+            {
+                "text": "Accept Page",
+                "key": "-ACCEPT_PAGE-",
+                "button_color": (COLORS["white"], COLORS["success"]),
+                "size": BUTTON_SIZES["MEDIUM"],
+            },
             {
                 "text": "Decline Selected",
                 "key": "-DECLINE_SELECTED-",
@@ -48,6 +58,7 @@ class FriendshipPendingInvitesGUI(BaseGUI):
 
         self.event_map = {
             "-ACCEPT_SELECTED-": self._handle_accept_selected,
+            "-ACCEPT_PAGE-": self._handle_accept_page,
             "-DECLINE_SELECTED-": self._handle_decline_selected,
         }
 
@@ -71,30 +82,25 @@ class FriendshipPendingInvitesGUI(BaseGUI):
             pass
 
     def _load_friendships_callback(self, page: int, items_per_page: int):
-        try:
-            input_dto = ListFriendshipsInputDto(
-                page=page,
-                size=items_per_page,
-                requested_client_id=self.auth_context.id,
-                status=FriendshipStatus.PENDING,
-            )
-
-            paginated_friendships = self.use_cases.list_friendships_use_case.execute(
-                input_dto
-            )
+        input_dto = ListFriendshipsInputDto(
+            page=page,
+            size=items_per_page,
+            requested_client_id=self.auth_context.id,
+            status=FriendshipStatus.PENDING,
+        )
 
-            friendship_summaries, total_friendships_count = (
-                paginated_friendships.friendship_summaries,
-                paginated_friendships.total_friendships_count,
-            )
+        paginated_friendships = self.use_cases.list_friendships_use_case.execute(
+            input_dto
+        )
 
-            table_data = self._convert_friendships_to_table_data(friendship_summaries)
+        friendship_summaries, total_friendships_count = (
+            paginated_friendships.friendship_summaries,
+            paginated_friendships.total_friendships_count,
+        )
 
-            return {"data": table_data, "total": total_friendships_count}
+        table_data = self._convert_friendships_to_table_data(friendship_summaries)
 
-        except Exception as e:
-            self.show_error_popup(f"Error loading friendships: {e}")
-            return {"data": [], "total": 0}
+        return {"data": table_data, "total": total_friendships_count}
 
     def _convert_friendships_to_table_data(self, friendships):
         table_data = []
@@ -136,6 +142,36 @@ class FriendshipPendingInvitesGUI(BaseGUI):
         else:
             self.show_warning_popup("No row selected!")
 
+    def _handle_accept_page(self, values):
+        friendship_ids = [row[0] for row in self.table.data]
+        if not friendship_ids:
+            self.show_warning_popup("No pending invites on this page!")
+            return
+
+        if not self.show_confirmation_popup(
+            f"Are you sure you want to accept all {len(friendship_ids)} invites on this page?"
+        ):
+            return
+
+        try:
+            results = self.use_cases.accept_friendship_invite_use_case.execute_many(
+                AcceptFriendshipInvitesInputDto(friendship_ids=friendship_ids)
+            )
+        except Exception as e:
+            self.show_error_popup(f"Error accepting friendship invites: {e!s}")
+            return
+
+        failed = [result for result in results if not result.accepted]
+        if failed:
+            errors = "\n".join(str(result.error) for result in failed)
+            self.show_warning_popup(
+                f"{len(results) - len(failed)} invites accepted, "
+                f"{len(failed)} failed:\n{errors}"
+            )
+        else:
+            self.show_success_popup(f"{len(results)} invites accepted successfully!")
+        self.table.refresh(self.window)
+
     def _handle_decline_selected(self, values):
         selected_data = self.table.get_selected_row_data(self.window)
         if selected_data:
@@ -1,14 +1,39 @@
 from __future__ import annotations
 
-from shared.composition_root import build_application
-from shared.ui.navigation_manager import NavigationManager
-from user.ui.authenticate_gui import AuthenticateGUI
+import argparse
 
+from shared.infra.startup_profiler import get_startup_profiler
+
+
+def parse_args(argv: list[str] | None = None) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description="EventManager")
+    parser.add_argument(
+        "--startup-report",
+        action="store_true",
+        help="print import and provider timings when the first window appears",
+    )
+    return parser.parse_args(argv)
+
+
+def run(argv: list[str] | None = None) -> None:
+    args = parse_args(argv)
+    profiler = get_startup_profiler()
+    if args.startup_report:
+        profiler.enable()
+
+    # Imported here so the startup report can time them.
+    from shared.composition_root import build_application
+    from shared.ui.navigation_manager import NavigationManager
+    from user.ui.authenticate_gui import AuthenticateGUI
+
+    profiler.mark("application modules imported")
 
-def run() -> None:
     app = build_application()
     navigator = NavigationManager(app)
-    navigator.push_screen(AuthenticateGUI)
+    try:
+        navigator.push_screen(AuthenticateGUI)
+    finally:
+        app.close()
 
 
 if __name__ == "__main__":
@@ -0,0 +1,121 @@
+#!/usr/bin/env python3
+"""
+Exercises the email outbox against an in-process SMTP stand-in.
+
+A redemption with send_email=True only queues the confirmation, so it returns
+immediately. The outbox worker then delivers it through LocalSmtpServer after
+a couple of injected temporary failures. A second message keeps failing until
+it is dead-lettered.
+
+    PYTHONPATH=src python src/scripts/play_email_outbox.py
+"""
+
+import os
+import sys
+import tempfile
+import time
+from datetime import UTC, datetime, timedelta
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+
+from event.application.create_event_use_case import CreateEventInputDto
+from shared.composition_root import build_application
+from shared.infra.email.email_outbox import EmailOutbox, EmailRetryPolicy
+from shared.infra.email.local_smtp_server import LocalSmtpServer
+from shared.infra.email.sqlite_email_outbox_repository import OutboxStatus
+from ticket.application.dtos import RedeemTicketInputDto
+from user.application.create_user_use_case import CreateUserInputDto
+from user.domain.user_role import UserRole
+
+
+def wait_until(predicate, timeout: float = 10.0) -> bool:
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        if predicate():
+            return True
+        time.sleep(0.05)
+    return False
+
+
+def main():
+    smtp = LocalSmtpServer().start()
+    os.environ.update({
+        "EMAIL_SMTP_HOST": smtp.host,
+        "EMAIL_SMTP_PORT": str(smtp.port),
+        "EMAIL_HOST_USER": "tickets@festum.local",
+        "EMAIL_HOST_PASSWORD": "",
+        "EMAIL_SMTP_STARTTLS": "false",
+    })
+
+    app = build_application(os.path.join(tempfile.mkdtemp(), "outbox.db"))
+    # Swap the default worker for one with short backoff so the demo is quick.
+    app.email_outbox.stop()
+    outbox = EmailOutbox(
+        app.email_outbox.repository,
+        app.smtp_email_service,
+        EmailRetryPolicy(max_attempts=3, base_delay_seconds=0.2),
+        poll_interval_seconds=0.1,
+    )
+    repository = outbox.repository
+
+    try:
+        organizer = app.create_user_use_case.execute(
+            CreateUserInputDto(
+                "Organizer", "organizer@festum.local", "123456", UserRole.ORGANIZER
+            )
+        )
+        client = app.create_user_use_case.execute(
+            CreateUserInputDto(
+                "Client", "client@festum.local", "123456", UserRole.CLIENT
+            )
+        )
+        now = datetime.now(UTC)
+        event = app.create_event_use_case.create_event(
+            CreateEventInputDto(
+                name="Outbox Party",
+                start_date=now + timedelta(days=1),
+                end_date=now + timedelta(days=2),
+                location="Local",
+                max_tickets=10,
+                organizer_id=organizer.id,
+            )
+        )
+
+        smtp.fail_next(2)
+        started_at = time.perf_counter()
+        app.redeem_ticket_use_case.redeem_ticket(
+            RedeemTicketInputDto(
+                event_id=event.id,
+                client_id=client.id,
+                redeem_ticket_count=2,
+                send_email=True,
+            )
+        )
+        print(
+            f"Redemption returned in {(time.perf_counter() - started_at) * 1000:.1f} ms"
+        )
+
+        outbox.start()
+        delivered = wait_until(lambda: len(smtp.messages) == 1)
+        print(
+            f"Delivered after retries: {delivered} -> {smtp.messages[0]['Subject'] if delivered else '-'}"
+        )
+
+        smtp.fail_next(3, reply="550 Mailbox unavailable")
+        outbox.enqueue("nobody@festum.local", "Undeliverable", "<p>never arrives</p>")
+        dead = wait_until(lambda: repository.count_by_status()[OutboxStatus.DEAD] == 1)
+        print(f"Dead-lettered after 3 attempts: {dead}")
+        for message in repository.list_dead():
+            print(f"  #{message.id} {message.recipient}: {message.last_error}")
+
+        counts = repository.count_by_status()
+        print("Outbox:", {status.value: count for status, count in counts.items()})
+        return 0 if delivered and dead else 1
+    finally:
+        outbox.stop()
+        app.close()
+        smtp.stop()
+
+
+if __name__ == "__main__":
+    exit(main())
@@ -0,0 +1,93 @@
+#!/usr/bin/env python3
+"""
+Friendship graph load time, memory footprint and query latency.
+
+Loads the in-memory FriendshipGraph from an existing database (generate a
+large one with play_generate_data.py first), prints its size metrics, then
+times mutual-friend counts and friend suggestions for random clients.
+
+    PYTHONPATH=src python src/scripts/play_generate_data.py --fresh --users 1000000
+    PYTHONPATH=src python src/scripts/play_friendship_graph.py --queries 2000
+"""
+
+import argparse
+import os
+import random
+import sys
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+
+from shared.composition_root import build_application
+
+
+def parse_args():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--db", default=None, help="default: data/app.db")
+    parser.add_argument("--queries", type=int, default=1_000)
+    parser.add_argument("--seed", type=int, default=None)
+    return parser.parse_args()
+
+
+def timed(label, calls):
+    latencies = []
+    for call in calls:
+        started_at = time.perf_counter_ns()
+        call()
+        latencies.append(time.perf_counter_ns() - started_at)
+    latencies.sort()
+    print(
+        f"  {label:<20} p50 {latencies[len(latencies) // 2] / 1000:8.1f} us   "
+        f"p99 {latencies[int(len(latencies) * 0.99)] / 1000:8.1f} us"
+    )
+
+
+def main():
+    args = parse_args()
+    rng = random.Random(args.seed)
+    app = build_application(db_path=args.db)
+    try:
+        graph = app.friendship_graph
+        started_at = time.perf_counter()
+        graph.friends(0)
+        print(f"Loaded in {time.perf_counter() - started_at:.2f} s")
+
+        info = graph.info()
+        print(
+            f"  {info.clients:,} clients, {info.friendships:,} friendships, "
+            f"max degree {info.max_degree:,}\n"
+            f"  adjacency arrays {info.adjacency_bytes / 2**20:,.1f} MiB, "
+            f"total {info.total_bytes / 2**20:,.1f} MiB "
+            f"({info.total_bytes / max(1, info.friendships):.1f} bytes/friendship)"
+        )
+        if not info.friendships:
+            print("No accepted friendships; run play_generate_data.py first")
+            return 1
+
+        with app.db.connect() as conn:
+            clients = [
+                row[0]
+                for row in conn.execute(
+                    "SELECT requester_client_id FROM friendships "
+                    "WHERE status = 'ACCEPTED' ORDER BY random() LIMIT ?",
+                    (args.queries,),
+                )
+            ]
+        pairs = [(a, rng.choice(graph.friends(a))) for a in clients]
+
+        print("Queries:")
+        timed(
+            "mutual_friend_count",
+            [lambda a=a, b=b: graph.mutual_friend_count(a, b) for a, b in pairs],
+        )
+        timed(
+            "suggest_friends",
+            [lambda a=a: graph.suggest_friends(a, limit=10) for a in clients],
+        )
+    finally:
+        app.close()
+    return 0
+
+
+if __name__ == "__main__":
+    exit(main())
@@ -0,0 +1,482 @@
+#!/usr/bin/env python3
+"""
+High-volume synthetic data generator.
+
+Bulk-loads users, events, tickets and friendships straight into SQLite with
+batched executemany calls, one large transaction per table. Distributions
+are skewed like real traffic: friend counts follow a power law and event
+popularity a Zipf law, so a few clients have hundreds of friends and a few
+events sell most of the tickets.
+
+Rows are generated in chunks that can be spread over --processes worker
+processes while the main process writes them. Every chunk seeds its own RNG
+from --seed and its position, so the same --seed and --batch-size produce
+the same rows whatever the number of processes (dates are relative to now).
+
+Every generated user's password is "123456" (e.g. client0@email.com).
+
+    PYTHONPATH=src python src/scripts/play_generate_data.py --fresh \\
+        --users 1000000 --events 20000 --tickets 5000000 --processes 4
+"""
+
+import argparse
+import bisect
+import itertools
+import multiprocessing
+import os
+import random
+import sys
+import time
+from collections.abc import Iterable, Iterator
+from dataclasses import dataclass
+from datetime import UTC, datetime, timedelta
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+
+from shared.composition_root import build_application
+from ticket.infra.ticket_code_allocator import CODE_ALPHABET, CODE_LENGTH
+from user.domain.user import User
+from user.domain.user_role import UserRole
+
+FIRST_NAMES = (
+    "Ana Bruno Camila Carlos Daniela Diego Eduardo Fernanda Gabriel Gustavo "
+    "Isabela Joao Julia Larissa Leonardo Lucas Mariana Mateus Natalia Pedro "
+    "Rafael Renata Rodrigo Tatiana Thiago Vanessa Vinicius"
+).split()
+LAST_NAMES = (
+    "Almeida Alves Cardoso Costa Ferreira Gomes Lima Martins Mendes Oliveira "
+    "Pereira Ribeiro Rocha Santos Silva Souza"
+).split()
+EVENT_KINDS = (
+    "Festival Concert Conference Meetup Workshop Fair Party Summit Show".split()
+)
+CITIES = (
+    "Curitiba Sao Paulo Rio de Janeiro Belo Horizonte Porto Alegre Recife "
+    "Salvador Fortaleza Florianopolis Brasilia"
+).split(" ")
+
+_CODE_MASK = (1 << (5 * CODE_LENGTH)) - 1
+# Odd, so multiplying by it modulo 2**30 is a bijection: codes never collide.
+_CODE_MULTIPLIER = 0x2F0B3C5
+
+USERS_SQL = "INSERT INTO users (name, email, hashed_password, role) VALUES (?, ?, ?, ?)"
+EVENTS_SQL = (
+    "INSERT INTO events (name, created_at, end_date, location, start_date, "
+    "max_tickets, initial_max_tickets, organizer_id, tickets_redeemed) "
+    "VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)"
+)
+EVENT_STAFF_SQL = "INSERT OR IGNORE INTO event_staff (event_id, user_id) VALUES (?, ?)"
+TICKETS_SQL = (
+    "INSERT INTO tickets (event_id, client_id, code, status, created_at) "
+    "VALUES (?, ?, ?, ?, ?)"
+)
+FRIENDSHIPS_SQL = (
+    "INSERT OR IGNORE INTO friendships "
+    "(requester_client_id, requested_client_id, status, accepted_at) "
+    "VALUES (?, ?, ?, ?)"
+)
+
+
+@dataclass(frozen=True)
+class Plan:
+    """Everything a worker needs to generate any chunk on its own."""
+
+    seed: int
+    now: datetime
+    organizers: int
+    staffs: int
+    clients: int
+    password_hash: str
+    pending_ratio: float
+    max_friends: int
+    # Power-law client weights; degree and buying activity follow them.
+    client_cum_weights: list[float]
+    client_degrees: list[int]
+    # Per event: tickets sold (prefix sums) and the sale window.
+    ticket_prefix: list[int]
+    event_created_at: list[datetime]
+    event_start: list[datetime]
+    event_end: list[datetime]
+
+    @property
+    def first_client_id(self) -> int:
+        return self.organizers + self.staffs + 1
+
+
+_plan: Plan | None = None
+
+
+def _init_worker(plan: Plan) -> None:
+    global _plan
+    _plan = plan
+
+
+def _rng(seed: int, kind: str, chunk: int) -> random.Random:
+    return random.Random(f"{seed}:{kind}:{chunk}")
+
+
+def parse_args():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--db", default=None, help="default: data/app.db")
+    parser.add_argument("--fresh", action="store_true", help="delete --db first")
+    parser.add_argument("--users", type=int, default=20_000)
+    parser.add_argument("--events", type=int, default=500)
+    parser.add_argument("--tickets", type=int, default=100_000)
+    parser.add_argument("--avg-friends", type=float, default=12.0)
+    parser.add_argument(
+        "--friend-exponent",
+        type=float,
+        default=2.2,
+        help="power-law exponent of the friend-count distribution (> 2)",
+    )
+    parser.add_argument(
+        "--popularity-skew",
+        type=float,
+        default=1.1,
+        help="Zipf exponent of event popularity",
+    )
+    parser.add_argument("--pending-ratio", type=float, default=0.15)
+    parser.add_argument("--organizer-ratio", type=float, default=0.01)
+    parser.add_argument("--staff-ratio", type=float, default=0.02)
+    parser.add_argument("--processes", type=int, default=1)
+    parser.add_argument("--batch-size", type=int, default=50_000)
+    parser.add_argument("--seed", type=int, default=42)
+    return parser.parse_args()
+
+
+# Planning (main process)
+
+
+def _client_weights(args, clients: int) -> tuple[list[float], list[int]]:
+    rng = _rng(args.seed, "client-weights", 0)
+    alpha = args.friend_exponent - 1
+    weights = [rng.paretovariate(alpha) for _ in range(clients)]
+    scale = args.avg_friends / (sum(weights) / clients)
+    max_friends = min(clients - 1, 5_000)
+    degrees = [min(max_friends, round(weight * scale)) for weight in weights]
+    return list(itertools.accumulate(weights)), degrees
+
+
+def _ticket_counts(args) -> list[int]:
+    """Split --tickets over events by Zipf popularity (largest remainder)."""
+    rng = _rng(args.seed, "event-popularity", 0)
+    ranks = list(range(1, args.events + 1))
+    rng.shuffle(ranks)
+    weights = [1 / rank**args.popularity_skew for rank in ranks]
+    total = sum(weights)
+    shares = [args.tickets * weight / total for weight in weights]
+    counts = [int(share) for share in shares]
+    by_remainder = sorted(range(args.events), key=lambda i: counts[i] - shares[i])
+    for i in by_remainder[: args.tickets - sum(counts)]:
+        counts[i] += 1
+    return counts
+
+
+def _event_dates(args, now: datetime):
+    rng = _rng(args.seed, "event-dates", 0)
+    created, start, end = [], [], []
+    for _ in range(args.events):
+        created_at = now - timedelta(days=rng.uniform(0, 400))
+        start_date = created_at + timedelta(days=rng.uniform(1, 400))
+        created.append(created_at)
+        start.append(start_date)
+        end.append(start_date + timedelta(hours=rng.uniform(2, 72)))
+    return created, start, end
+
+
+def build_plan(args) -> Plan:
+    now = datetime.now(UTC).replace(microsecond=0)
+    organizers = max(1, int(args.users * args.organizer_ratio))
+    staffs = max(1, int(args.users * args.staff_ratio))
+    clients = max(2, args.users - organizers - staffs)
+    cum_weights, degrees = _client_weights(args, clients)
+    created, start, end = _event_dates(args, now)
+    return Plan(
+        seed=args.seed,
+        now=now,
+        organizers=organizers,
+        staffs=staffs,
+        clients=clients,
+        password_hash=User.register(
+            "x", "x", "123456", UserRole.CLIENT
+        ).hashed_password,
+        pending_ratio=args.pending_ratio,
+        max_friends=min(clients - 1, 5_000),
+        client_cum_weights=cum_weights,
+        client_degrees=degrees,
+        ticket_prefix=[0, *itertools.accumulate(_ticket_counts(args))],
+        event_created_at=created,
+        event_start=start,
+        event_end=end,
+    )
+
+
+# Chunk generators (worker processes)
+
+
+def _user_rows(chunk: int, start: int, stop: int) -> list[tuple]:
+    plan = _plan
+    rng = _rng(plan.seed, "users", chunk)
+    rows = []
+    for index in range(start, stop):
+        if index < plan.organizers:
+            role, email = "ORGANIZER", f"organizer{index}@email.com"
+        elif index < plan.organizers + plan.staffs:
+            role, email = "STAFF", f"staff{index - plan.organizers}@email.com"
+        else:
+            client = index - plan.organizers - plan.staffs
+            role, email = "CLIENT", f"client{client}@email.com"
+        name = f"{rng.choice(FIRST_NAMES)} {rng.choice(LAST_NAMES)}"
+        rows.append((name, email, plan.password_hash, role))
+    return rows
+
+
+def _event_rows(chunk: int, start: int, stop: int) -> list[tuple]:
+    plan = _plan
+    rng = _rng(plan.seed, "events", chunk)
+    rows = []
+    for index in range(start, stop):
+        sold = plan.ticket_prefix[index + 1] - plan.ticket_prefix[index]
+        # About one event in six is sold out.
+        spare = 0 if rng.random() < 0.15 else int(sold * rng.uniform(0.1, 1)) + 20
+        name = f"{rng.choice(EVENT_KINDS)} {rng.choice(CITIES)} #{index + 1}"
+        rows.append((
+            name,
+            plan.event_created_at[index].isoformat(sep=" "),
+            plan.event_end[index].isoformat(sep=" "),
+            rng.choice(CITIES),
+            plan.event_start[index].isoformat(sep=" "),
+            sold + spare,
+            sold + spare,
+            1 + rng.randrange(plan.organizers),
+            sold,
+        ))
+    return rows
+
+
+def _event_staff_rows(chunk: int, start: int, stop: int) -> list[tuple]:
+    plan = _plan
+    rng = _rng(plan.seed, "event-staff", chunk)
+    first_staff = plan.organizers + 1
+    return [
+        (index + 1, first_staff + rng.randrange(plan.staffs))
+        for index in range(start, stop)
+        for _ in range(rng.randint(0, 3))
+    ]
+
+
+def _ticket_code(index: int, seed: int) -> str:
+    value = (index * _CODE_MULTIPLIER + seed) & _CODE_MASK
+    chars = []
+    for _ in range(CODE_LENGTH):
+        chars.append(CODE_ALPHABET[value & 31])
+        value >>= 5
+    return "".join(chars)
+
+
+def _ticket_rows(chunk: int, start: int, stop: int) -> list[tuple]:
+    plan = _plan
+    rng = _rng(plan.seed, "tickets", chunk)
+    buyers = rng.choices(
+        range(plan.first_client_id, plan.first_client_id + plan.clients),
+        cum_weights=plan.client_cum_weights,
+        k=stop - start,
+    )
+    rows = []
+    event = bisect.bisect_right(plan.ticket_prefix, start) - 1
+    for index, client_id in zip(range(start, stop), buyers, strict=True):
+        while plan.ticket_prefix[event + 1] <= index:
+            event += 1
+        sale_ends = min(plan.event_start[event], plan.now)
+        sale_starts = plan.event_created_at[event]
+        created_at = sale_starts + (sale_ends - sale_starts) * rng.random()
+        validated = plan.event_end[event] < plan.now and rng.random() < 0.8
+        rows.append((
+            event + 1,
+            client_id,
+            _ticket_code(index, plan.seed),
+            "VALIDATED" if validated else "PENDING",
+            created_at.isoformat(),
+        ))
+    return rows
+
+
+def _orient(a: int, b: int, seed: int) -> tuple[int, int]:
+    """Who sent the invite, decided by the pair alone so both ends agree."""
+    low, high = min(a, b), max(a, b)
+    return (low, high) if (low * 31 + high + seed) % 2 else (high, low)
+
+
+def _friendship_rows(chunk: int, start: int, stop: int) -> list[tuple]:
+    """Chung-Lu graph: client u picks degree(u)/2 partners by weight."""
+    plan = _plan
+    rng = _rng(plan.seed, "friendships", chunk)
+    first = plan.first_client_id
+    population = range(first, first + plan.clients)
+    accepted_at = plan.now.isoformat(sep=" ")
+    pairs = set()
+    for index in range(start, stop):
+        picks = (plan.client_degrees[index] + rng.randint(0, 1)) // 2
+        if not picks:
+            continue
+        client_id = first + index
+        partners = rng.choices(population, cum_weights=plan.client_cum_weights, k=picks)
+        for partner in partners:
+            if partner != client_id:
+                pairs.add(_orient(client_id, partner, plan.seed))
+
+    rows = []
+    for requester, requested in sorted(pairs):
+        if rng.random() < plan.pending_ratio:
+            rows.append((requester, requested, "PENDING", None))
+        else:
+            rows.append((requester, requested, "ACCEPTED", accepted_at))
+    return rows
+
+
+_GENERATORS = {
+    "users": _user_rows,
+    "events": _event_rows,
+    "event_staff": _event_staff_rows,
+    "tickets": _ticket_rows,
+    "friendships": _friendship_rows,
+}
+
+
+def _generate(task: tuple[str, int, int, int]) -> list[tuple]:
+    kind, chunk, start, stop = task
+    return _GENERATORS[kind](chunk, start, stop)
+
+
+# Loading
+
+
+def _tasks(kind: str, total: int, batch_size: int) -> list[tuple[str, int, int, int]]:
+    return [
+        (kind, chunk, start, min(start + batch_size, total))
+        for chunk, start in enumerate(range(0, total, batch_size))
+    ]
+
+
+def load_table(app, pool, label: str, sql: str, tasks: list) -> int:
+    started_at = time.perf_counter()
+    batches: Iterable[list[tuple]] = (
+        pool.imap(_generate, tasks) if pool is not None else map(_generate, tasks)
+    )
+    with app.db.transaction() as conn:
+        # The statements are INSERT OR IGNORE, so count what actually landed.
+        changes_before = conn.total_changes
+        for rows in batches:
+            conn.executemany(sql, rows)
+        inserted = conn.total_changes - changes_before
+    elapsed = time.perf_counter() - started_at
+    print(
+        f"  {label:<12} {inserted:>12,} rows in {elapsed:6.1f} s "
+        f"({inserted / max(elapsed, 1e-9):,.0f} rows/s)"
+    )
+    return inserted
+
+
+def _remove_database(path: str) -> None:
+    for suffix in ("", "-wal", "-shm"):
+        if os.path.exists(path + suffix):
+            os.remove(path + suffix)
+
+
+def _summary(app) -> Iterator[str]:
+    with app.db.connect() as conn:
+        degrees = [
+            row[0]
+            for row in conn.execute(
+                """
+                SELECT COUNT(*) FROM (
+                    SELECT requester_client_id AS id FROM friendships
+                    UNION ALL
+                    SELECT requested_client_id FROM friendships
+                ) GROUP BY id ORDER BY 1
+                """
+            )
+        ]
+        top = conn.execute(
+            "SELECT COALESCE(SUM(tickets_redeemed), 0) FROM "
+            "(SELECT tickets_redeemed FROM events ORDER BY tickets_redeemed DESC "
+            "LIMIT MAX(1, (SELECT COUNT(*) FROM events) / 100))"
+        ).fetchone()[0]
+        sold = conn.execute(
+            "SELECT COALESCE(SUM(tickets_redeemed), 0) FROM events"
+        ).fetchone()[0]
+    if degrees:
+        yield (
+            f"friends per client: median {degrees[len(degrees) // 2]}, "
+            f"p99 {degrees[int(len(degrees) * 0.99)]}, max {degrees[-1]}"
+        )
+    if sold:
+        yield f"top 1% of events sold {top / sold:.0%} of the tickets"
+
+
+def main():
+    args = parse_args()
+    db_path = args.db or os.path.join("data", "app.db")
+    if args.fresh:
+        _remove_database(db_path)
+    elif os.path.exists(db_path):
+        print(f"{db_path} already exists; pass --fresh to replace it")
+        return 1
+
+    started_at = time.perf_counter()
+    plan = build_plan(args)
+    print(
+        f"Generating {args.users:,} users, {args.events:,} events and "
+        f"{args.tickets:,} tickets (seed {args.seed}, {args.processes} process(es))"
+    )
+
+    app = build_application(db_path=db_path)
+    pool = None
+    if args.processes > 1:
+        pool = multiprocessing.Pool(
+            args.processes, initializer=_init_worker, initargs=(plan,)
+        )
+    else:
+        _init_worker(plan)
+
+    batch = args.batch_size
+    users = plan.organizers + plan.staffs + plan.clients
+    try:
+        load_table(app, pool, "users", USERS_SQL, _tasks("users", users, batch))
+        load_table(
+            app, pool, "events", EVENTS_SQL, _tasks("events", args.events, batch)
+        )
+        load_table(
+            app,
+            pool,
+            "event_staff",
+            EVENT_STAFF_SQL,
+            _tasks("event_staff", args.events, batch),
+        )
+        load_table(
+            app, pool, "tickets", TICKETS_SQL, _tasks("tickets", args.tickets, batch)
+        )
+        # Friendship chunks are per client; keep them small, hubs are costly.
+        load_table(
+            app,
+            pool,
+            "friendships",
+            FRIENDSHIPS_SQL,
+            _tasks("friendships", plan.clients, max(1, batch // 10)),
+        )
+        with app.db.connect() as conn:
+            conn.execute("ANALYZE")
+        for line in _summary(app):
+            print(f"  {line}")
+    finally:
+        if pool is not None:
+            pool.close()
+            pool.join()
+        app.close()
+
+    print(f"Done in {time.perf_counter() - started_at:.1f} s: {db_path}")
+    return 0
+
+
+if __name__ == "__main__":
+    exit(main())
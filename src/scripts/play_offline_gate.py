@@ -0,0 +1,189 @@
+#!/usr/bin/env python3
+"""
+Offline gate validation walkthrough.
+
+Sets up an event with --tickets pending tickets and a staff member, exports
+that staff member's offline snapshot, scans codes on two simulated gate
+devices without touching the database (some codes on both gates, some
+unknown, some twice on the same gate), validates one ticket online, then
+reconciles both scan logs and checks that every ticket was validated once
+and every double scan was reported as a conflict.
+
+The devices' clock is set inside the event window, which starts tomorrow,
+so reconciliation also exercises the scan-time window check.
+
+    PYTHONPATH=src python src/scripts/play_offline_gate.py --tickets 100000
+"""
+
+import argparse
+import os
+import random
+import sys
+import tempfile
+import time
+from datetime import UTC, datetime, timedelta
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+
+from event.application.add_event_staff_use_case import AddEventStaffInputDto
+from event.application.create_event_use_case import CreateEventInputDto
+from shared.composition_root import build_application
+from ticket.application.dtos import (
+    ExportOfflineSnapshotInputDto,
+    ReconcileOfflineScansInputDto,
+)
+from ticket.domain.ticket import Ticket
+from ticket.domain.ticket_status import TicketStatus
+from ticket.infra.offline_gate_validator import OfflineGateValidator, read_scan_log
+from ticket.infra.offline_snapshot import OfflineSnapshot
+from ticket.infra.ticket_code_allocator import generate_code
+from user.application.create_user_use_case import CreateUserInputDto
+from user.domain.user_role import UserRole
+
+
+def parse_args():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--tickets", type=int, default=20_000)
+    parser.add_argument("--scans", type=int, default=2_000, help="scans per gate")
+    parser.add_argument("--false-positive-rate", type=float, default=0.01)
+    parser.add_argument("--seed", type=int, default=None)
+    return parser.parse_args()
+
+
+def prepare(app, ticket_count: int):
+    users = {}
+    for role in (UserRole.ORGANIZER, UserRole.STAFF, UserRole.CLIENT):
+        users[role] = app.create_user_use_case.execute(
+            CreateUserInputDto(
+                name=f"Gate {role.value.title()}",
+                email=f"{role.value.lower()}@gate.local",
+                password="123456",
+                role=role,
+            )
+        )
+    now = datetime.now(UTC)
+    event = app.create_event_use_case.create_event(
+        CreateEventInputDto(
+            name="Offline Gate Event",
+            start_date=now + timedelta(days=1),
+            end_date=now + timedelta(days=1, hours=8),
+            location="Remote Field",
+            max_tickets=ticket_count,
+            organizer_id=users[UserRole.ORGANIZER].id,
+        )
+    )
+    app.add_event_staff_use_case.execute(
+        AddEventStaffInputDto(event.id, users[UserRole.STAFF].email)
+    )
+    codes = list({generate_code() for _ in range(ticket_count)})
+    app.ticket_repo.redeem_many(
+        event.id,
+        [
+            Ticket.create(
+                event.id, users[UserRole.CLIENT].id, code, TicketStatus.PENDING, now
+            )
+            for code in codes
+        ],
+    )
+    return event, users[UserRole.STAFF], codes
+
+
+def gate_codes(rng, codes, shared, scans):
+    """Mostly valid codes, a few unknown ones and a few repeats."""
+    picked = rng.sample(codes, scans) + shared
+    picked += [generate_code() for _ in range(scans // 20)]
+    picked += rng.sample(picked, scans // 50)
+    rng.shuffle(picked)
+    return picked
+
+
+def scan_all(validator, codes):
+    latencies, statuses = [], {}
+    for code in codes:
+        started_at = time.perf_counter_ns()
+        result = validator.scan(code)
+        latencies.append(time.perf_counter_ns() - started_at)
+        statuses[result.status.value] = statuses.get(result.status.value, 0) + 1
+    latencies.sort()
+    return latencies, statuses
+
+
+def main():
+    args = parse_args()
+    rng = random.Random(args.seed)
+    workdir = tempfile.mkdtemp()
+    app = build_application(os.path.join(workdir, "offline_gate.db"))
+    try:
+        event, staff, codes = prepare(app, args.tickets)
+        snapshot_path = os.path.join(workdir, "gate.snapshot")
+        info = app.export_offline_snapshot_use_case.execute(
+            ExportOfflineSnapshotInputDto(
+                staff.id, staff.role, snapshot_path, args.false_positive_rate
+            )
+        )
+        print(
+            f"Snapshot: {info.code_count:,} codes for events {info.event_ids}, "
+            f"{info.size_bytes:,} bytes ({info.size_bytes / max(1, info.code_count):.1f} "
+            f"bytes/code) at {info.path}"
+        )
+
+        in_window = event.start_date + timedelta(hours=1)
+        shared = rng.sample(codes, max(1, args.scans // 50))
+        logs = {}
+        with OfflineSnapshot(snapshot_path) as snapshot:
+            for device in ("gate-a", "gate-b"):
+                logs[device] = os.path.join(workdir, f"{device}.jsonl")
+                clock_start = time.perf_counter()
+                with OfflineGateValidator(
+                    snapshot,
+                    device,
+                    logs[device],
+                    clock=lambda s=clock_start: in_window
+                    + timedelta(seconds=time.perf_counter() - s),
+                ) as validator:
+                    scanned = gate_codes(rng, codes, shared, args.scans)
+                    latencies, statuses = scan_all(validator, scanned)
+                print(
+                    f"{device}: {len(scanned):,} scans, p50 "
+                    f"{latencies[len(latencies) // 2] / 1000:.1f} us, p99 "
+                    f"{latencies[int(len(latencies) * 0.99)] / 1000:.1f} us, {statuses}"
+                )
+
+        scans = [scan for path in logs.values() for scan in read_scan_log(path)]
+        # One of the offline-scanned tickets was validated online meanwhile.
+        online = scans[0].code
+        app.ticket_repo.mark_validated_many([app.ticket_repo.get_by_code(online).id])
+
+        started_at = time.perf_counter()
+        output = app.reconcile_offline_scans_use_case.execute(
+            ReconcileOfflineScansInputDto(staff.id, staff.role, scans)
+        )
+        elapsed = time.perf_counter() - started_at
+        print(
+            f"Reconciled {len(scans):,} scans in {elapsed * 1000:.1f} ms: "
+            f"{len(output.validated):,} validated, {len(output.conflicts):,} "
+            f"conflicts, {len(output.rejected):,} rejected"
+        )
+
+        unique = {scan.code for scan in scans}
+        with app.db.connect() as conn:
+            validated_rows = conn.execute(
+                "SELECT COUNT(*) FROM tickets WHERE event_id = ? AND status = ?",
+                (event.id, TicketStatus.VALIDATED.value),
+            ).fetchone()[0]
+        print(f"{validated_rows:,} tickets validated for {len(unique):,} scanned codes")
+        ok = (
+            validated_rows == len(unique)
+            and len(output.validated) == len(unique) - 1
+            and len(output.conflicts) == len(scans) - len(unique) + 1
+            and not output.rejected
+        )
+    finally:
+        app.close()
+
+    print("OK: every ticket validated once" if ok else "FAILED")
+    return 0 if ok else 1
+
+
+if __name__ == "__main__":
+    exit(main())
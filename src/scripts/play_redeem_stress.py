@@ -0,0 +1,232 @@
+#!/usr/bin/env python3
+"""
+Stress test for ticket redemption under concurrent buyers.
+
+Many threads (optionally spread over several processes, each with its own
+connection pool) hammer RedeemTicketUseCase on one event until it sells out,
+then the database is checked for oversell: tickets_redeemed must never exceed
+max_tickets and must match the number of ticket rows.
+
+    PYTHONPATH=src python src/scripts/play_redeem_stress.py --buyers 64 --processes 4
+"""
+
+import argparse
+import multiprocessing
+import os
+import random
+import sys
+import tempfile
+import threading
+import time
+from datetime import UTC, datetime, timedelta
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+
+from event.application.create_event_use_case import CreateEventInputDto
+from event.domain.errors import EventHasNoTicketsAvailableError
+from shared.composition_root import build_application
+from ticket.application.dtos import RedeemTicketInputDto
+from user.application.create_user_use_case import CreateUserInputDto
+from user.domain.user_role import UserRole
+
+
+def parse_args():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--buyers", type=int, default=32, help="threads per process")
+    parser.add_argument("--processes", type=int, default=1)
+    parser.add_argument("--max-tickets", type=int, default=1000)
+    parser.add_argument("--max-per-order", type=int, default=4)
+    parser.add_argument("--db", help="database file (default: a temporary file)")
+    parser.add_argument("--seed", type=int, default=None)
+    return parser.parse_args()
+
+
+def prepare_event(db_path: str, max_tickets: int) -> tuple[int, list[int]]:
+    app = build_application(db_path)
+    try:
+        suffix = time.time_ns()
+        organizer = app.create_user_use_case.execute(
+            CreateUserInputDto(
+                name="Stress Organizer",
+                email=f"organizer-{suffix}@stress.local",
+                password="123456",
+                role=UserRole.ORGANIZER,
+            )
+        )
+        clients = [
+            app.create_user_use_case.execute(
+                CreateUserInputDto(
+                    name=f"Stress Client {i}",
+                    email=f"client-{suffix}-{i}@stress.local",
+                    password="123456",
+                    role=UserRole.CLIENT,
+                )
+            )
+            for i in range(20)
+        ]
+        now = datetime.now(UTC)
+        event = app.create_event_use_case.create_event(
+            CreateEventInputDto(
+                name="Stress Event",
+                start_date=now + timedelta(days=1),
+                end_date=now + timedelta(days=2),
+                location="Stress Hall",
+                max_tickets=max_tickets,
+                organizer_id=organizer.id,
+            )
+        )
+        return event.id, [client.id for client in clients]
+    finally:
+        app.close()
+
+
+def buyer(app, event_id, client_ids, max_per_order, rng, stats, lock):
+    orders = tickets = rejected = errors = 0
+    latencies = []
+    while True:
+        count = rng.randint(1, max_per_order)
+        started_at = time.perf_counter()
+        try:
+            app.redeem_ticket_use_case.redeem_ticket(
+                RedeemTicketInputDto(
+                    event_id=event_id,
+                    client_id=rng.choice(client_ids),
+                    redeem_ticket_count=count,
+                )
+            )
+        except EventHasNoTicketsAvailableError:
+            rejected += 1
+            if count == 1:
+                break
+            continue
+        except Exception:
+            errors += 1
+            continue
+        finally:
+            latencies.append(time.perf_counter() - started_at)
+        orders += 1
+        tickets += count
+
+    with lock:
+        stats["orders"] += orders
+        stats["tickets"] += tickets
+        stats["rejected"] += rejected
+        stats["errors"] += errors
+        stats["latencies"].extend(latencies)
+
+
+def run_process(db_path, event_id, client_ids, buyers, max_per_order, seed):
+    app = build_application(db_path, db_pool_size=buyers)
+    stats = {"orders": 0, "tickets": 0, "rejected": 0, "errors": 0, "latencies": []}
+    lock = threading.Lock()
+    threads = [
+        threading.Thread(
+            target=buyer,
+            args=(
+                app,
+                event_id,
+                client_ids,
+                max_per_order,
+                random.Random(None if seed is None else seed + i),
+                stats,
+                lock,
+            ),
+        )
+        for i in range(buyers)
+    ]
+    try:
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+    finally:
+        app.close()
+    return stats
+
+
+def check_oversell(db_path: str, event_id: int) -> tuple[int, int, int]:
+    app = build_application(db_path)
+    try:
+        with app.db.connect() as conn:
+            max_tickets, tickets_redeemed = conn.execute(
+                "SELECT max_tickets, tickets_redeemed FROM events WHERE id = ?",
+                (event_id,),
+            ).fetchone()
+            ticket_rows = conn.execute(
+                "SELECT COUNT(*) FROM tickets WHERE event_id = ?", (event_id,)
+            ).fetchone()[0]
+    finally:
+        app.close()
+    return max_tickets, tickets_redeemed, ticket_rows
+
+
+def main():
+    args = parse_args()
+    db_path = args.db or os.path.join(tempfile.mkdtemp(), "redeem_stress.db")
+
+    event_id, client_ids = prepare_event(db_path, args.max_tickets)
+    print(
+        f"Event {event_id}: {args.max_tickets} tickets, "
+        f"{args.processes} process(es) x {args.buyers} buyers, db at {db_path}"
+    )
+
+    started_at = time.perf_counter()
+    jobs = [
+        (
+            db_path,
+            event_id,
+            client_ids,
+            args.buyers,
+            args.max_per_order,
+            None if args.seed is None else args.seed + p * args.buyers,
+        )
+        for p in range(args.processes)
+    ]
+    if args.processes == 1:
+        results = [run_process(*jobs[0])]
+    else:
+        with multiprocessing.get_context("spawn").Pool(args.processes) as pool:
+            results = pool.starmap(run_process, jobs)
+    elapsed = time.perf_counter() - started_at
+
+    orders = sum(r["orders"] for r in results)
+    tickets = sum(r["tickets"] for r in results)
+    rejected = sum(r["rejected"] for r in results)
+    errors = sum(r["errors"] for r in results)
+    latencies = sorted(latency for r in results for latency in r["latencies"])
+
+    max_tickets, tickets_redeemed, ticket_rows = check_oversell(db_path, event_id)
+
+    attempts = orders + rejected + errors
+    print(f"Attempts: {attempts} in {elapsed:.2f}s ({attempts / elapsed:.0f}/s)")
+    print(
+        f"Orders: {orders} ({tickets} tickets), rejected: {rejected}, errors: {errors}"
+    )
+    if latencies:
+        p50 = latencies[len(latencies) // 2] * 1000
+        p99 = latencies[min(len(latencies) - 1, int(len(latencies) * 0.99))] * 1000
+        print(f"Latency: p50 {p50:.2f} ms, p99 {p99:.2f} ms")
+    print(
+        f"max_tickets={max_tickets} tickets_redeemed={tickets_redeemed} "
+        f"ticket_rows={ticket_rows} sold_by_buyers={tickets}"
+    )
+
+    failures = []
+    if tickets_redeemed > max_tickets:
+        failures.append(f"oversold by {tickets_redeemed - max_tickets}")
+    if tickets_redeemed != ticket_rows:
+        failures.append("counter does not match ticket rows")
+    if tickets_redeemed != tickets:
+        failures.append("counter does not match successful orders")
+    if tickets_redeemed != max_tickets:
+        failures.append("event did not sell out")
+
+    if failures:
+        print("FAIL: " + "; ".join(failures))
+        return 1
+    print("OK: zero oversell")
+    return 0
+
+
+if __name__ == "__main__":
+    exit(main())
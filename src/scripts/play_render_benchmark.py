@@ -0,0 +1,64 @@
+#!/usr/bin/env python3
+"""
+Render-throughput benchmark for HtmlTemplateEngine.
+
+Renders the ticket confirmation template N times with the compiled-template
+cache disabled (one file read per render, as before) and enabled, and prints
+renders per second for each.
+
+    PYTHONPATH=src python src/scripts/play_render_benchmark.py --renders 20000
+"""
+
+import argparse
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+
+from shared.infra.html_template.html_template_engine import HtmlTemplateEngine
+
+TEMPLATES_DIR = os.path.join(
+    os.path.dirname(__file__), "..", "..", "assets", "html_templates"
+)
+
+
+def parse_args():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--renders", type=int, default=20000)
+    parser.add_argument("--template", default="redeem_ticket.html")
+    parser.add_argument("--repeat", type=int, default=3)
+    return parser.parse_args()
+
+
+def measure(engine: HtmlTemplateEngine, template: str, renders: int) -> float:
+    started_at = time.perf_counter()
+    for i in range(renders):
+        engine.render(
+            template, {"user_name": f"Client {i}", "ticket_code": "ABC234<br>XYZ789"}
+        )
+    return renders / (time.perf_counter() - started_at)
+
+
+def main():
+    args = parse_args()
+    engines = {
+        "uncached": HtmlTemplateEngine(TEMPLATES_DIR, max_cached=0),
+        "cached": HtmlTemplateEngine(TEMPLATES_DIR, preload=True),
+    }
+
+    results = {}
+    for label, engine in engines.items():
+        best = max(
+            measure(engine, args.template, args.renders) for _ in range(args.repeat)
+        )
+        results[label] = best
+        print(f"{label:>9}: {best:>12,.0f} renders/s")
+
+    print(f"  speedup: {results['cached'] / results['uncached']:.1f}x")
+    print(f"    cache: {engines['cached'].cache_info()}")
+    return 0
+
+
+if __name__ == "__main__":
+    exit(main())
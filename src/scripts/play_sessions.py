@@ -0,0 +1,114 @@
+#!/usr/bin/env python3
+"""
+Login versus session restore latency.
+
+Logs --sessions clients of an existing database in (generate one with
+play_generate_data.py first; every generated password is 123456), then
+times a password login, a restore that reads the sessions table and a
+restore served from the in-memory cache, and checks that a revoked token
+is refused.
+
+    PYTHONPATH=src python src/scripts/play_generate_data.py --fresh --users 100000
+    PYTHONPATH=src python src/scripts/play_sessions.py --sessions 2000
+"""
+
+import argparse
+import os
+import random
+import sys
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+
+from shared.composition_root import build_application
+from user.application.authenticate_user_use_case import AuthenticateUserInputDto
+from user.application.end_session_use_case import EndSessionInputDto
+from user.application.errors import InvalidSessionError
+from user.application.restore_session_use_case import RestoreSessionInputDto
+from user.domain.user_role import UserRole
+
+
+def parse_args():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--db", default=None, help="default: data/app.db")
+    parser.add_argument("--sessions", type=int, default=1_000)
+    parser.add_argument("--seed", type=int, default=None)
+    return parser.parse_args()
+
+
+def timed(label, calls):
+    latencies = []
+    results = []
+    for call in calls:
+        started_at = time.perf_counter_ns()
+        results.append(call())
+        latencies.append(time.perf_counter_ns() - started_at)
+    latencies.sort()
+    print(
+        f"  {label:<20} p50 {latencies[len(latencies) // 2] / 1000:8.1f} us   "
+        f"p99 {latencies[int(len(latencies) * 0.99)] / 1000:8.1f} us"
+    )
+    return results
+
+
+def main():
+    args = parse_args()
+    rng = random.Random(args.seed)
+    app = build_application(db_path=args.db)
+    try:
+        with app.db.connect() as conn:
+            emails = [
+                row[0]
+                for row in conn.execute(
+                    "SELECT email FROM users WHERE role = 'CLIENT' "
+                    "AND email LIKE 'client%@email.com'"
+                )
+            ]
+        if not emails:
+            print("No generated clients; run play_generate_data.py first")
+            return 1
+        emails = rng.sample(emails, min(args.sessions, len(emails)))
+
+        store = app.session_store
+        print(
+            f"{len(emails):,} clients, session TTL {store.ttl_seconds:,.0f} s, "
+            f"cache size {store.max_entries:,}"
+        )
+        start = app.start_session_use_case
+        restore = app.restore_session_use_case
+        sessions = timed(
+            "login (password)",
+            [
+                lambda email=email: start.execute(
+                    AuthenticateUserInputDto(email, "123456", UserRole.CLIENT)
+                )
+                for email in emails
+            ],
+        )
+        calls = [
+            lambda token=session.token: restore.execute(RestoreSessionInputDto(token))
+            for session in sessions
+        ]
+        store.clear()
+        timed("restore (database)", calls)
+        # The last max_entries tokens restored are the ones still cached.
+        timed("restore (cache)", calls[len(calls) - store.max_entries :])
+        print(f"  {store.cache_info()}")
+
+        app.end_session_use_case.execute(EndSessionInputDto(sessions[0].token))
+        try:
+            restore.execute(RestoreSessionInputDto(sessions[0].token))
+        except InvalidSessionError:
+            print("Revoked token refused")
+        else:
+            print("Revoked token was accepted")
+            return 1
+        for session in sessions[1:]:
+            app.end_session_use_case.execute(EndSessionInputDto(session.token))
+    finally:
+        app.close()
+    return 0
+
+
+if __name__ == "__main__":
+    exit(main())
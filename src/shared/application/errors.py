@@ -0,0 +1,8 @@
+class AppError(Exception):
+    """Base class for shared application errors."""
+
+
+class InvalidCursorError(AppError):
+    def __init__(self, cursor: str) -> None:
+        message = f'Invalid page cursor: "{cursor}".'
+        super().__init__(message)
@@ -0,0 +1,103 @@
+from __future__ import annotations
+
+import threading
+import time
+from collections import OrderedDict
+from collections.abc import Callable, Hashable
+from dataclasses import dataclass
+from enum import Enum
+from typing import TypeVar
+
+T = TypeVar("T")
+
+
+class PageCacheScope(str, Enum):
+    """Group of list pages that the same write use cases invalidate."""
+
+    EVENTS = "EVENTS"
+    STAFFS = "STAFFS"
+    FRIENDSHIPS = "FRIENDSHIPS"
+    FRIENDS_ATTENDING = "FRIENDS_ATTENDING"
+
+
+@dataclass(frozen=True)
+class PageCacheInfo:
+    hits: int
+    misses: int
+    size: int
+    max_entries: int
+
+
+class PageCache:
+    """Bounded LRU of list pages keyed by ``(scope, query)``.
+
+    ``query`` is the list use case's frozen input DTO, so the screen, filter,
+    page and cursor are all part of the key. Write use cases call
+    ``invalidate`` with the scopes they change. Entries also expire after
+    ``ttl_seconds`` so changes made outside this process (scripts, another
+    instance) show up eventually.
+    """
+
+    def __init__(self, max_entries: int = 256, ttl_seconds: float = 30.0) -> None:
+        self.max_entries = max_entries
+        self.ttl_seconds = ttl_seconds
+        self._entries: OrderedDict[tuple[PageCacheScope, Hashable], tuple] = (
+            OrderedDict()
+        )
+        self._generations: dict[PageCacheScope, int] = dict.fromkeys(PageCacheScope, 0)
+        self._lock = threading.Lock()
+        self._hits = 0
+        self._misses = 0
+
+    def get_or_load(
+        self, scope: PageCacheScope, query: Hashable, loader: Callable[[], T]
+    ) -> T:
+        key = (scope, query)
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                value, generation, stored_at = entry
+                fresh = time.monotonic() - stored_at < self.ttl_seconds
+                if fresh and generation == self._generations[scope]:
+                    self._entries.move_to_end(key)
+                    self._hits += 1
+                    return value
+                del self._entries[key]
+            self._misses += 1
+            generation = self._generations[scope]
+
+        value = loader()
+
+        with self._lock:
+            # A write that landed while the page was loading may not be in it.
+            if generation == self._generations[scope] and self.max_entries > 0:
+                self._entries[key] = (value, generation, time.monotonic())
+                self._entries.move_to_end(key)
+                while len(self._entries) > self.max_entries:
+                    self._entries.popitem(last=False)
+        return value
+
+    def invalidate(self, *scopes: PageCacheScope) -> None:
+        with self._lock:
+            for scope in scopes:
+                self._generations[scope] += 1
+            self._entries = OrderedDict(
+                (key, entry)
+                for key, entry in self._entries.items()
+                if key[0] not in scopes
+            )
+
+    def clear(self) -> None:
+        with self._lock:
+            for scope in self._generations:
+                self._generations[scope] += 1
+            self._entries.clear()
+
+    def cache_info(self) -> PageCacheInfo:
+        with self._lock:
+            return PageCacheInfo(
+                hits=self._hits,
+                misses=self._misses,
+                size=len(self._entries),
+                max_entries=self.max_entries,
+            )
@@ -0,0 +1,50 @@
+from __future__ import annotations
+
+import base64
+import binascii
+import json
+from dataclasses import dataclass
+from enum import Enum
+
+from shared.application.errors import InvalidCursorError
+
+
+class CursorDirection(str, Enum):
+    AFTER = "AFTER"
+    BEFORE = "BEFORE"
+
+
+@dataclass(frozen=True)
+class PageCursor:
+    """Keyset position used instead of OFFSET when paging Next/Previous."""
+
+    direction: CursorDirection
+    id: int
+
+    def encode(self) -> str:
+        payload = json.dumps({"d": self.direction.value, "id": self.id})
+        return base64.urlsafe_b64encode(payload.encode("utf-8")).decode("ascii")
+
+    @staticmethod
+    def decode(token: str) -> PageCursor:
+        try:
+            payload = json.loads(base64.urlsafe_b64decode(token.encode("ascii")))
+            return PageCursor(
+                direction=CursorDirection(payload["d"]), id=int(payload["id"])
+            )
+        except (
+            binascii.Error,
+            UnicodeError,
+            ValueError,
+            KeyError,
+            TypeError,
+        ) as e:
+            raise InvalidCursorError(token) from e
+
+    @staticmethod
+    def after(id: int) -> PageCursor:
+        return PageCursor(direction=CursorDirection.AFTER, id=id)
+
+    @staticmethod
+    def before(id: int) -> PageCursor:
+        return PageCursor(direction=CursorDirection.BEFORE, id=id)
@@ -1,126 +1,424 @@
 from __future__ import annotations
 
 import os
-from dataclasses import dataclass
-
-from event.application.create_event_use_case import CreateEventUseCase
-from event.application.delete_event_use_case import DeleteEventUseCase
-from event.application.list_event_use_case import ListEventUseCase
-from event.application.list_staffs_with_email_and_name_use_case import (
-    ListStaffWithEmailAndNameUseCase,
-)
-from event.application.update_event_use_case import UpdateEventUseCase
-from event.infra.persistence.sqlite_event_repository import SqliteEventRepository
-from friendship.application.accept_friendship_invite_use_case import (
-    AcceptFriendshipInviteUseCase,
-)
-from friendship.application.delete_friendship_use_case import DeleteFriendshipUseCase
-from friendship.application.list_friendships_with_user_email_and_name_use_case import (
-    ListFriendshipsWithUserEmailAndNameUseCase,
-)
-from friendship.application.send_friendship_invite_use_case import (
-    SendFriendshipInviteUseCase,
-)
-from friendship.infra.persistence.sqlite_friendship_repository import (
-    SqliteFriendshipRepository,
-)
-from shared.infra.email.smtp_ticket_email_service import SmtpEmailService
-from shared.infra.html_template.html_template_engine import HtmlTemplateEngine
-from shared.infra.persistence.sqlite import SQLiteDatabase
-from ticket.application.redeem_ticket_use_case import RedeemTicketUseCase
-from ticket.application.validate_ticket_use_case import ValidateTicketUseCase
-from ticket.infra.persistence.sqlite_ticket_repository import (
-    SqliteTicketsRepository,
-)
-from user.application.authenticate_user_use_case import AuthenticateUserUseCase
-from user.application.create_user_use_case import CreateUserUseCase
-from user.infra.persistence.sqlite_users_repository import SqliteUsersRepository
-
-
-@dataclass
-class CompositionRoot:
-    db: SQLiteDatabase
-    friendship_repo: SqliteFriendshipRepository
-    send_friendship_invite_use_case: SendFriendshipInviteUseCase
-    accept_friendship_invite_use_case: AcceptFriendshipInviteUseCase
-    delete_friendship_use_case: DeleteFriendshipUseCase
-    list_friendships_use_case: ListFriendshipsWithUserEmailAndNameUseCase
-    user_repo: SqliteUsersRepository
-    create_user_use_case: CreateUserUseCase
-    authenticate_user_use_case: AuthenticateUserUseCase
-    validate_ticket_use_case: ValidateTicketUseCase
-    list_event_use_case: ListEventUseCase
-    create_event_use_case: CreateEventUseCase
-    delete_event_use_case: DeleteEventUseCase
-    update_event_use_case: UpdateEventUseCase
-    list_staffs_use_case: ListStaffWithEmailAndNameUseCase
-    event_repo: SqliteEventRepository
-    ticket_repo: SqliteTicketsRepository
-    redeem_ticket_use_case: RedeemTicketUseCase
-    html_template_engine: HtmlTemplateEngine
-    smtp_email_service: SmtpEmailService
-
-
-def build_application(db_path: str | None = None) -> CompositionRoot:
-    db = SQLiteDatabase(path=db_path)
-    db.initialize()
-
-    # Services
-    templates_dir = os.path.join("assets", "html_templates")
-    html_template_engine = HtmlTemplateEngine(templates_dir)
-    smtp_email_service = SmtpEmailService()
+import threading
+import time
+from collections.abc import Callable
+from typing import TYPE_CHECKING, Any
 
-    # Repositories
-    friendship_repo = SqliteFriendshipRepository(db)
-    user_repo = SqliteUsersRepository(db)
-    event_repo = SqliteEventRepository(db)
-    ticket_repo = SqliteTicketsRepository(db)
+from shared.infra.startup_profiler import get_startup_profiler
 
-    # Use Cases
-    send_friendship_invite_use_case = SendFriendshipInviteUseCase(
-        friendship_repo, user_repo
+if TYPE_CHECKING:
+    from event.application.add_event_staff_use_case import AddEventStaffUseCase
+    from event.application.create_event_use_case import CreateEventUseCase
+    from event.application.delete_event_use_case import DeleteEventUseCase
+    from event.application.list_event_use_case import ListEventUseCase
+    from event.application.list_staffs_with_email_and_name_use_case import (
+        ListStaffWithEmailAndNameUseCase,
     )
-    accept_friendship_invite_use_case = AcceptFriendshipInviteUseCase(friendship_repo)
-    delete_friendship_use_case = DeleteFriendshipUseCase(friendship_repo)
-    list_friendships_use_case = ListFriendshipsWithUserEmailAndNameUseCase(
-        friendship_repo
+    from event.application.remove_event_staff_use_case import (
+        RemoveEventStaffUseCase,
     )
-    create_user_use_case = CreateUserUseCase(user_repo)
-    authenticate_user_use_case = AuthenticateUserUseCase(user_repo)
-    validate_ticket_use_case = ValidateTicketUseCase(ticket_repo, event_repo)
-    create_event_use_case = CreateEventUseCase(event_repo)
-    delete_event_use_case = DeleteEventUseCase(event_repo, user_repo)
-    update_event_use_case = UpdateEventUseCase(event_repo, user_repo)
-    list_event_use_case = ListEventUseCase(event_repo)
-    list_staffs_use_case = ListStaffWithEmailAndNameUseCase(user_repo)
-
-    redeem_ticket_use_case = RedeemTicketUseCase(
-        tickets_repository=ticket_repo,
-        events_repository=event_repo,
-        users_repository=user_repo,
-        email_service=smtp_email_service,
-        template_engine=html_template_engine,
+    from event.application.update_event_use_case import UpdateEventUseCase
+    from event.infra.persistence.sqlite_event_repository import (
+        SqliteEventRepository,
     )
-
-    return CompositionRoot(
-        db=db,
-        friendship_repo=friendship_repo,
-        send_friendship_invite_use_case=send_friendship_invite_use_case,
-        accept_friendship_invite_use_case=accept_friendship_invite_use_case,
-        delete_friendship_use_case=delete_friendship_use_case,
-        list_friendships_use_case=list_friendships_use_case,
-        user_repo=user_repo,
-        create_user_use_case=create_user_use_case,
-        authenticate_user_use_case=authenticate_user_use_case,
-        create_event_use_case=create_event_use_case,
-        delete_event_use_case=delete_event_use_case,
-        update_event_use_case=update_event_use_case,
-        validate_ticket_use_case=validate_ticket_use_case,
-        list_event_use_case=list_event_use_case,
-        list_staffs_use_case=list_staffs_use_case,
-        event_repo=event_repo,
-        ticket_repo=ticket_repo,
-        redeem_ticket_use_case=redeem_ticket_use_case,
-        html_template_engine=html_template_engine,
-        smtp_email_service=smtp_email_service,
+    from friendship.application.accept_friendship_invite_use_case import (
+        AcceptFriendshipInviteUseCase,
+    )
+    from friendship.application.delete_friendship_use_case import (
+        DeleteFriendshipUseCase,
+    )
+    from friendship.application.friendship_graph import FriendshipGraph
+    from friendship.application.list_friendships_with_user_email_and_name_use_case import (
+        ListFriendshipsWithUserEmailAndNameUseCase,
+    )
+    from friendship.application.send_friendship_invite_use_case import (
+        SendFriendshipInviteUseCase,
     )
+    from friendship.infra.persistence.sqlite_friendship_repository import (
+        SqliteFriendshipRepository,
+    )
+    from shared.application.page_cache import PageCache
+    from shared.infra.email.email_outbox import EmailOutbox
+    from shared.infra.email.smtp_ticket_email_service import SmtpEmailService
+    from shared.infra.html_template.html_template_engine import HtmlTemplateEngine
+    from shared.infra.persistence.sqlite import SQLiteDatabase
+    from ticket.application.count_friends_attending_use_case import (
+        CountFriendsAttendingUseCase,
+    )
+    from ticket.application.export_offline_snapshot_use_case import (
+        ExportOfflineSnapshotUseCase,
+    )
+    from ticket.application.reconcile_offline_scans_use_case import (
+        ReconcileOfflineScansUseCase,
+    )
+    from ticket.application.redeem_ticket_use_case import RedeemTicketUseCase
+    from ticket.application.validate_ticket_use_case import ValidateTicketUseCase
+    from ticket.infra.persistence.sqlite_ticket_repository import (
+        SqliteTicketsRepository,
+    )
+    from ticket.infra.ticket_code_allocator import TicketCodeAllocator
+    from user.application.authenticate_user_use_case import AuthenticateUserUseCase
+    from user.application.create_user_use_case import CreateUserUseCase
+    from user.application.end_session_use_case import EndSessionUseCase
+    from user.application.restore_session_use_case import RestoreSessionUseCase
+    from user.application.session_store import SessionStore
+    from user.application.start_session_use_case import StartSessionUseCase
+    from user.infra.persistence.sqlite_users_repository import SqliteUsersRepository
+    from user.infra.session_token_file import SessionTokenFile
+
+
+class _provider:
+    """Builds the attribute on first access and caches it on the instance.
+
+    The factory runs under the root's lock, so two threads (e.g. a table
+    loading in the background and the GUI thread) never build it twice.
+    """
+
+    def __init__(self, factory: Callable[[CompositionRoot], Any]) -> None:
+        self._factory = factory
+        self._name = factory.__name__
+        self.__doc__ = factory.__doc__
+
+    def __set_name__(self, owner: type, name: str) -> None:
+        self._name = name
+
+    def __get__(self, instance: CompositionRoot | None, owner: type) -> Any:
+        if instance is None:
+            return self
+        with instance._lock:
+            if self._name not in instance.__dict__:
+                started_at = time.perf_counter()
+                instance.__dict__[self._name] = self._factory(instance)
+                get_startup_profiler().record_provider(
+                    self._name, time.perf_counter() - started_at
+                )
+        return instance.__dict__[self._name]
+
+
+class CompositionRoot:
+    """Lazily wired application services.
+
+    Nothing is imported or built until a screen first asks for it, so the
+    login window does not wait for SMTP, templates or the ticket code pool.
+    Background workers start together with their provider.
+    """
+
+    def __init__(self, db_path: str | None = None, db_pool_size: int = 5) -> None:
+        self._db_path = db_path
+        self._db_pool_size = db_pool_size
+        self._lock = threading.RLock()
+
+    def is_built(self, name: str) -> bool:
+        return name in self.__dict__
+
+    def close(self) -> None:
+        """Stop background workers that were started, then release the database."""
+        if self.is_built("email_outbox"):
+            self.email_outbox.stop()
+        if self.is_built("smtp_email_service"):
+            self.smtp_email_service.close()
+        if self.is_built("ticket_code_allocator"):
+            self.ticket_code_allocator.stop()
+        if self.is_built("db"):
+            self.db.close()
+
+    # Infrastructure
+
+    @_provider
+    def db(self) -> SQLiteDatabase:
+        from shared.infra.persistence.sqlite import SQLiteDatabase
+
+        db = SQLiteDatabase(path=self._db_path, pool_size=self._db_pool_size)
+        db.initialize()
+        return db
+
+    @_provider
+    def html_template_engine(self) -> HtmlTemplateEngine:
+        from shared.infra.html_template.html_template_engine import (
+            HtmlTemplateEngine,
+        )
+
+        templates_dir = os.path.join("assets", "html_templates")
+        return HtmlTemplateEngine(templates_dir, preload=True)
+
+    @_provider
+    def smtp_email_service(self) -> SmtpEmailService:
+        from shared.infra.email.smtp_ticket_email_service import SmtpEmailService
+
+        return SmtpEmailService()
+
+    @_provider
+    def email_outbox(self) -> EmailOutbox:
+        from shared.infra.email.email_outbox import EmailOutbox
+        from shared.infra.email.sqlite_email_outbox_repository import (
+            SqliteEmailOutboxRepository,
+        )
+
+        email_outbox = EmailOutbox(
+            SqliteEmailOutboxRepository(self.db), self.smtp_email_service
+        )
+        email_outbox.start()
+        return email_outbox
+
+    @_provider
+    def ticket_code_allocator(self) -> TicketCodeAllocator:
+        from ticket.infra.persistence.sqlite_ticket_code_pool_repository import (
+            SqliteTicketCodePoolRepository,
+        )
+        from ticket.infra.ticket_code_allocator import TicketCodeAllocator
+
+        ticket_code_allocator = TicketCodeAllocator(
+            SqliteTicketCodePoolRepository(self.db)
+        )
+        ticket_code_allocator.start()
+        return ticket_code_allocator
+
+    @_provider
+    def page_cache(self) -> PageCache:
+        """Pages already shown by the list screens; write use cases invalidate
+        them."""
+        from shared.application.page_cache import PageCache
+
+        return PageCache()
+
+    @_provider
+    def friendship_graph(self) -> FriendshipGraph:
+        """Accepted friendships in memory; loads itself on the first query."""
+        from friendship.application.friendship_graph import FriendshipGraph
+
+        return FriendshipGraph(self.friendship_repo)
+
+    @_provider
+    def session_store(self) -> SessionStore:
+        """Login sessions; SESSION_TTL_SECONDS and SESSION_CACHE_SIZE tune it."""
+        from dotenv import load_dotenv
+
+        from user.application.session_store import SessionStore
+        from user.infra.persistence.sqlite_session_repository import (
+            SqliteSessionRepository,
+        )
+
+        load_dotenv()
+        return SessionStore(
+            SqliteSessionRepository(self.db),
+            ttl_seconds=float(os.getenv("SESSION_TTL_SECONDS", 7 * 24 * 3600)),
+            max_entries=int(os.getenv("SESSION_CACHE_SIZE", 1024)),
+        )
+
+    @_provider
+    def session_token_file(self) -> SessionTokenFile:
+        """Where the login screen keeps its token between launches: next to the
+        database."""
+        from user.infra.session_token_file import SessionTokenFile
+
+        # abspath first: a bare filename has no directory part of its own.
+        db_dir = (
+            os.path.dirname(os.path.abspath(self._db_path)) if self._db_path else "data"
+        )
+        return SessionTokenFile(os.path.join(db_dir, "session.token"))
+
+    # Repositories
+
+    @_provider
+    def friendship_repo(self) -> SqliteFriendshipRepository:
+        from friendship.infra.persistence.sqlite_friendship_repository import (
+            SqliteFriendshipRepository,
+        )
+
+        return SqliteFriendshipRepository(self.db)
+
+    @_provider
+    def user_repo(self) -> SqliteUsersRepository:
+        from user.infra.persistence.sqlite_users_repository import (
+            SqliteUsersRepository,
+        )
+
+        return SqliteUsersRepository(self.db)
+
+    @_provider
+    def event_repo(self) -> SqliteEventRepository:
+        from event.infra.persistence.sqlite_event_repository import (
+            SqliteEventRepository,
+        )
+
+        return SqliteEventRepository(self.db)
+
+    @_provider
+    def ticket_repo(self) -> SqliteTicketsRepository:
+        from ticket.infra.persistence.sqlite_ticket_repository import (
+            SqliteTicketsRepository,
+        )
+
+        return SqliteTicketsRepository(self.db)
+
+    # Use Cases
+
+    @_provider
+    def send_friendship_invite_use_case(self) -> SendFriendshipInviteUseCase:
+        from friendship.application.send_friendship_invite_use_case import (
+            SendFriendshipInviteUseCase,
+        )
+
+        return SendFriendshipInviteUseCase(
+            self.friendship_repo, self.user_repo, self.page_cache
+        )
+
+    @_provider
+    def accept_friendship_invite_use_case(self) -> AcceptFriendshipInviteUseCase:
+        from friendship.application.accept_friendship_invite_use_case import (
+            AcceptFriendshipInviteUseCase,
+        )
+
+        return AcceptFriendshipInviteUseCase(
+            self.friendship_repo, self.page_cache, self.friendship_graph
+        )
+
+    @_provider
+    def delete_friendship_use_case(self) -> DeleteFriendshipUseCase:
+        from friendship.application.delete_friendship_use_case import (
+            DeleteFriendshipUseCase,
+        )
+
+        return DeleteFriendshipUseCase(
+            self.friendship_repo, self.page_cache, self.friendship_graph
+        )
+
+    @_provider
+    def list_friendships_use_case(self) -> ListFriendshipsWithUserEmailAndNameUseCase:
+        from friendship.application.list_friendships_with_user_email_and_name_use_case import (
+            ListFriendshipsWithUserEmailAndNameUseCase,
+        )
+
+        return ListFriendshipsWithUserEmailAndNameUseCase(
+            self.friendship_repo, self.page_cache
+        )
+
+    @_provider
+    def create_user_use_case(self) -> CreateUserUseCase:
+        from user.application.create_user_use_case import CreateUserUseCase
+
+        return CreateUserUseCase(self.user_repo)
+
+    @_provider
+    def authenticate_user_use_case(self) -> AuthenticateUserUseCase:
+        from user.application.authenticate_user_use_case import (
+            AuthenticateUserUseCase,
+        )
+
+        return AuthenticateUserUseCase(self.user_repo)
+
+    @_provider
+    def start_session_use_case(self) -> StartSessionUseCase:
+        from user.application.start_session_use_case import StartSessionUseCase
+
+        return StartSessionUseCase(self.authenticate_user_use_case, self.session_store)
+
+    @_provider
+    def restore_session_use_case(self) -> RestoreSessionUseCase:
+        from user.application.restore_session_use_case import RestoreSessionUseCase
+
+        return RestoreSessionUseCase(self.session_store)
+
+    @_provider
+    def end_session_use_case(self) -> EndSessionUseCase:
+        from user.application.end_session_use_case import EndSessionUseCase
+
+        return EndSessionUseCase(self.session_store)
+
+    @_provider
+    def validate_ticket_use_case(self) -> ValidateTicketUseCase:
+        from ticket.application.validate_ticket_use_case import ValidateTicketUseCase
+
+        return ValidateTicketUseCase(self.ticket_repo, self.event_repo)
+
+    @_provider
+    def export_offline_snapshot_use_case(self) -> ExportOfflineSnapshotUseCase:
+        from ticket.application.export_offline_snapshot_use_case import (
+            ExportOfflineSnapshotUseCase,
+        )
+
+        return ExportOfflineSnapshotUseCase(self.ticket_repo, self.event_repo)
+
+    @_provider
+    def reconcile_offline_scans_use_case(self) -> ReconcileOfflineScansUseCase:
+        from ticket.application.reconcile_offline_scans_use_case import (
+            ReconcileOfflineScansUseCase,
+        )
+
+        return ReconcileOfflineScansUseCase(self.validate_ticket_use_case)
+
+    @_provider
+    def count_friends_attending_use_case(self) -> CountFriendsAttendingUseCase:
+        from ticket.application.count_friends_attending_use_case import (
+            CountFriendsAttendingUseCase,
+        )
+
+        return CountFriendsAttendingUseCase(self.ticket_repo, self.page_cache)
+
+    @_provider
+    def list_event_use_case(self) -> ListEventUseCase:
+        from event.application.list_event_use_case import ListEventUseCase
+
+        return ListEventUseCase(self.event_repo, self.page_cache)
+
+    @_provider
+    def create_event_use_case(self) -> CreateEventUseCase:
+        from event.application.create_event_use_case import CreateEventUseCase
+
+        return CreateEventUseCase(self.event_repo, self.page_cache)
+
+    @_provider
+    def delete_event_use_case(self) -> DeleteEventUseCase:
+        from event.application.delete_event_use_case import DeleteEventUseCase
+
+        return DeleteEventUseCase(self.event_repo, self.user_repo, self.page_cache)
+
+    @_provider
+    def update_event_use_case(self) -> UpdateEventUseCase:
+        from event.application.update_event_use_case import UpdateEventUseCase
+
+        return UpdateEventUseCase(self.event_repo, self.user_repo, self.page_cache)
+
+    @_provider
+    def list_staffs_use_case(self) -> ListStaffWithEmailAndNameUseCase:
+        from event.application.list_staffs_with_email_and_name_use_case import (
+            ListStaffWithEmailAndNameUseCase,
+        )
+
+        return ListStaffWithEmailAndNameUseCase(self.user_repo, self.page_cache)
+
+    @_provider
+    def add_event_staff_use_case(self) -> AddEventStaffUseCase:
+        from event.application.add_event_staff_use_case import AddEventStaffUseCase
+
+        return AddEventStaffUseCase(self.event_repo, self.user_repo, self.page_cache)
+
+    @_provider
+    def remove_event_staff_use_case(self) -> RemoveEventStaffUseCase:
+        from event.application.remove_event_staff_use_case import (
+            RemoveEventStaffUseCase,
+        )
+
+        return RemoveEventStaffUseCase(self.event_repo, self.page_cache)
+
+    @_provider
+    def redeem_ticket_use_case(self) -> RedeemTicketUseCase:
+        from ticket.application.redeem_ticket_use_case import RedeemTicketUseCase
+
+        return RedeemTicketUseCase(
+            tickets_repository=self.ticket_repo,
+            events_repository=self.event_repo,
+            users_repository=self.user_repo,
+            email_outbox=self.email_outbox,
+            template_engine=self.html_template_engine,
+            code_allocator=self.ticket_code_allocator,
+            page_cache=self.page_cache,
+        )
+
+
+def build_application(
+    db_path: str | None = None, db_pool_size: int = 5
+) -> CompositionRoot:
+    return CompositionRoot(db_path=db_path, db_pool_size=db_pool_size)
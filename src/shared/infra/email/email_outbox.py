@@ -0,0 +1,136 @@
+from __future__ import annotations
+
+import random
+import threading
+from dataclasses import dataclass
+from datetime import UTC, datetime, timedelta
+
+from shared.infra.email.smtp_ticket_email_service import SmtpEmailService
+from shared.infra.email.sqlite_email_outbox_repository import (
+    OutboxMessage,
+    SqliteEmailOutboxRepository,
+)
+
+
+@dataclass(frozen=True)
+class EmailRetryPolicy:
+    """Exponential backoff with jitter; a message that fails ``max_attempts``
+    times is dead-lettered."""
+
+    max_attempts: int = 5
+    base_delay_seconds: float = 5.0
+    max_delay_seconds: float = 600.0
+    jitter: float = 0.2
+
+    def delay_after(self, attempts: int) -> float:
+        delay = min(
+            self.max_delay_seconds, self.base_delay_seconds * 2 ** (attempts - 1)
+        )
+        return delay * random.uniform(1 - self.jitter, 1 + self.jitter)
+
+
+class EmailOutbox:
+    """Persistent queue of outgoing email drained by a background worker.
+
+    ``enqueue`` only inserts a row, so callers return immediately; the worker
+    thread delivers due messages through ``email_service`` and reschedules or
+    dead-letters failures according to ``retry_policy``.
+    """
+
+    def __init__(
+        self,
+        repository: SqliteEmailOutboxRepository,
+        email_service: SmtpEmailService,
+        retry_policy: EmailRetryPolicy | None = None,
+        poll_interval_seconds: float = 5.0,
+        batch_size: int = 20,
+        lease_seconds: float = 120.0,
+    ) -> None:
+        self._repository = repository
+        self._email_service = email_service
+        self._retry_policy = retry_policy or EmailRetryPolicy()
+        self._poll_interval_seconds = poll_interval_seconds
+        self._batch_size = batch_size
+        self._lease_seconds = lease_seconds
+        self._wake_event = threading.Event()
+        self._stop_event = threading.Event()
+        self._thread: threading.Thread | None = None
+
+    @property
+    def repository(self) -> SqliteEmailOutboxRepository:
+        return self._repository
+
+    def enqueue(self, to: str, subject: str, body: str) -> int:
+        message_id = self._repository.add(to, subject, body)
+        self.wake()
+        return message_id
+
+    def wake(self) -> None:
+        """Deliver promptly a message queued directly through the repository."""
+        self._wake_event.set()
+
+    def start(self) -> None:
+        if self._thread is not None:
+            return
+        self._stop_event.clear()
+        self._thread = threading.Thread(
+            target=self._run, name="email-outbox", daemon=True
+        )
+        self._thread.start()
+
+    def stop(self, timeout: float | None = 10.0) -> None:
+        self._stop_event.set()
+        self._wake_event.set()
+        if self._thread is not None:
+            self._thread.join(timeout)
+            self._thread = None
+
+    def process_once(self) -> int:
+        """Deliver one batch of due messages; returns how many were attempted."""
+        now = datetime.now(UTC)
+        messages = self._repository.claim_due(
+            self._batch_size,
+            now,
+            now + timedelta(seconds=self._lease_seconds),
+            self._retry_policy.max_attempts,
+        )
+        if not messages:
+            return 0
+
+        # One batch goes out over the service's reused SMTP sessions.
+        results = self._email_service.send_many([
+            self._email_service.build_message(
+                message.recipient, message.subject, message.body
+            )
+            for message in messages
+        ])
+        for message, error in zip(messages, results, strict=True):
+            if error is None:
+                self._repository.mark_sent(message.id, datetime.now(UTC))
+            else:
+                self._record_failure(message, error)
+        return len(messages)
+
+    def _record_failure(self, message: OutboxMessage, error: Exception) -> None:
+        # claim_due already counted this attempt.
+        attempts = message.attempts
+        next_attempt_at = None
+        if attempts < self._retry_policy.max_attempts:
+            next_attempt_at = datetime.now(UTC) + timedelta(
+                seconds=self._retry_policy.delay_after(attempts)
+            )
+        self._repository.mark_failed(
+            message.id, f"{type(error).__name__}: {error}", next_attempt_at
+        )
+
+    def _run(self) -> None:
+        while not self._stop_event.is_set():
+            try:
+                attempted = self.process_once()
+            except Exception:
+                # The database may be locked or closing; try again next poll.
+                attempted = 0
+            if attempted:
+                continue
+            self._wake_event.wait(self._poll_interval_seconds)
+            self._wake_event.clear()
@@ -0,0 +1,148 @@
+from __future__ import annotations
+
+import socketserver
+import threading
+from email import message_from_bytes, policy
+from email.message import EmailMessage
+
+
+class _SmtpHandler(socketserver.StreamRequestHandler):
+    server: _SmtpTcpServer
+
+    def handle(self) -> None:
+        owner = self.server.owner
+        owner._record_session()
+        self._reply("220 localhost LocalSmtpServer ready")
+
+        while True:
+            line = self.rfile.readline()
+            if not line:
+                return
+            command, _, argument = line.decode("utf-8").strip().partition(" ")
+            command = command.upper()
+
+            if command == "EHLO":
+                self._reply("250-localhost", "250-AUTH PLAIN LOGIN", "250 8BITMIME")
+            elif command in {"HELO", "NOOP", "RSET", "RCPT"}:
+                self._reply("250 OK")
+            elif command == "AUTH":
+                self._authenticate(argument)
+            elif command == "MAIL":
+                failure = owner._take_failure()
+                self._reply(failure or "250 OK")
+            elif command == "DATA":
+                self._reply("354 End data with <CR><LF>.<CR><LF>")
+                owner._record_message(self._read_data())
+                self._reply("250 OK: queued")
+            elif command == "QUIT":
+                self._reply("221 Bye")
+                return
+            else:
+                self._reply("502 Command not implemented")
+
+    def _authenticate(self, argument: str) -> None:
+        mechanism, _, initial_response = argument.partition(" ")
+        if mechanism.upper() == "LOGIN":
+            self._reply("334 VXNlcm5hbWU6")
+            self.rfile.readline()
+            self._reply("334 UGFzc3dvcmQ6")
+            self.rfile.readline()
+        elif not initial_response:
+            self._reply("334 ")
+            self.rfile.readline()
+        self._reply("235 Authentication successful")
+
+    def _read_data(self) -> bytes:
+        lines = []
+        while True:
+            line = self.rfile.readline()
+            if not line or line in {b".\r\n", b".\n"}:
+                break
+            if line.startswith(b".."):
+                line = line[1:]
+            lines.append(line)
+        return b"".join(lines)
+
+    def _reply(self, *lines: str) -> None:
+        self.wfile.write("".join(f"{line}\r\n" for line in lines).encode("utf-8"))
+
+
+class _SmtpTcpServer(socketserver.ThreadingTCPServer):
+    allow_reuse_address = True
+    daemon_threads = True
+
+    def __init__(self, address: tuple[str, int], owner: LocalSmtpServer) -> None:
+        self.owner = owner
+        super().__init__(address, _SmtpHandler)
+
+
+class LocalSmtpServer:
+    """Minimal in-process SMTP server that keeps messages in memory.
+
+    Meant for scripts and manual testing: point ``SmtpEmailService`` at
+    ``host``/``port`` with ``use_starttls=False``. ``fail_next`` makes the
+    next MAIL commands answer with a temporary error to exercise retries.
+    """
+
+    def __init__(self, host: str = "127.0.0.1", port: int = 0) -> None:
+        self._server = _SmtpTcpServer((host, port), self)
+        self._thread: threading.Thread | None = None
+        self._lock = threading.Lock()
+        self._messages: list[EmailMessage] = []
+        self._pending_failures: list[str] = []
+        self._session_count = 0
+
+    @property
+    def host(self) -> str:
+        return self._server.server_address[0]
+
+    @property
+    def port(self) -> int:
+        return self._server.server_address[1]
+
+    @property
+    def messages(self) -> list[EmailMessage]:
+        with self._lock:
+            return list(self._messages)
+
+    @property
+    def session_count(self) -> int:
+        with self._lock:
+            return self._session_count
+
+    def fail_next(self, count: int = 1, reply: str = "451 Try again later") -> None:
+        with self._lock:
+            self._pending_failures.extend([reply] * count)
+
+    def start(self) -> LocalSmtpServer:
+        self._thread = threading.Thread(
+            target=self._server.serve_forever, name="local-smtp", daemon=True
+        )
+        self._thread.start()
+        return self
+
+    def stop(self) -> None:
+        self._server.shutdown()
+        self._server.server_close()
+        if self._thread is not None:
+            self._thread.join()
+            self._thread = None
+
+    def __enter__(self) -> LocalSmtpServer:
+        return self.start()
+
+    def __exit__(self, *exc_info) -> None:
+        self.stop()
+
+    def _record_session(self) -> None:
+        with self._lock:
+            self._session_count += 1
+
+    def _record_message(self, raw: bytes) -> None:
+        message = message_from_bytes(raw, policy=policy.default)
+        with self._lock:
+            self._messages.append(message)
+
+    def _take_failure(self) -> str | None:
+        with self._lock:
+            return self._pending_failures.pop(0) if self._pending_failures else None
@@ -1,6 +1,12 @@
 import os
 import smtplib
 import ssl
+import threading
+import time
+from collections.abc import Iterator, Sequence
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
+from dataclasses import dataclass, field
 from email.message import EmailMessage
 
 from dotenv import load_dotenv
@@ -8,22 +14,164 @@ from dotenv import load_dotenv
 load_dotenv()
 
 
+def _env_flag(name: str, default: bool) -> bool:
+    value = os.getenv(name)
+    if value is None:
+        return default
+    return value.strip().lower() in {"1", "true", "yes", "on"}
+
+
+@dataclass
+class _SmtpSession:
+    server: smtplib.SMTP
+    last_used_at: float = field(default_factory=time.monotonic)
+    sent_count: int = 0
+    broken: bool = False
+
+    def close(self) -> None:
+        try:
+            self.server.quit()
+        except (smtplib.SMTPException, OSError):
+            self.server.close()
+
+
 class SmtpEmailService:
-    def __init__(self):
-        self.smtp_server = os.getenv("EMAIL_SMTP_HOST")
-        self.port = os.getenv("EMAIL_SMTP_PORT")
-        self.sender_email = os.getenv("EMAIL_HOST_USER")
-        self.password = os.getenv("EMAIL_HOST_PASSWORD")
+    """Sends email over authenticated SMTP sessions that are kept open.
 
-    def send_email(self, to: str, subject: str, body: str) -> None:
+    Up to ``max_sessions`` connections are reused across messages, so the
+    TCP, STARTTLS and LOGIN round trips are paid once per session instead of
+    once per email. A session idle for longer than ``idle_timeout`` seconds,
+    or one that has sent ``max_messages_per_session`` messages, is replaced;
+    a session the server dropped is reopened and the message retried once.
+    """
+
+    def __init__(
+        self,
+        smtp_server: str | None = None,
+        port: int | None = None,
+        sender_email: str | None = None,
+        password: str | None = None,
+        use_starttls: bool | None = None,
+        timeout: float = 20.0,
+        max_sessions: int = 4,
+        idle_timeout: float = 60.0,
+        max_messages_per_session: int = 100,
+    ):
+        self.smtp_server = smtp_server or os.getenv("EMAIL_SMTP_HOST")
+        self.port = port or os.getenv("EMAIL_SMTP_PORT")
+        self.sender_email = sender_email or os.getenv("EMAIL_HOST_USER")
+        self.password = password or os.getenv("EMAIL_HOST_PASSWORD")
+        self.use_starttls = (
+            _env_flag("EMAIL_SMTP_STARTTLS", True)
+            if use_starttls is None
+            else use_starttls
+        )
+        self.timeout = timeout
+        self.max_sessions = max_sessions
+        self.idle_timeout = idle_timeout
+        self.max_messages_per_session = max_messages_per_session
+
+        self._idle_sessions: list[_SmtpSession] = []
+        self._lock = threading.Lock()
+        self._session_slots = threading.BoundedSemaphore(max_sessions)
+
+    def build_message(self, to: str, subject: str, body: str) -> EmailMessage:
         message = EmailMessage()
         message["From"] = self.sender_email
         message["To"] = to
         message["Subject"] = subject
         message.set_content(body, subtype="html")
+        return message
+
+    def send_email(self, to: str, subject: str, body: str) -> None:
+        self.send_message(self.build_message(to, subject, body))
+
+    def send_message(self, message: EmailMessage) -> None:
+        for attempt in range(2):
+            # A retry after a dropped connection always dials a new session;
+            # the other idle ones were probably dropped by the server too.
+            with self._session(fresh=attempt > 0) as session:
+                try:
+                    session.server.send_message(message)
+                except smtplib.SMTPServerDisconnected:
+                    session.broken = True
+                    if attempt == 1:
+                        raise
+                    continue
+                except OSError:
+                    session.broken = True
+                    raise
+                session.sent_count += 1
+                return
+
+    def send_many(
+        self, messages: Sequence[EmailMessage], concurrency: int | None = None
+    ) -> list[Exception | None]:
+        """Send ``messages`` over at most ``concurrency`` parallel sessions.
+
+        Returns one entry per message, in order: ``None`` when it was accepted
+        or the exception that rejected it, so one bad recipient does not stop
+        the batch.
+        """
+        workers = max(1, min(concurrency or self.max_sessions, self.max_sessions))
+
+        def send(message: EmailMessage) -> Exception | None:
+            try:
+                self.send_message(message)
+            except Exception as e:
+                return e
+            return None
+
+        if workers == 1 or len(messages) <= 1:
+            return [send(message) for message in messages]
+        with ThreadPoolExecutor(
+            max_workers=workers, thread_name_prefix="smtp-send"
+        ) as executor:
+            return list(executor.map(send, messages))
+
+    def close(self) -> None:
+        with self._lock:
+            sessions, self._idle_sessions = self._idle_sessions, []
+        for session in sessions:
+            session.close()
+
+    @contextmanager
+    def _session(self, fresh: bool = False) -> Iterator[_SmtpSession]:
+        with self._session_slots:
+            session = self._open() if fresh else self._checkout()
+            try:
+                yield session
+            finally:
+                session.last_used_at = time.monotonic()
+                if session.broken:
+                    session.server.close()
+                else:
+                    with self._lock:
+                        self._idle_sessions.append(session)
+
+    def _checkout(self) -> _SmtpSession:
+        with self._lock:
+            session = self._idle_sessions.pop() if self._idle_sessions else None
+
+        if session is not None:
+            idle_for = time.monotonic() - session.last_used_at
+            if (
+                idle_for < self.idle_timeout
+                and session.sent_count < self.max_messages_per_session
+            ):
+                return session
+            session.close()
+
+        return self._open()
 
-        context = ssl.create_default_context()
-        with smtplib.SMTP(self.smtp_server, self.port, timeout=20) as server:
-            server.starttls(context=context)
-            server.login(self.sender_email, self.password)
-            server.send_message(message)
+    def _open(self) -> _SmtpSession:
+        server = smtplib.SMTP(self.smtp_server, self.port, timeout=self.timeout)
+        try:
+            if self.use_starttls:
+                server.starttls(context=ssl.create_default_context())
+            if self.password:
+                server.login(self.sender_email, self.password)
+        except BaseException:
+            server.close()
+            raise
+        return _SmtpSession(server=server)
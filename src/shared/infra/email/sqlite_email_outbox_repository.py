@@ -0,0 +1,218 @@
+from __future__ import annotations
+
+import sqlite3
+from dataclasses import dataclass
+from datetime import UTC, datetime
+from enum import Enum
+
+from shared.infra.persistence.sqlite import SQLiteDatabase
+
+
+class OutboxStatus(str, Enum):
+    PENDING = "PENDING"
+    SENDING = "SENDING"
+    SENT = "SENT"
+    DEAD = "DEAD"
+
+
+@dataclass(frozen=True)
+class OutboxMessage:
+    recipient: str
+    subject: str
+    body: str
+    status: OutboxStatus = OutboxStatus.PENDING
+    attempts: int = 0
+    last_error: str | None = None
+    id: int | None = None
+
+
+def _timestamp(moment: datetime) -> str:
+    return moment.astimezone(UTC).isoformat()
+
+
+def insert_outbox_message(conn: sqlite3.Connection, message: OutboxMessage) -> int:
+    """Queue ``message`` on ``conn`` without committing.
+
+    Lets another repository enqueue an email inside its own transaction, so the
+    message is stored if and only if that write commits.
+    """
+    now = _timestamp(datetime.now(UTC))
+    cursor = conn.execute(
+        """
+        INSERT INTO email_outbox (recipient, subject, body, status, next_attempt_at, created_at)
+        VALUES (?, ?, ?, ?, ?, ?)
+        """,
+        (
+            message.recipient,
+            message.subject,
+            message.body,
+            OutboxStatus.PENDING.value,
+            now,
+            now,
+        ),
+    )
+    return cursor.lastrowid
+
+
+class SqliteEmailOutboxRepository:
+    def __init__(self, db: SQLiteDatabase) -> None:
+        self._db = db
+
+    def add(self, recipient: str, subject: str, body: str) -> int:
+        with self._db.connect() as conn:
+            message_id = insert_outbox_message(
+                conn, OutboxMessage(recipient, subject, body)
+            )
+            conn.commit()
+            return message_id
+
+    def claim_due(
+        self, limit: int, now: datetime, lease_until: datetime, max_attempts: int
+    ) -> list[OutboxMessage]:
+        """Lease up to ``limit`` due messages to the caller.
+
+        Claimed rows move to SENDING until ``lease_until`` and each claim counts
+        as an attempt; if the process dies before reporting back, the lease
+        expires and the row is claimed again. Rows whose lease expired after
+        their last allowed attempt are dead-lettered instead.
+        """
+        with self._db.transaction() as conn:
+            conn.execute(
+                """
+                UPDATE email_outbox
+                SET status = ?, last_error = COALESCE(last_error, ?)
+                WHERE status = ? AND next_attempt_at <= ? AND attempts >= ?
+                """,
+                (
+                    OutboxStatus.DEAD.value,
+                    "Lease expired without a delivery report",
+                    OutboxStatus.SENDING.value,
+                    _timestamp(now),
+                    max_attempts,
+                ),
+            )
+            rows = conn.execute(
+                """
+                UPDATE email_outbox
+                SET status = ?, attempts = attempts + 1, next_attempt_at = ?
+                WHERE id IN (
+                    SELECT id FROM email_outbox
+                    WHERE status IN (?, ?) AND next_attempt_at <= ?
+                    ORDER BY next_attempt_at
+                    LIMIT ?
+                )
+                RETURNING id, recipient, subject, body, attempts, last_error
+                """,
+                (
+                    OutboxStatus.SENDING.value,
+                    _timestamp(lease_until),
+                    OutboxStatus.PENDING.value,
+                    OutboxStatus.SENDING.value,
+                    _timestamp(now),
+                    limit,
+                ),
+            ).fetchall()
+
+        return [
+            OutboxMessage(
+                id=row[0],
+                recipient=row[1],
+                subject=row[2],
+                body=row[3],
+                status=OutboxStatus.SENDING,
+                attempts=row[4],
+                last_error=row[5],
+            )
+            for row in sorted(rows)
+        ]
+
+    def mark_sent(self, message_id: int, sent_at: datetime) -> None:
+        with self._db.connect() as conn:
+            conn.execute(
+                """
+                UPDATE email_outbox
+                SET status = ?, sent_at = ?, last_error = NULL
+                WHERE id = ?
+                """,
+                (OutboxStatus.SENT.value, _timestamp(sent_at), message_id),
+            )
+            conn.commit()
+
+    def mark_failed(
+        self, message_id: int, error: str, next_attempt_at: datetime | None
+    ) -> None:
+        """Record the outcome of a failed attempt counted by ``claim_due``.
+
+        ``next_attempt_at=None`` dead-letters the message.
+        """
+        status = OutboxStatus.DEAD if next_attempt_at is None else OutboxStatus.PENDING
+        with self._db.connect() as conn:
+            conn.execute(
+                """
+                UPDATE email_outbox
+                SET status = ?, last_error = ?,
+                    next_attempt_at = COALESCE(?, next_attempt_at)
+                WHERE id = ?
+                """,
+                (
+                    status.value,
+                    error,
+                    _timestamp(next_attempt_at) if next_attempt_at else None,
+                    message_id,
+                ),
+            )
+            conn.commit()
+
+    def list_dead(self, limit: int = 100) -> list[OutboxMessage]:
+        with self._db.connect() as conn:
+            rows = conn.execute(
+                """
+                SELECT id, recipient, subject, body, attempts, last_error
+                FROM email_outbox
+                WHERE status = ?
+                ORDER BY id
+                LIMIT ?
+                """,
+                (OutboxStatus.DEAD.value, limit),
+            ).fetchall()
+
+        return [
+            OutboxMessage(
+                id=row[0],
+                recipient=row[1],
+                subject=row[2],
+                body=row[3],
+                status=OutboxStatus.DEAD,
+                attempts=row[4],
+                last_error=row[5],
+            )
+            for row in rows
+        ]
+
+    def requeue_dead(self) -> int:
+        """Give every dead-lettered message a fresh set of attempts."""
+        with self._db.connect() as conn:
+            cursor = conn.execute(
+                """
+                UPDATE email_outbox
+                SET status = ?, attempts = 0, next_attempt_at = ?
+                WHERE status = ?
+                """,
+                (
+                    OutboxStatus.PENDING.value,
+                    _timestamp(datetime.now(UTC)),
+                    OutboxStatus.DEAD.value,
+                ),
+            )
+            conn.commit()
+            return cursor.rowcount
+
+    def count_by_status(self) -> dict[OutboxStatus, int]:
+        with self._db.connect() as conn:
+            rows = conn.execute(
+                "SELECT status, COUNT(*) FROM email_outbox GROUP BY status"
+            ).fetchall()
+        counts = dict.fromkeys(OutboxStatus, 0)
+        for status, count in rows:
+            counts[OutboxStatus(status)] = count
+        return counts
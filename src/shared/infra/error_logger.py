@@ -1,19 +1,194 @@
+from __future__ import annotations
+
+import atexit
+import json
 import os
+import queue
+import threading
+import time
 from datetime import UTC, datetime
 
 from shared.domain.auth_context import AuthContext
 
+_FLUSH = object()
 
-def log_error(message: str, auth_context: AuthContext = None):
-    os.makedirs("logs", exist_ok=True)
 
-    timestamp = datetime.now(UTC).strftime("%Y-%m-%d %H:%M:%S")
+class ErrorLogWriter:
+    """Writes error records as JSON lines from a background thread.
+
+    ``write`` only puts the record on a bounded queue, so callers on the GUI
+    thread never touch the disk. The writer drains the queue in batches of up
+    to ``batch_size`` records or every ``flush_interval`` seconds, rotates the
+    file when it passes ``max_bytes`` or the UTC day changes, and keeps
+    ``backup_count`` rotated files. When the queue is full, records are
+    dropped and a single summary line reports how many.
+    """
+
+    def __init__(
+        self,
+        directory: str = "logs",
+        filename: str = "errors.jsonl",
+        max_bytes: int = 5 * 1024 * 1024,
+        backup_count: int = 5,
+        rotate_daily: bool = True,
+        batch_size: int = 100,
+        flush_interval: float = 1.0,
+        max_queue_size: int = 10_000,
+    ) -> None:
+        self.path = os.path.join(directory, filename)
+        self._directory = directory
+        self._max_bytes = max_bytes
+        self._backup_count = backup_count
+        self._rotate_daily = rotate_daily
+        self._batch_size = batch_size
+        self._flush_interval = flush_interval
+        self._queue: queue.Queue = queue.Queue(maxsize=max_queue_size)
+        self._dropped = 0
+        self._dropped_lock = threading.Lock()
+        self._flushed = threading.Condition()
+        self._pending_flushes = 0
+        self._thread: threading.Thread | None = None
+        self._start_lock = threading.Lock()
+        self._file = None
+        self._file_day: str | None = None
+
+    def write(self, record: dict) -> None:
+        self._ensure_started()
+        try:
+            self._queue.put_nowait(record)
+        except queue.Full:
+            with self._dropped_lock:
+                self._dropped += 1
+
+    def flush(self, timeout: float | None = 5.0) -> None:
+        """Block until everything queued so far has been written."""
+        if self._thread is None:
+            return
+        with self._flushed:
+            self._pending_flushes += 1
+            self._queue.put(_FLUSH)
+            self._flushed.wait_for(lambda: self._pending_flushes == 0, timeout)
+
+    def close(self) -> None:
+        if self._thread is None:
+            return
+        self._queue.put(None)
+        self._thread.join()
+        self._thread = None
+
+    def _ensure_started(self) -> None:
+        if self._thread is not None:
+            return
+        with self._start_lock:
+            if self._thread is None:
+                self._thread = threading.Thread(
+                    target=self._run, name="error-log-writer", daemon=True
+                )
+                self._thread.start()
+
+    def _run(self) -> None:
+        running = True
+        while running:
+            batch, flush_requested = [], False
+            deadline = time.monotonic() + self._flush_interval
+            while len(batch) < self._batch_size:
+                try:
+                    item = self._queue.get(
+                        timeout=max(0.0, deadline - time.monotonic())
+                    )
+                except queue.Empty:
+                    break
+                if item is None:
+                    running = False
+                    break
+                if item is _FLUSH:
+                    flush_requested = True
+                    break
+                batch.append(item)
+
+            try:
+                self._write_batch(batch)
+            except Exception:
+                # Logging must never take the application down with it, nor
+                # stop the writer: the batch is lost, later ones still go out.
+                pass
+            if flush_requested or not running:
+                with self._flushed:
+                    self._pending_flushes = 0
+                    self._flushed.notify_all()
 
-    user_email = auth_context.email if auth_context else "N/A"
-    user_role = auth_context.role.value if auth_context else "N/A"
-    user_info = f" - User: {user_email} ({user_role})"
+        if self._file is not None:
+            self._file.close()
+            self._file = None
 
-    log_entry = f"[{timestamp}] ERROR: {message}{user_info}\n"
+    def _write_batch(self, batch: list[dict]) -> None:
+        with self._dropped_lock:
+            dropped, self._dropped = self._dropped, 0
+        if dropped:
+            batch.append({
+                "timestamp": datetime.now(UTC).isoformat(),
+                "level": "WARNING",
+                "message": f"{dropped} error log record(s) dropped: queue full",
+            })
+        if not batch:
+            return
 
-    with open("logs/errors.txt", "a", encoding="utf-8") as f:
-        f.write(log_entry)
+        self._rotate_if_needed()
+        self._file.write(
+            "".join(
+                json.dumps(record, ensure_ascii=False, default=str) + "\n"
+                for record in batch
+            )
+        )
+        self._file.flush()
+
+    def _rotate_if_needed(self) -> None:
+        today = datetime.now(UTC).date().isoformat()
+        if self._file is None:
+            os.makedirs(self._directory, exist_ok=True)
+            self._file = open(self.path, "a", encoding="utf-8")
+            # A file left over from an earlier run belongs to the day it was
+            # last written, so a restart the next morning still rotates it.
+            modified_at = os.fstat(self._file.fileno()).st_mtime
+            self._file_day = datetime.fromtimestamp(modified_at, UTC).date().isoformat()
+
+        too_big = self._file.tell() >= self._max_bytes
+        new_day = self._rotate_daily and self._file_day != today
+        if not (too_big or new_day) or self._file.tell() == 0:
+            self._file_day = today
+            return
+
+        self._file.close()
+        # If a rename below fails, the next batch reopens the file instead of
+        # writing to the closed handle.
+        self._file = None
+        for index in range(self._backup_count - 1, 0, -1):
+            source = f"{self.path}.{index}"
+            if os.path.exists(source):
+                os.replace(source, f"{self.path}.{index + 1}")
+        if self._backup_count > 0:
+            os.replace(self.path, f"{self.path}.1")
+        else:
+            os.remove(self.path)
+        self._file = open(self.path, "a", encoding="utf-8")
+        self._file_day = today
+
+
+_writer = ErrorLogWriter()
+atexit.register(_writer.close)
+
+
+def get_error_log_writer() -> ErrorLogWriter:
+    return _writer
+
+
+def log_error(message: str, auth_context: AuthContext = None):
+    _writer.write({
+        "timestamp": datetime.now(UTC).isoformat(),
+        "level": "ERROR",
+        "message": message,
+        "user_id": auth_context.id if auth_context else None,
+        "user_name": auth_context.name if auth_context else None,
+        "user_email": auth_context.email if auth_context else None,
+        "user_role": auth_context.role.value if auth_context else None,
+    })
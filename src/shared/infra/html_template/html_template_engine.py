@@ -1,16 +1,103 @@
 import os
+import threading
+from collections import OrderedDict
+from dataclasses import dataclass
 from string import Template
 
 
+@dataclass(frozen=True)
+class TemplateCacheInfo:
+    hits: int
+    misses: int
+    size: int
+    max_size: int
+
+
+@dataclass(frozen=True)
+class _CachedTemplate:
+    template: Template
+    mtime_ns: int
+    size: int
+
+
 class HtmlTemplateEngine:
-    def __init__(self, templates_dir: str):
+    """Renders ``string.Template`` files from ``templates_dir``.
+
+    Compiled templates are kept in an LRU of ``max_cached`` entries; each
+    render only stats the file and recompiles it when its mtime or size
+    changed. ``max_cached=0`` disables the cache.
+    """
+
+    def __init__(self, templates_dir: str, max_cached: int = 32, preload: bool = False):
         self.templates_dir = templates_dir
+        self.max_cached = max_cached
+        self._cache: OrderedDict[str, _CachedTemplate] = OrderedDict()
+        self._lock = threading.Lock()
+        self._hits = 0
+        self._misses = 0
+        if preload:
+            self.preload()
 
     def render(self, template_name: str, context: dict) -> str:
+        return self._get_template(template_name).substitute(context)
+
+    def preload(self) -> list[str]:
+        """Compile every ``.html`` file in the templates directory."""
+        if not os.path.isdir(self.templates_dir):
+            return []
+        names = sorted(
+            name for name in os.listdir(self.templates_dir) if name.endswith(".html")
+        )
+        for name in names[: self.max_cached]:
+            self._get_template(name)
+        return names[: self.max_cached]
+
+    def clear(self) -> None:
+        with self._lock:
+            self._cache.clear()
+
+    def cache_info(self) -> TemplateCacheInfo:
+        with self._lock:
+            return TemplateCacheInfo(
+                hits=self._hits,
+                misses=self._misses,
+                size=len(self._cache),
+                max_size=self.max_cached,
+            )
+
+    def _get_template(self, template_name: str) -> Template:
         template_path = os.path.join(self.templates_dir, template_name)
+        if self.max_cached <= 0:
+            return self._compile(template_path).template
+
+        stat = os.stat(template_path)
+        with self._lock:
+            cached = self._cache.get(template_name)
+            if (
+                cached is not None
+                and cached.mtime_ns == stat.st_mtime_ns
+                and cached.size == stat.st_size
+            ):
+                self._cache.move_to_end(template_name)
+                self._hits += 1
+                return cached.template
+            self._misses += 1
+
+        compiled = self._compile(template_path)
+        with self._lock:
+            self._cache[template_name] = compiled
+            self._cache.move_to_end(template_name)
+            while len(self._cache) > self.max_cached:
+                self._cache.popitem(last=False)
+        return compiled.template
+
+    def _compile(self, template_path: str) -> _CachedTemplate:
         with open(template_path, encoding="utf-8") as f:
+            stat = os.fstat(f.fileno())
             template_content = f.read()
 
-        html_template = Template(template_content)
-
-        return html_template.substitute(context)
+        return _CachedTemplate(
+            template=Template(template_content),
+            mtime_ns=stat.st_mtime_ns,
+            size=stat.st_size,
+        )
@@ -0,0 +1,31 @@
+from __future__ import annotations
+
+
+class PersistenceError(Exception):
+    """Base class for persistence errors."""
+
+
+class ConnectionPoolTimeoutError(PersistenceError):
+    def __init__(self, timeout: float) -> None:
+        message = f"No SQLite connection became available within {timeout} seconds."
+        super().__init__(message)
+
+
+class ConnectionPoolClosedError(PersistenceError):
+    def __init__(self) -> None:
+        message = "The SQLite connection pool has already been closed."
+        super().__init__(message)
+
+
+class InvalidMigrationOrderError(PersistenceError):
+    def __init__(self, version: int, expected_version: int) -> None:
+        message = (
+            f"Migration version {version} is out of order, expected {expected_version}."
+        )
+        super().__init__(message)
+
+
+class SchemaVersionAheadError(PersistenceError):
+    def __init__(self, current_version: int, latest_version: int) -> None:
+        message = f"Database schema version {current_version} is newer than the latest known migration {latest_version}."
+        super().__init__(message)
@@ -0,0 +1,28 @@
+from .migration import Migration
+from .v001_initial_schema import MIGRATION as V001_INITIAL_SCHEMA
+from .v002_query_indexes import MIGRATION as V002_QUERY_INDEXES
+from .v003_event_staff import MIGRATION as V003_EVENT_STAFF
+from .v004_ticket_code_pool import MIGRATION as V004_TICKET_CODE_POOL
+from .v005_email_outbox import MIGRATION as V005_EMAIL_OUTBOX
+from .v006_friendship_canonical_pair import (
+    MIGRATION as V006_FRIENDSHIP_CANONICAL_PAIR,
+)
+from .v007_ticket_event_client_index import (
+    MIGRATION as V007_TICKET_EVENT_CLIENT_INDEX,
+)
+from .v008_sessions import MIGRATION as V008_SESSIONS
+from .v009_ticket_code_pool_claims import MIGRATION as V009_TICKET_CODE_POOL_CLAIMS
+
+MIGRATIONS: tuple[Migration, ...] = (
+    V001_INITIAL_SCHEMA,
+    V002_QUERY_INDEXES,
+    V003_EVENT_STAFF,
+    V004_TICKET_CODE_POOL,
+    V005_EMAIL_OUTBOX,
+    V006_FRIENDSHIP_CANONICAL_PAIR,
+    V007_TICKET_EVENT_CLIENT_INDEX,
+    V008_SESSIONS,
+    V009_TICKET_CODE_POOL_CLAIMS,
+)
+
+__all__ = ["MIGRATIONS", "Migration"]
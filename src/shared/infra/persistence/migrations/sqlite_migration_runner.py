@@ -0,0 +1,79 @@
+from __future__ import annotations
+
+import sqlite3
+from collections.abc import Sequence
+from datetime import UTC, datetime
+
+from shared.infra.persistence.errors import (
+    InvalidMigrationOrderError,
+    SchemaVersionAheadError,
+)
+from shared.infra.persistence.migrations.migration import Migration
+
+
+class SQLiteMigrationRunner:
+    """Applies numbered migrations forward-only and records them in
+    ``schema_version``.
+
+    Each migration runs in its own ``BEGIN IMMEDIATE`` transaction and the
+    current version is re-read after the write lock is taken, so two app
+    instances starting against the same file apply every migration once.
+    """
+
+    def __init__(self, migrations: Sequence[Migration]) -> None:
+        for expected_version, migration in enumerate(migrations, start=1):
+            if migration.version != expected_version:
+                raise InvalidMigrationOrderError(migration.version, expected_version)
+        self._migrations = tuple(migrations)
+
+    @property
+    def latest_version(self) -> int:
+        return self._migrations[-1].version if self._migrations else 0
+
+    def current_version(self, conn: sqlite3.Connection) -> int:
+        self._ensure_version_table(conn)
+        row = conn.execute("SELECT COALESCE(MAX(version), 0) FROM schema_version")
+        return int(row.fetchone()[0])
+
+    def migrate(self, conn: sqlite3.Connection) -> list[Migration]:
+        current_version = self.current_version(conn)
+        if current_version > self.latest_version:
+            raise SchemaVersionAheadError(current_version, self.latest_version)
+
+        applied: list[Migration] = []
+        for migration in self._migrations[current_version:]:
+            conn.execute("BEGIN IMMEDIATE")
+            try:
+                if self.current_version(conn) >= migration.version:
+                    conn.rollback()
+                    continue
+                migration.apply(conn)
+                conn.execute(
+                    """
+                    INSERT INTO schema_version (version, name, applied_at)
+                    VALUES (?, ?, ?)
+                    """,
+                    (
+                        migration.version,
+                        migration.name,
+                        datetime.now(UTC).isoformat(),
+                    ),
+                )
+                conn.commit()
+            except Exception as e:
+                conn.rollback()
+                raise e
+            applied.append(migration)
+
+        return applied
+
+    def _ensure_version_table(self, conn: sqlite3.Connection) -> None:
+        conn.execute(
+            """
+            CREATE TABLE IF NOT EXISTS schema_version (
+                version INTEGER PRIMARY KEY,
+                name TEXT NOT NULL,
+                applied_at TIMESTAMP NOT NULL
+            )
+            """
+        )
@@ -0,0 +1,57 @@
+from shared.infra.persistence.migrations.migration import Migration
+
+MIGRATION = Migration(
+    version=1,
+    name="initial_schema",
+    statements=(
+        """
+        CREATE TABLE IF NOT EXISTS users (
+            id INTEGER PRIMARY KEY AUTOINCREMENT,
+            name TEXT NOT NULL,
+            email TEXT NOT NULL,
+            hashed_password TEXT NOT NULL,
+            role TEXT NOT NULL
+        )
+        """,
+        """
+        CREATE TABLE IF NOT EXISTS friendships (
+            id INTEGER PRIMARY KEY AUTOINCREMENT,
+            requester_client_id INTEGER NOT NULL,
+            requested_client_id INTEGER NOT NULL,
+            status TEXT NOT NULL,
+            accepted_at TIMESTAMP NULL,
+            UNIQUE(requester_client_id, requested_client_id),
+            FOREIGN KEY(requested_client_id) REFERENCES users(id) ON DELETE CASCADE,
+            FOREIGN KEY(requester_client_id) REFERENCES users(id) ON DELETE CASCADE
+        )
+        """,
+        """
+        CREATE TABLE IF NOT EXISTS events (
+            id INTEGER PRIMARY KEY AUTOINCREMENT,
+            created_at TIMESTAMP NOT NULL,
+            end_date TIMESTAMP NOT NULL,
+            location TEXT NOT NULL,
+            name TEXT NOT NULL,
+            start_date TIMESTAMP NOT NULL,
+            max_tickets INTEGER NOT NULL,
+            initial_max_tickets INTEGER NOT NULL,
+            organizer_id INTEGER NOT NULL,
+            staffs_id TEXT DEFAULT NULL,
+            tickets_redeemed INTEGER NOT NULL,
+            FOREIGN KEY(organizer_id) REFERENCES users(id) ON DELETE CASCADE
+        )
+        """,
+        """
+        CREATE TABLE IF NOT EXISTS tickets (
+            id INTEGER PRIMARY KEY AUTOINCREMENT,
+            event_id INTEGER NOT NULL,
+            client_id INTEGER NOT NULL,
+            code TEXT NOT NULL UNIQUE,
+            status TEXT NOT NULL,
+            created_at TIMESTAMP NOT NULL,
+            FOREIGN KEY(event_id) REFERENCES events(id) ON DELETE CASCADE,
+            FOREIGN KEY(client_id) REFERENCES users(id) ON DELETE CASCADE
+        )
+        """,
+    ),
+)
@@ -0,0 +1,20 @@
+from shared.infra.persistence.migrations.migration import Migration
+
+MIGRATION = Migration(
+    version=2,
+    name="query_indexes",
+    statements=(
+        # SqliteUsersRepository.get_by_email_and_role (login, sign-up, invites).
+        "CREATE INDEX IF NOT EXISTS idx_users_email_role ON users(email, role)",
+        # Organizer event listing filters by organizer and pages by id.
+        "CREATE INDEX IF NOT EXISTS idx_events_organizer_id ON events(organizer_id, id)",
+        "CREATE INDEX IF NOT EXISTS idx_tickets_event_id ON tickets(event_id)",
+        "CREATE INDEX IF NOT EXISTS idx_tickets_client_id ON tickets(client_id)",
+        # The UNIQUE(requester_client_id, requested_client_id) constraint already
+        # covers lookups by requester; pending invites are listed by requested.
+        """
+        CREATE INDEX IF NOT EXISTS idx_friendships_requested_client_id
+        ON friendships(requested_client_id, status)
+        """,
+    ),
+)
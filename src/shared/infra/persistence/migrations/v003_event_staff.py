@@ -0,0 +1,54 @@
+from __future__ import annotations
+
+import sqlite3
+
+from shared.infra.persistence.migrations.migration import Migration
+
+
+def _copy_staffs_id_column(conn: sqlite3.Connection) -> None:
+    rows = conn.execute(
+        "SELECT id, staffs_id FROM events WHERE staffs_id IS NOT NULL"
+    ).fetchall()
+
+    pairs = []
+    for event_id, staffs_id in rows:
+        for raw_user_id in str(staffs_id).split(","):
+            raw_user_id = raw_user_id.strip()
+            if raw_user_id.isdigit():
+                pairs.append((event_id, int(raw_user_id)))
+
+    # Ids that no longer point at a user are dropped instead of failing the
+    # foreign key.
+    conn.executemany(
+        """
+        INSERT OR IGNORE INTO event_staff (event_id, user_id)
+        SELECT ?, id FROM users WHERE id = ?
+        """,
+        pairs,
+    )
+    # The join table is now the only source of truth for staff membership.
+    conn.execute("UPDATE events SET staffs_id = NULL WHERE staffs_id IS NOT NULL")
+
+
+MIGRATION = Migration(
+    version=3,
+    name="event_staff",
+    statements=(
+        """
+        CREATE TABLE IF NOT EXISTS event_staff (
+            event_id INTEGER NOT NULL,
+            user_id INTEGER NOT NULL,
+            PRIMARY KEY(event_id, user_id),
+            FOREIGN KEY(event_id) REFERENCES events(id) ON DELETE CASCADE,
+            FOREIGN KEY(user_id) REFERENCES users(id) ON DELETE CASCADE
+        ) WITHOUT ROWID
+        """,
+        # The primary key answers "staff of an event"; this answers "events of
+        # a staff member" and the cascade from users.
+        """
+        CREATE INDEX IF NOT EXISTS idx_event_staff_user_id
+        ON event_staff(user_id, event_id)
+        """,
+    ),
+    data_migration=_copy_staffs_id_column,
+)
@@ -0,0 +1,16 @@
+from shared.infra.persistence.migrations.migration import Migration
+
+MIGRATION = Migration(
+    version=4,
+    name="ticket_code_pool",
+    statements=(
+        # Unused, pre-generated ticket codes. A code leaves this table when it
+        # is handed out, so the primary key alone guarantees no two buyers get
+        # the same one.
+        """
+        CREATE TABLE IF NOT EXISTS ticket_code_pool (
+            code TEXT PRIMARY KEY
+        ) WITHOUT ROWID
+        """,
+    ),
+)
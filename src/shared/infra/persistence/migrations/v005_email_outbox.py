@@ -0,0 +1,27 @@
+from shared.infra.persistence.migrations.migration import Migration
+
+MIGRATION = Migration(
+    version=5,
+    name="email_outbox",
+    statements=(
+        """
+        CREATE TABLE IF NOT EXISTS email_outbox (
+            id INTEGER PRIMARY KEY AUTOINCREMENT,
+            recipient TEXT NOT NULL,
+            subject TEXT NOT NULL,
+            body TEXT NOT NULL,
+            status TEXT NOT NULL,
+            attempts INTEGER NOT NULL DEFAULT 0,
+            next_attempt_at TIMESTAMP NOT NULL,
+            last_error TEXT DEFAULT NULL,
+            created_at TIMESTAMP NOT NULL,
+            sent_at TIMESTAMP DEFAULT NULL
+        )
+        """,
+        # The worker only ever polls for due messages.
+        """
+        CREATE INDEX IF NOT EXISTS idx_email_outbox_status_next_attempt_at
+        ON email_outbox(status, next_attempt_at)
+        """,
+    ),
+)
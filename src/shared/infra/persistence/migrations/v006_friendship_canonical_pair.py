@@ -0,0 +1,39 @@
+from shared.infra.persistence.migrations.migration import Migration
+
+MIGRATION = Migration(
+    version=6,
+    name="friendship_canonical_pair",
+    statements=(
+        # Virtual generated columns: existing rows are backfilled when the
+        # index below is built, and no writer can ever leave them stale.
+        """
+        ALTER TABLE friendships ADD COLUMN client_low_id INTEGER
+        GENERATED ALWAYS AS (MIN(requester_client_id, requested_client_id)) VIRTUAL
+        """,
+        """
+        ALTER TABLE friendships ADD COLUMN client_high_id INTEGER
+        GENERATED ALWAYS AS (MAX(requester_client_id, requested_client_id)) VIRTUAL
+        """,
+        # UNIQUE(requester, requested) let a pair exist once per direction.
+        # Keep one row per pair: an accepted one over a pending one, then
+        # the oldest.
+        """
+        DELETE FROM friendships
+        WHERE id IN (
+            SELECT f.id
+            FROM friendships f
+            JOIN friendships g
+              ON g.requester_client_id = f.requested_client_id
+             AND g.requested_client_id = f.requester_client_id
+            WHERE (g.status = 'ACCEPTED' AND f.status <> 'ACCEPTED')
+               OR (g.status = f.status AND g.id < f.id)
+        )
+        """,
+        # One probe answers "exists / pending / who requested" for a pair in
+        # either direction.
+        """
+        CREATE UNIQUE INDEX IF NOT EXISTS idx_friendships_client_pair
+        ON friendships(client_low_id, client_high_id)
+        """,
+    ),
+)
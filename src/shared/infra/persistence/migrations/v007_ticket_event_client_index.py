@@ -0,0 +1,16 @@
+from shared.infra.persistence.migrations.migration import Migration
+
+MIGRATION = Migration(
+    version=7,
+    name="ticket_event_client_index",
+    statements=(
+        # "Which of these clients hold a ticket for this event" (friends
+        # attending) is answered from the index alone. The event_id prefix
+        # serves every lookup idx_tickets_event_id did.
+        """
+        CREATE INDEX IF NOT EXISTS idx_tickets_event_client
+        ON tickets(event_id, client_id)
+        """,
+        "DROP INDEX IF EXISTS idx_tickets_event_id",
+    ),
+)
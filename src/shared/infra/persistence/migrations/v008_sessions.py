@@ -0,0 +1,24 @@
+from shared.infra.persistence.migrations.migration import Migration
+
+MIGRATION = Migration(
+    version=8,
+    name="sessions",
+    statements=(
+        # Only a SHA-256 of each token is stored, so reading the database
+        # does not hand out working sessions.
+        """
+        CREATE TABLE IF NOT EXISTS sessions (
+            token_hash TEXT PRIMARY KEY,
+            user_id INTEGER NOT NULL,
+            created_at TIMESTAMP NOT NULL,
+            expires_at TIMESTAMP NOT NULL,
+            FOREIGN KEY(user_id) REFERENCES users(id) ON DELETE CASCADE
+        ) WITHOUT ROWID
+        """,
+        # Expired sessions are pruned by expiry on every login.
+        """
+        CREATE INDEX IF NOT EXISTS idx_sessions_expires_at
+        ON sessions(expires_at)
+        """,
+    ),
+)
@@ -0,0 +1,30 @@
+from shared.infra.persistence.migrations.migration import Migration
+
+MIGRATION = Migration(
+    version=9,
+    name="ticket_code_pool_claims",
+    statements=(
+        # A claimed code stays in the pool, marked with when it was handed to
+        # an allocator, so a refill in any process can never generate it
+        # again while it waits to be issued.
+        "ALTER TABLE ticket_code_pool ADD COLUMN claimed_at TIMESTAMP DEFAULT NULL",
+        """
+        CREATE INDEX IF NOT EXISTS idx_ticket_code_pool_claimed_at
+        ON ticket_code_pool(claimed_at)
+        """,
+        # The code leaves the pool in the same transaction that issues it.
+        """
+        CREATE TRIGGER IF NOT EXISTS trg_tickets_consume_pooled_code
+        AFTER INSERT ON tickets
+        BEGIN
+            DELETE FROM ticket_code_pool WHERE code = NEW.code;
+        END
+        """,
+        # Codes claimed before this migration were already deleted from the
+        # pool; only issued ones could still be here.
+        """
+        DELETE FROM ticket_code_pool
+        WHERE code IN (SELECT code FROM tickets)
+        """,
+    ),
+)
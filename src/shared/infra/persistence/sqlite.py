@@ -2,75 +2,97 @@ from __future__ import annotations
 
 import os
 import sqlite3
+from collections.abc import Iterator
+from contextlib import AbstractContextManager, contextmanager
+
+from shared.infra.persistence.migrations import MIGRATIONS
+from shared.infra.persistence.migrations.sqlite_migration_runner import (
+    SQLiteMigrationRunner,
+)
+from shared.infra.persistence.sqlite_connection_pool import SQLiteConnectionPool
+from shared.infra.persistence.sqlite_pagination import SQLiteCountCache
+from shared.infra.persistence.sqlite_pragmas import (
+    SQLiteCheckpointer,
+    SQLiteCheckpointPolicy,
+    SQLitePragmaProfile,
+)
+
+# Bound parameters per IN (...) or multi-row VALUES statement; stays well
+# below SQLite's limit on old builds (999).
+IN_CHUNK_SIZE = 900
 
 
 class SQLiteDatabase:
-    def __init__(self, path: str | None = None) -> None:
+    def __init__(
+        self,
+        path: str | None = None,
+        pool_size: int = 5,
+        pool_timeout: float = 30.0,
+        pragma_profile: SQLitePragmaProfile | None = None,
+        checkpoint_policy: SQLiteCheckpointPolicy | None = None,
+    ) -> None:
         self._path = path or os.path.join("data", "app.db")
-        os.makedirs(os.path.dirname(self._path), exist_ok=True)
+        os.makedirs(os.path.dirname(self._path) or ".", exist_ok=True)
+        self._pragma_profile = pragma_profile or SQLitePragmaProfile()
+        self._pool = SQLiteConnectionPool(
+            self._create_connection, max_size=pool_size, timeout=pool_timeout
+        )
+        self._checkpointer = SQLiteCheckpointer(
+            self, checkpoint_policy or SQLiteCheckpointPolicy()
+        )
+        self._count_cache = SQLiteCountCache()
+
+    @property
+    def pool(self) -> SQLiteConnectionPool:
+        return self._pool
+
+    def connect(self) -> AbstractContextManager[sqlite3.Connection]:
+        """Borrow a pooled connection for the duration of a ``with`` block."""
+        return self._pool.connection()
+
+    @contextmanager
+    def transaction(self) -> Iterator[sqlite3.Connection]:
+        """Run the block in a ``BEGIN IMMEDIATE`` transaction.
+
+        The write lock is taken up front, so read-check-write sequences inside
+        the block cannot interleave with another writer. Commits on success
+        and rolls back on any exception; a nested call joins the outer
+        transaction.
+        """
+        with self.connect() as conn:
+            if conn.in_transaction:
+                yield conn
+                return
+
+            conn.execute("BEGIN IMMEDIATE")
+            try:
+                yield conn
+                conn.commit()
+            except BaseException:
+                conn.rollback()
+                raise
+
+    @property
+    def count_cache(self) -> SQLiteCountCache:
+        return self._count_cache
 
-    def connect(self) -> sqlite3.Connection:
-        conn = sqlite3.connect(self._path)
-        conn.execute("PRAGMA foreign_keys = ON")
+    @property
+    def checkpointer(self) -> SQLiteCheckpointer:
+        return self._checkpointer
+
+    def close(self) -> None:
+        if self._pragma_profile.uses_wal:
+            self._checkpointer.stop()
+        self._pool.close()
+
+    def _create_connection(self) -> sqlite3.Connection:
+        conn = sqlite3.connect(self._path, check_same_thread=False)
+        self._pragma_profile.apply(conn)
         return conn
 
     def initialize(self) -> None:
         with self.connect() as conn:
-            conn.execute(
-                """
-                CREATE TABLE IF NOT EXISTS users (
-                    id INTEGER PRIMARY KEY AUTOINCREMENT,
-                    name TEXT NOT NULL,
-                    email TEXT NOT NULL,
-                    hashed_password TEXT NOT NULL,
-                    role TEXT NOT NULL
-                )
-                """
-            )
-            conn.execute(
-                """
-                CREATE TABLE IF NOT EXISTS friendships (
-                    id INTEGER PRIMARY KEY AUTOINCREMENT,
-                    requester_client_id INTEGER NOT NULL,
-                    requested_client_id INTEGER NOT NULL,
-                    status TEXT NOT NULL,
-                    accepted_at TIMESTAMP NULL,
-                    UNIQUE(requester_client_id, requested_client_id),
-                    FOREIGN KEY(requested_client_id) REFERENCES users(id) ON DELETE CASCADE,
-                    FOREIGN KEY(requester_client_id) REFERENCES users(id) ON DELETE CASCADE
-                    )
-                """
-            )
-            conn.execute(
-                """
-                CREATE TABLE IF NOT EXISTS events (
-                    id INTEGER PRIMARY KEY AUTOINCREMENT,
-                    created_at TIMESTAMP NOT NULL,
-                    end_date TIMESTAMP NOT NULL,
-                    location TEXT NOT NULL,
-                    name TEXT NOT NULL,
-                    start_date TIMESTAMP NOT NULL,
-                    max_tickets INTEGER NOT NULL,
-                    initial_max_tickets INTEGER NOT NULL,
-                    organizer_id INTEGER NOT NULL,
-                    staffs_id TEXT DEFAULT NULL,
-                    tickets_redeemed INTEGER NOT NULL,
-                    FOREIGN KEY(organizer_id) REFERENCES users(id) ON DELETE CASCADE
-                    )
-                """
-            )
-            conn.execute(
-                """
-                CREATE TABLE IF NOT EXISTS tickets (
-                    id INTEGER PRIMARY KEY AUTOINCREMENT,
-                    event_id INTEGER NOT NULL,
-                    client_id INTEGER NOT NULL,
-                    code TEXT NOT NULL UNIQUE,
-                    status TEXT NOT NULL,
-                    created_at TIMESTAMP NOT NULL,
-                    FOREIGN KEY(event_id) REFERENCES events(id) ON DELETE CASCADE,
-                    FOREIGN KEY(client_id) REFERENCES users(id) ON DELETE CASCADE
-                )
-                """
-            )
-            conn.commit()
+            SQLiteMigrationRunner(MIGRATIONS).migrate(conn)
+
+        if self._pragma_profile.uses_wal:
+            self._checkpointer.start()
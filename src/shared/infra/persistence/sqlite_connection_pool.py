@@ -0,0 +1,165 @@
+from __future__ import annotations
+
+import sqlite3
+import threading
+import time
+from collections.abc import Callable, Iterator
+from contextlib import contextmanager
+from dataclasses import dataclass, field
+
+from shared.infra.persistence.errors import (
+    ConnectionPoolClosedError,
+    ConnectionPoolTimeoutError,
+)
+
+
+@dataclass
+class _PooledConnection:
+    conn: sqlite3.Connection
+    last_used_at: float = field(default_factory=time.monotonic)
+
+
+class SQLiteConnectionPool:
+    """Bounded pool of long-lived SQLite connections.
+
+    A thread borrows one connection for the duration of a ``with`` block and
+    nested borrows from the same thread reuse it, so a repository call made
+    inside another one never waits on itself. Connections that sat idle for
+    longer than ``health_check_after`` seconds are probed before being handed
+    out and replaced if the probe fails.
+    """
+
+    def __init__(
+        self,
+        factory: Callable[[], sqlite3.Connection],
+        max_size: int = 5,
+        timeout: float = 30.0,
+        health_check_after: float = 60.0,
+    ) -> None:
+        if max_size < 1:
+            raise ValueError(f"Invalid pool size: {max_size}.")
+
+        self._factory = factory
+        self._max_size = max_size
+        self._timeout = timeout
+        self._health_check_after = health_check_after
+        self._idle: list[_PooledConnection] = []
+        self._size = 0
+        self._closed = False
+        self._condition = threading.Condition()
+        self._local = threading.local()
+
+    @property
+    def max_size(self) -> int:
+        return self._max_size
+
+    @property
+    def size(self) -> int:
+        with self._condition:
+            return self._size
+
+    @property
+    def idle_count(self) -> int:
+        with self._condition:
+            return len(self._idle)
+
+    @contextmanager
+    def connection(self) -> Iterator[sqlite3.Connection]:
+        held: _PooledConnection | None = getattr(self._local, "held", None)
+        if held is not None:
+            yield held.conn
+            return
+
+        pooled = self._acquire()
+        self._local.held = pooled
+        try:
+            yield pooled.conn
+            if pooled.conn.in_transaction:
+                pooled.conn.commit()
+        except BaseException:
+            if pooled.conn.in_transaction:
+                pooled.conn.rollback()
+            raise
+        finally:
+            self._local.held = None
+            self._release(pooled)
+
+    def close(self) -> None:
+        with self._condition:
+            self._closed = True
+            idle, self._idle = self._idle, []
+            self._size -= len(idle)
+            self._condition.notify_all()
+
+        for pooled in idle:
+            pooled.conn.close()
+
+    def _acquire(self) -> _PooledConnection:
+        deadline = time.monotonic() + self._timeout
+        while True:
+            with self._condition:
+                pooled = None
+                while pooled is None:
+                    if self._closed:
+                        raise ConnectionPoolClosedError()
+                    if self._idle:
+                        pooled = self._idle.pop()
+                    elif self._size < self._max_size:
+                        self._size += 1
+                        break
+                    else:
+                        remaining = deadline - time.monotonic()
+                        if remaining <= 0:
+                            raise ConnectionPoolTimeoutError(self._timeout)
+                        self._condition.wait(remaining)
+
+            if pooled is None:
+                return self._open()
+            if self._is_healthy(pooled):
+                return pooled
+            self._discard(pooled)
+
+    def _open(self) -> _PooledConnection:
+        try:
+            return _PooledConnection(conn=self._factory())
+        except BaseException:
+            with self._condition:
+                self._size -= 1
+                self._condition.notify()
+            raise
+
+    def _is_healthy(self, pooled: _PooledConnection) -> bool:
+        if time.monotonic() - pooled.last_used_at < self._health_check_after:
+            return True
+        try:
+            pooled.conn.execute("SELECT 1").fetchone()
+        except sqlite3.Error:
+            return False
+        return True
+
+    def _discard(self, pooled: _PooledConnection) -> None:
+        try:
+            pooled.conn.close()
+        except sqlite3.Error:
+            pass
+        with self._condition:
+            self._size -= 1
+            self._condition.notify()
+
+    def _release(self, pooled: _PooledConnection) -> None:
+        try:
+            if pooled.conn.in_transaction:
+                pooled.conn.rollback()
+        except sqlite3.Error:
+            self._discard(pooled)
+            return
+
+        with self._condition:
+            if not self._closed:
+                pooled.last_used_at = time.monotonic()
+                self._idle.append(pooled)
+                self._condition.notify()
+                return
+            self._size -= 1
+
+        pooled.conn.close()
@@ -0,0 +1,200 @@
+from __future__ import annotations
+
+import sqlite3
+import threading
+import time
+from collections import OrderedDict
+from collections.abc import Sequence
+from dataclasses import dataclass
+from enum import Enum
+from typing import Any
+
+
+class CountStrategy(str, Enum):
+    # COUNT(*) OVER () on the page query, so rows and total cost one scan.
+    WINDOW = "WINDOW"
+    # Total memoised per filter set and dropped when a dependent table is written.
+    CACHED = "CACHED"
+    # No count at all: one extra row is fetched and the total is a lower bound.
+    HAS_MORE = "HAS_MORE"
+
+
+@dataclass(frozen=True)
+class SQLitePage:
+    rows: list[tuple[Any, ...]]
+    total_count: int
+    has_more: bool
+
+
+@dataclass
+class _CountEntry:
+    tables: frozenset[str]
+    value: int
+    stored_at: float
+
+
+class SQLiteCountCache:
+    """Bounded LRU of ``COUNT(*)`` results keyed by query and parameters.
+
+    Entries record which tables they were computed from; writing to any of
+    those tables bumps its generation and drops the entries. A count that
+    was computed while a write happened is discarded instead of stored.
+    """
+
+    def __init__(self, max_entries: int = 256, ttl_seconds: float = 30.0) -> None:
+        self._max_entries = max_entries
+        self._ttl_seconds = ttl_seconds
+        self._entries: OrderedDict[tuple, _CountEntry] = OrderedDict()
+        self._generations: dict[str, int] = {}
+        self._lock = threading.Lock()
+
+    def snapshot(self, tables: Sequence[str]) -> tuple[int, ...]:
+        with self._lock:
+            return tuple(self._generations.get(table, 0) for table in tables)
+
+    def get(self, key: tuple) -> int | None:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            if time.monotonic() - entry.stored_at > self._ttl_seconds:
+                del self._entries[key]
+                return None
+            self._entries.move_to_end(key)
+            return entry.value
+
+    def put(
+        self,
+        key: tuple,
+        tables: Sequence[str],
+        value: int,
+        snapshot: tuple[int, ...],
+    ) -> None:
+        with self._lock:
+            current = tuple(self._generations.get(table, 0) for table in tables)
+            if current != snapshot:
+                return
+            self._entries[key] = _CountEntry(
+                tables=frozenset(tables), value=value, stored_at=time.monotonic()
+            )
+            self._entries.move_to_end(key)
+            while len(self._entries) > self._max_entries:
+                self._entries.popitem(last=False)
+
+    def invalidate(self, *tables: str) -> None:
+        with self._lock:
+            for table in tables:
+                self._generations[table] = self._generations.get(table, 0) + 1
+            stale_keys = [
+                key
+                for key, entry in self._entries.items()
+                if not entry.tables.isdisjoint(tables)
+            ]
+            for key in stale_keys:
+                del self._entries[key]
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+
+class SQLitePaginator:
+    """Runs a filtered ``SELECT`` one page at a time with a count strategy.
+
+    ``select_sql`` is the full filtered query without ORDER BY/LIMIT; it is
+    wrapped as a subquery so DISTINCT and JOIN queries are counted correctly.
+    ``order_by`` and the keyset column refer to the subquery's output names.
+    """
+
+    def __init__(
+        self,
+        count_cache: SQLiteCountCache,
+        strategy: CountStrategy = CountStrategy.CACHED,
+    ) -> None:
+        self._count_cache = count_cache
+        self._strategy = strategy
+
+    def fetch_page(
+        self,
+        conn: sqlite3.Connection,
+        select_sql: str,
+        params: Sequence[Any],
+        tables: Sequence[str],
+        order_by: str,
+        limit: int,
+        offset: int = 0,
+        after: Any | None = None,
+        before: Any | None = None,
+    ) -> SQLitePage:
+        params = list(params)
+        keyset_clause, keyset_params, descending = self._keyset(order_by, after, before)
+        is_keyset = bool(keyset_clause)
+
+        direction = "DESC" if descending else "ASC"
+        page_clause = f" ORDER BY {order_by} {direction} LIMIT ?"
+        page_params: list[Any] = [limit]
+        if not is_keyset:
+            page_clause += " OFFSET ?"
+            page_params.append(offset)
+
+        if self._strategy == CountStrategy.HAS_MORE:
+            page_params[0] = limit + 1
+            rows = conn.execute(
+                f"SELECT * FROM ({select_sql}){keyset_clause}{page_clause}",
+                [*params, *keyset_params, *page_params],
+            ).fetchall()
+            has_more = len(rows) > limit
+            rows = self._ordered(rows[:limit], descending)
+            total_count = offset + len(rows) + (1 if has_more else 0)
+            return SQLitePage(rows=rows, total_count=total_count, has_more=has_more)
+
+        cache_key = (select_sql, tuple(params))
+        snapshot = self._count_cache.snapshot(tables)
+        total_count = None
+        if self._strategy == CountStrategy.CACHED:
+            total_count = self._count_cache.get(cache_key)
+
+        if total_count is None and not is_keyset:
+            windowed_rows = conn.execute(
+                f"SELECT *, COUNT(*) OVER () FROM ({select_sql}){page_clause}",
+                [*params, *page_params],
+            ).fetchall()
+            rows = [row[:-1] for row in windowed_rows]
+            if windowed_rows:
+                total_count = windowed_rows[0][-1]
+            elif offset == 0:
+                total_count = 0
+        else:
+            rows = conn.execute(
+                f"SELECT * FROM ({select_sql}){keyset_clause}{page_clause}",
+                [*params, *keyset_params, *page_params],
+            ).fetchall()
+
+        if total_count is None:
+            total_count = conn.execute(
+                f"SELECT COUNT(*) FROM ({select_sql})", params
+            ).fetchone()[0]
+
+        if self._strategy == CountStrategy.CACHED:
+            self._count_cache.put(cache_key, tables, int(total_count), snapshot)
+
+        rows = self._ordered(rows, descending)
+        if is_keyset:
+            has_more = len(rows) == limit
+        else:
+            has_more = offset + len(rows) < total_count
+        return SQLitePage(rows=rows, total_count=int(total_count), has_more=has_more)
+
+    def _keyset(
+        self, order_by: str, after: Any | None, before: Any | None
+    ) -> tuple[str, list[Any], bool]:
+        if after is not None:
+            return f" WHERE {order_by} > ?", [after], False
+        if before is not None:
+            return f" WHERE {order_by} < ?", [before], True
+        return "", [], False
+
+    def _ordered(self, rows: list, descending: bool) -> list:
+        if descending:
+            rows.reverse()
+        return rows
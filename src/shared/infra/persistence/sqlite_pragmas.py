@@ -0,0 +1,111 @@
+from __future__ import annotations
+
+import sqlite3
+import threading
+from dataclasses import dataclass
+
+from shared.infra.persistence.errors import PersistenceError
+
+_JOURNAL_MODES = {"DELETE", "TRUNCATE", "PERSIST", "MEMORY", "WAL", "OFF"}
+_SYNCHRONOUS_MODES = {"OFF", "NORMAL", "FULL", "EXTRA"}
+_TEMP_STORES = {"DEFAULT", "FILE", "MEMORY"}
+_CHECKPOINT_MODES = {"PASSIVE", "FULL", "RESTART", "TRUNCATE"}
+
+
+def _choice(name: str, value: str, allowed: set[str]) -> str:
+    normalized = value.upper()
+    if normalized not in allowed:
+        raise ValueError(f'Invalid {name}: "{value}".')
+    return normalized
+
+
+@dataclass(frozen=True)
+class SQLitePragmaProfile:
+    """PRAGMAs applied to every connection when the pool opens it.
+
+    The defaults favour a desktop app with one writer and several readers:
+    WAL lets list screens keep reading while a redemption is being written,
+    and ``synchronous=NORMAL`` is durable enough in WAL mode.
+    """
+
+    journal_mode: str = "WAL"
+    synchronous: str = "NORMAL"
+    busy_timeout_ms: int = 5000
+    cache_size_kib: int = 16 * 1024
+    mmap_size_bytes: int = 128 * 1024 * 1024
+    temp_store: str = "MEMORY"
+    wal_autocheckpoint_pages: int = 1000
+    foreign_keys: bool = True
+
+    def apply(self, conn: sqlite3.Connection) -> None:
+        journal_mode = _choice("journal_mode", self.journal_mode, _JOURNAL_MODES)
+        synchronous = _choice("synchronous", self.synchronous, _SYNCHRONOUS_MODES)
+        temp_store = _choice("temp_store", self.temp_store, _TEMP_STORES)
+
+        conn.execute(f"PRAGMA busy_timeout = {int(self.busy_timeout_ms)}")
+        conn.execute(f"PRAGMA journal_mode = {journal_mode}")
+        conn.execute(f"PRAGMA synchronous = {synchronous}")
+        # A negative cache_size is interpreted by SQLite as KiB instead of pages.
+        conn.execute(f"PRAGMA cache_size = {-int(self.cache_size_kib)}")
+        conn.execute(f"PRAGMA mmap_size = {int(self.mmap_size_bytes)}")
+        conn.execute(f"PRAGMA temp_store = {temp_store}")
+        conn.execute(
+            f"PRAGMA wal_autocheckpoint = {int(self.wal_autocheckpoint_pages)}"
+        )
+        conn.execute(f"PRAGMA foreign_keys = {'ON' if self.foreign_keys else 'OFF'}")
+
+    @property
+    def uses_wal(self) -> bool:
+        return self.journal_mode.upper() == "WAL"
+
+
+@dataclass(frozen=True)
+class SQLiteCheckpointPolicy:
+    """How often the WAL file is folded back into the main database.
+
+    ``interval_seconds <= 0`` leaves checkpointing to ``wal_autocheckpoint``.
+    """
+
+    interval_seconds: float = 300.0
+    mode: str = "PASSIVE"
+    truncate_on_close: bool = True
+
+
+class SQLiteCheckpointer:
+    def __init__(self, db, policy: SQLiteCheckpointPolicy) -> None:
+        self._db = db
+        self._policy = policy
+        self._mode = _choice("checkpoint mode", policy.mode, _CHECKPOINT_MODES)
+        self._stop_event = threading.Event()
+        self._thread: threading.Thread | None = None
+
+    def start(self) -> None:
+        if self._thread is not None or self._policy.interval_seconds <= 0:
+            return
+        self._thread = threading.Thread(
+            target=self._run, name="sqlite-checkpointer", daemon=True
+        )
+        self._thread.start()
+
+    def stop(self) -> None:
+        self._stop_event.set()
+        if self._thread is not None:
+            self._thread.join()
+            self._thread = None
+        if self._policy.truncate_on_close:
+            self.checkpoint("TRUNCATE")
+
+    def checkpoint(self, mode: str | None = None) -> tuple[int, int, int]:
+        """Run a checkpoint and return SQLite's (busy, log, checkpointed) row."""
+        mode = _choice("checkpoint mode", mode or self._mode, _CHECKPOINT_MODES)
+        with self._db.connect() as conn:
+            row = conn.execute(f"PRAGMA wal_checkpoint({mode})").fetchone()
+        return tuple(row)
+
+    def _run(self) -> None:
+        while not self._stop_event.wait(self._policy.interval_seconds):
+            try:
+                self.checkpoint()
+            except (sqlite3.Error, PersistenceError):
+                # A busy database only delays the next checkpoint.
+                continue
@@ -0,0 +1,160 @@
+from __future__ import annotations
+
+import sys
+import threading
+import time
+from collections.abc import Sequence
+from dataclasses import dataclass
+from typing import TextIO
+
+
+@dataclass(frozen=True)
+class ImportTiming:
+    module: str
+    self_seconds: float
+    cumulative_seconds: float
+
+
+class _TimedLoader:
+    """Delegating loader that times ``exec_module`` for the profiler."""
+
+    def __init__(self, loader, profiler: StartupProfiler) -> None:
+        self._loader = loader
+        self._profiler = profiler
+
+    def __getattr__(self, name):
+        return getattr(self._loader, name)
+
+    def create_module(self, spec):
+        return self._loader.create_module(spec)
+
+    def exec_module(self, module) -> None:
+        self._profiler._enter_import()
+        try:
+            self._loader.exec_module(module)
+        finally:
+            self._profiler._exit_import(module.__name__)
+
+
+class _TimingFinder:
+    """Meta path hook that wraps the loader every other finder returns."""
+
+    def __init__(self, profiler: StartupProfiler) -> None:
+        self._profiler = profiler
+        self._local = threading.local()
+
+    def find_spec(self, fullname, path, target=None):
+        if getattr(self._local, "busy", False):
+            return None
+        self._local.busy = True
+        try:
+            for finder in sys.meta_path:
+                if finder is self or not hasattr(finder, "find_spec"):
+                    continue
+                spec = finder.find_spec(fullname, path, target)
+                if spec is not None:
+                    break
+            else:
+                return None
+        finally:
+            self._local.busy = False
+
+        if spec.loader is not None and hasattr(spec.loader, "exec_module"):
+            spec.loader = _TimedLoader(spec.loader, self._profiler)
+        return spec
+
+
+class StartupProfiler:
+    """Time-to-first-window report, in the spirit of ``python -X importtime``.
+
+    Once ``enable`` is called, every module imported afterwards is timed (self
+    and cumulative, like ``-X importtime``), the composition root records how
+    long each provider took to build, and ``mark`` stamps named milestones.
+    ``report`` prints all of it, slowest first. While disabled every method is
+    a no-op, so the hooks can stay in place.
+    """
+
+    def __init__(self) -> None:
+        self.enabled = False
+        self._started_at = time.perf_counter()
+        self._finder: _TimingFinder | None = None
+        self._lock = threading.Lock()
+        self._stack: list[list[float]] = []
+        self._imports: list[ImportTiming] = []
+        self._providers: list[tuple[str, float]] = []
+        self._marks: list[tuple[str, float]] = []
+        self._reported = False
+
+    def enable(self) -> None:
+        if self.enabled:
+            return
+        self.enabled = True
+        self._started_at = time.perf_counter()
+        self._finder = _TimingFinder(self)
+        sys.meta_path.insert(0, self._finder)
+
+    def disable(self) -> None:
+        self.enabled = False
+        if self._finder in sys.meta_path:
+            sys.meta_path.remove(self._finder)
+        self._finder = None
+
+    def mark(self, label: str) -> None:
+        if self.enabled:
+            self._marks.append((label, time.perf_counter() - self._started_at))
+
+    def record_provider(self, name: str, seconds: float) -> None:
+        if self.enabled:
+            self._providers.append((name, seconds))
+
+    def imports(self) -> Sequence[ImportTiming]:
+        return tuple(self._imports)
+
+    def report(self, stream: TextIO | None = None, top: int = 20) -> None:
+        """Print the report once and stop timing; later calls do nothing."""
+        if not self.enabled or self._reported:
+            return
+        self._reported = True
+        stream = stream or sys.stderr
+
+        print("Startup report", file=stream)
+        for label, at in self._marks:
+            print(f"  {at * 1000:9.1f} ms  {label}", file=stream)
+
+        if self._providers:
+            print("\nProviders built (inclusive)", file=stream)
+            for name, seconds in sorted(self._providers, key=lambda p: -p[1]):
+                print(f"  {seconds * 1000:9.1f} ms  {name}", file=stream)
+
+        imports = sorted(self._imports, key=lambda i: -i.cumulative_seconds)
+        print(f"\nSlowest of {len(imports)} imports  (self | cumulative)", file=stream)
+        for timing in imports[:top]:
+            print(
+                f"  {timing.self_seconds * 1000:9.1f} | "
+                f"{timing.cumulative_seconds * 1000:9.1f} ms  {timing.module}",
+                file=stream,
+            )
+        self.disable()
+
+    def _enter_import(self) -> None:
+        if threading.current_thread() is threading.main_thread():
+            self._stack.append([time.perf_counter(), 0.0])
+
+    def _exit_import(self, module: str) -> None:
+        if threading.current_thread() is not threading.main_thread():
+            return
+        started_at, children = self._stack.pop()
+        cumulative = time.perf_counter() - started_at
+        if self._stack:
+            self._stack[-1][1] += cumulative
+        with self._lock:
+            self._imports.append(
+                ImportTiming(module, max(0.0, cumulative - children), cumulative)
+            )
+
+
+_profiler = StartupProfiler()
+
+
+def get_startup_profiler() -> StartupProfiler:
+    return _profiler
@@ -9,6 +9,7 @@ from typing import Any
 import FreeSimpleGUI as sg
 
 from shared.infra.error_logger import log_error
+from shared.infra.startup_profiler import get_startup_profiler
 from shared.ui.components.action_buttons_component import ActionButtonsComponent
 from shared.ui.styles import (
     BUTTON_SIZES,
@@ -98,6 +99,10 @@ class BaseGUI(ABC):
             finalize=True,
             element_justification="center",
         )
+        # Only the first window reports; later calls are no-ops.
+        profiler = get_startup_profiler()
+        profiler.mark(f"{self.title} window shown")
+        profiler.report()
         return self.run()
 
     def run(self):
@@ -123,6 +128,27 @@ class BaseGUI(ABC):
         if self.window:
             self.window.close()
 
+    def hide(self):
+        """Hide the window while another screen is shown on top of it"""
+        if self.window:
+            self.window.hide()
+
+    def resume(self):
+        """Show the window again when the screen on top of it is closed"""
+        if self.window:
+            self.window.un_hide()
+            self.on_resume()
+
+    def on_resume(self):
+        """Hook for screens that need to update themselves when shown again.
+
+        Screens listing data in ``self.table`` re-render it; the page is served
+        from the page cache unless a write changed the list meanwhile.
+        """
+        table = getattr(self, "table", None)
+        if table is not None:
+            table.refresh(self.window)
+
     def _show_popup_template(
         self, config: PopupConfig
     ) -> tuple[str | None, dict | None]:
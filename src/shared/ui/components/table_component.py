@@ -1,4 +1,5 @@
 import os
+import threading
 from collections.abc import Callable
 from typing import Any
 
@@ -18,6 +19,10 @@ class TableComponent:
         items_per_page: int = 10,
         has_hidden_id_column: bool = False,
         filters: list[dict[str, Any]] | None = None,
+        cursor_pagination: bool = False,
+        error_callback: Callable[[Exception], None] | None = None,
+        async_loading: bool = True,
+        prefetch_next_page: bool = True,
     ):
         self.headers = headers
         self.data_callback = data_callback
@@ -26,18 +31,38 @@ class TableComponent:
         self.items_per_page = items_per_page
         self.has_hidden_id_column = has_hidden_id_column
         self.filters = filters
+        self.cursor_pagination = cursor_pagination
         self.current_page = 1
         self.total_items = 0
         self.total_pages = 1
         self.data = []
+        self.current_cursor = None
+        self.next_cursor = None
+        self.previous_cursor = None
+        self.error_callback = error_callback
+        self.async_loading = async_loading
+        self.prefetch_next_page = prefetch_next_page
+        self.is_loading = False
+
+        # Every request gets an id; only the result of the latest one is shown.
+        self._request_id = 0
+        self._pending: tuple[int, str | None] = (1, None)
+        self._completed: dict[int, tuple[dict[str, Any] | None, Exception | None]] = {}
+        self._completed_lock = threading.Lock()
+        # Prefetched results are tagged with the generation they were loaded
+        # in; refreshing or changing the filter starts a new generation.
+        self._generation = 0
+        self._prefetched: dict[tuple, dict[str, Any]] = {}
 
         self.prev_key = f"{key}_PREV"
         self.next_key = f"{key}_NEXT"
         self.page_info_key = f"{key}_PAGE_INFO"
         self.total_items_key = f"{key}_TOTAL"
         self.refresh_key = f"{key}_REFRESH"
+        self.loaded_key = f"{key}_LOADED"
         self.filter_component = FilterRadioRowComponent(self.filters)
 
+        # The window does not exist yet, so the first page loads synchronously.
         self._load_data()
 
     def create_layout(self):
@@ -121,55 +146,173 @@ class TableComponent:
 
         return layout
 
-    def _load_data(self, window: sg.Window | None = None):
+    def _load_data(self, window: sg.Window | None = None, cursor: str | None = None):
+        filter_value = self._current_filter_value(window)
         try:
-            filter_value = None
+            result = self._fetch(self.current_page, cursor, filter_value)
+        except Exception as e:
+            result = {"data": [], "total": 0}
+            self._report_error(e)
+        self._apply_result(result, cursor)
 
-            if self.filters:
-                is_window_available = window is not None
+    def _current_filter_value(self, window: sg.Window | None) -> Any:
+        if not self.filters:
+            return None
+        if window is not None:
+            return self._get_selected_filter_value(window)
+        return self._get_default_filter_value()
 
-                if is_window_available:
-                    filter_value = self._get_selected_filter_value(window)
-                else:
-                    filter_value = self._get_default_filter_value()
+    def _fetch(
+        self, page: int, cursor: str | None, filter_value: Any
+    ) -> dict[str, Any]:
+        args = [page, self.items_per_page]
+        if filter_value is not None:
+            args.append(filter_value)
 
-            if filter_value is not None:
-                result = self.data_callback(
-                    self.current_page, self.items_per_page, filter_value
-                )
-            else:
-                result = self.data_callback(self.current_page, self.items_per_page)
+        # Cursor-aware callbacks page with keyset cursors on Next/Previous and
+        # fall back to OFFSET (cursor=None) for first loads and page jumps.
+        if self.cursor_pagination:
+            return self.data_callback(*args, cursor=cursor)
+        return self.data_callback(*args)
 
-            self.data = result.get("data", [])
-            self.total_items = result.get("total", 0)
-            self.total_pages = max(
-                1, (self.total_items + self.items_per_page - 1) // self.items_per_page
-            )
-        except Exception:
-            raise
+    def _apply_result(self, result: dict[str, Any], cursor: str | None):
+        self.data = result.get("data", [])
+        self.current_cursor = cursor
+        self.next_cursor = result.get("next_cursor")
+        self.previous_cursor = result.get("previous_cursor")
+        self.total_items = result.get("total", 0)
+        self.total_pages = max(
+            1, (self.total_items + self.items_per_page - 1) // self.items_per_page
+        )
+
+    def _report_error(self, error: Exception):
+        if self.error_callback is None:
+            raise error
+        self.error_callback(error)
+
+    def _request_page(
+        self, window: sg.Window, page: int, cursor: str | None, new_generation: bool
+    ):
+        """Load ``page`` off the GUI thread and show it when it arrives."""
+        if not self.async_loading:
+            self.current_page = page
+            self._load_data(window, cursor=cursor)
+            self._update_ui(window)
+            return
+
+        if new_generation:
+            self._generation += 1
+            self._prefetched.clear()
+
+        filter_value = self._current_filter_value(window)
+        self._request_id += 1
+        request_id = self._request_id
+        pending = (page, cursor)
+
+        prefetched = self._prefetched.pop(
+            (self._generation, page, cursor, filter_value), None
+        )
+        if prefetched is not None:
+            self._pending = pending
+            self._finish_request(window, prefetched, None)
+            return
+
+        self._pending = pending
+        self._set_loading(window, True)
+
+        def work():
+            result, error = None, None
+            try:
+                result = self._fetch(page, cursor, filter_value)
+            except Exception as e:
+                error = e
+            with self._completed_lock:
+                self._completed[request_id] = (result, error)
+            window.write_event_value(self.loaded_key, request_id)
+
+        threading.Thread(target=work, name=f"{self.key}-load", daemon=True).start()
+
+    def _handle_loaded(self, window: sg.Window):
+        with self._completed_lock:
+            completed, self._completed = self._completed, {}
+        # Anything but the latest request is a stale answer to an old click.
+        outcome = completed.get(self._request_id)
+        if outcome is not None:
+            self._finish_request(window, *outcome)
+
+    def _finish_request(
+        self,
+        window: sg.Window,
+        result: dict[str, Any] | None,
+        error: Exception | None,
+    ):
+        page, cursor = self._pending
+        self._set_loading(window, False)
+        if error is not None:
+            self._update_ui(window)
+            self._report_error(error)
+            return
+
+        self.current_page = page
+        self._apply_result(result, cursor)
+        self._update_ui(window)
+        self._prefetch_next(window)
+
+    def _prefetch_next(self, window: sg.Window):
+        if not (self.async_loading and self.prefetch_next_page):
+            return
+        if self.current_page >= self.total_pages:
+            return
+
+        page = self.current_page + 1
+        cursor = self.next_cursor if self.cursor_pagination else None
+        filter_value = self._current_filter_value(window)
+        generation = self._generation
+        prefetch_key = (generation, page, cursor, filter_value)
+        if prefetch_key in self._prefetched:
+            return
+
+        def work():
+            try:
+                result = self._fetch(page, cursor, filter_value)
+            except Exception:
+                # The real request will run (and report) again on click.
+                return
+            if generation == self._generation:
+                self._prefetched = {prefetch_key: result}
+
+        threading.Thread(target=work, name=f"{self.key}-prefetch", daemon=True).start()
+
+    def _set_loading(self, window: sg.Window, is_loading: bool):
+        self.is_loading = is_loading
+        if is_loading:
+            window[self.page_info_key].update("Loading...")
+            window[self.prev_key].update(disabled=True)
+            window[self.next_key].update(disabled=True)
+        window[self.refresh_key].update(disabled=is_loading)
 
     def handle_event(self, event: str, window: sg.Window) -> bool:
+        if event == self.loaded_key:
+            self._handle_loaded(window)
+            return True
+
         if event == self.refresh_key:
             self.refresh(window)
             return True
 
         if event == self.prev_key and self.current_page > 1:
-            self.current_page -= 1
-            self._load_data(window)
-            self._update_ui(window)
+            self._request_page(
+                window, self.current_page - 1, self.previous_cursor, False
+            )
             return True
 
         elif event == self.next_key and self.current_page < self.total_pages:
-            self.current_page += 1
-            self._load_data(window)
-            self._update_ui(window)
+            self._request_page(window, self.current_page + 1, self.next_cursor, False)
             return True
 
         if self.filters:
             if event in self.filter_component.filter_keys:
-                self.current_page = 1
-                self._load_data(window)
-                self._update_ui(window)
+                self._request_page(window, 1, None, True)
                 return True
 
         return False
@@ -192,8 +335,11 @@ class TableComponent:
         window[self.next_key].update(disabled=(self.current_page >= self.total_pages))
 
     def refresh(self, window: sg.Window):
-        self._load_data(window)
-        self._update_ui(window)
+        self._request_page(window, self.current_page, self.current_cursor, True)
+
+    def go_to_page(self, page: int, window: sg.Window):
+        page = min(max(1, page), self.total_pages)
+        self._request_page(window, page, None, True)
 
     def _get_selected_filter_value(self, window: sg.Window) -> Any:
         keys = self.filter_component.filter_keys
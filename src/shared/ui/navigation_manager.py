@@ -1,20 +1,51 @@
+import os
 from typing import Any
 
 
+def _process_memory_bytes() -> int | None:
+    """Resident set size of this process, or None where it can't be read."""
+    try:
+        with open("/proc/self/statm") as statm:
+            resident_pages = int(statm.read().split()[1])
+    except (OSError, ValueError, IndexError):
+        return None
+    return resident_pages * os.sysconf("SC_PAGE_SIZE")
+
+
 class NavigationManager:
-    def __init__(self, use_cases=None):
+    """Stack of screens shown one at a time.
+
+    With ``retain_screens`` enabled, pushing a screen only hides the one below
+    it; going back unhides it instead of rebuilding its layout, reloading its
+    tables and decoding its images again. At most ``max_retained_screens``
+    hidden screens are kept, and while the process uses more than
+    ``max_retained_memory_mb`` (where that can be measured) the oldest ones
+    are closed. A screen that was closed this way is rebuilt on back, as it is
+    when retention is disabled.
+    """
+
+    def __init__(
+        self,
+        use_cases=None,
+        retain_screens: bool = True,
+        max_retained_screens: int = 4,
+        max_retained_memory_mb: int | None = 512,
+    ):
         self.use_cases = use_cases
         self.screen_stack: list[dict[str, Any]] = []
         self.current_screen = None
+        self.retain_screens = retain_screens
+        self.max_retained_screens = max_retained_screens
+        self.max_retained_memory_mb = max_retained_memory_mb
 
     def push_screen(self, screen_class: type, **kwargs) -> bool:
         """
         Push a new screen onto the stack and show it.
         Returns True if user completed the screen normally, False if user went back.
         """
-        # Close current screen if exists
+        # Hide (or close) current screen if exists
         if self.current_screen:
-            self.current_screen.close()
+            self._leave_current_screen()
 
         # Create screen instance with navigator reference
         screen_instance = screen_class(
@@ -26,6 +57,7 @@ class NavigationManager:
             "class": screen_class,
             "instance": screen_instance,
             "kwargs": kwargs,
+            "retained": False,
         }
         self.screen_stack.append(screen_info)
         self.current_screen = screen_instance
@@ -33,10 +65,19 @@ class NavigationManager:
         # Show screen and get result
         result = screen_instance.show()
 
+        # The screen already left the stack (it called pop_screen itself)
+        if not any(info is screen_info for info in self.screen_stack):
+            return True
+
         # If result is False, it means user clicked back
         if not result:
             return self.pop_screen()
 
+        # The window was closed: hidden screens below it must close too, as
+        # their own loops would otherwise wait on windows nobody can see.
+        if self.retain_screens:
+            self.clear_stack()
+
         return True
 
     def pop_screen(self) -> bool:
@@ -58,6 +99,14 @@ class NavigationManager:
         # Get previous screen from stack
         previous = self.screen_stack[-1]
 
+        # A retained screen is still running its loop below us; unhiding its
+        # window hands control back to it.
+        if previous["retained"]:
+            previous["retained"] = False
+            self.current_screen = previous["instance"]
+            self.current_screen.resume()
+            return True
+
         # Recreate and show previous screen with navigator reference
         screen_instance = previous["class"](
             use_cases=self.use_cases, navigator=self, **previous["kwargs"]
@@ -83,6 +132,7 @@ class NavigationManager:
             current = self.screen_stack.pop()
             if current["instance"]:
                 current["instance"].close()
+            self.current_screen = None
 
         # Push new screen
         return self.push_screen(screen_class, **kwargs)
@@ -98,3 +148,38 @@ class NavigationManager:
     def get_stack_size(self) -> int:
         """Get current stack size."""
         return len(self.screen_stack)
+
+    def get_retained_count(self) -> int:
+        """Get how many hidden screens are kept alive."""
+        return sum(1 for info in self.screen_stack if info["retained"])
+
+    def _leave_current_screen(self):
+        current = self.screen_stack[-1] if self.screen_stack else None
+        if (
+            not self.retain_screens
+            or self.max_retained_screens <= 0
+            or current is None
+            or current["instance"] is not self.current_screen
+        ):
+            self.current_screen.close()
+            return
+
+        self.current_screen.hide()
+        current["retained"] = True
+        self._enforce_retention_limits()
+
+    def _enforce_retention_limits(self):
+        retained = [info for info in self.screen_stack if info["retained"]]
+        while retained and (
+            len(retained) > self.max_retained_screens or self._over_memory_cap()
+        ):
+            # The screen deepest in the stack is the least likely to be seen.
+            oldest = retained.pop(0)
+            oldest["retained"] = False
+            oldest["instance"].close()
+
+    def _over_memory_cap(self) -> bool:
+        if self.max_retained_memory_mb is None:
+            return False
+        used = _process_memory_bytes()
+        return used is not None and used > self.max_retained_memory_mb * 1024 * 1024
@@ -0,0 +1,35 @@
+from __future__ import annotations
+
+from shared.application.page_cache import PageCache, PageCacheScope
+from ticket.application.dtos import CountFriendsAttendingInputDto
+from ticket.infra.persistence.sqlite_ticket_repository import SqliteTicketsRepository
+
+
+class CountFriendsAttendingUseCase:
+    """How many of a client's accepted friends hold tickets, per listed event.
+
+    Results are cached per client and page of events; redeeming a ticket and
+    accepting or deleting a friendship invalidate them.
+    """
+
+    def __init__(
+        self,
+        tickets_repository: SqliteTicketsRepository,
+        page_cache: PageCache | None = None,
+    ) -> None:
+        self._tickets_repository = tickets_repository
+        self._page_cache = page_cache
+
+    def execute(self, input_dto: CountFriendsAttendingInputDto) -> dict[int, int]:
+        if not input_dto.event_ids:
+            return {}
+        if self._page_cache is None:
+            return self._count(input_dto)
+        return self._page_cache.get_or_load(
+            PageCacheScope.FRIENDS_ATTENDING, input_dto, lambda: self._count(input_dto)
+        )
+
+    def _count(self, input_dto: CountFriendsAttendingInputDto) -> dict[int, int]:
+        return self._tickets_repository.count_friends_attending(
+            input_dto.client_id, list(input_dto.event_ids)
+        )
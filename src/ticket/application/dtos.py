@@ -1,8 +1,18 @@
-from dataclasses import dataclass
+from dataclasses import dataclass, field
+from datetime import datetime
 
+from event.domain.event import Event
+from ticket.domain.ticket import Ticket
 from user.domain.user_role import UserRole
 
 
+@dataclass(frozen=True)
+class CountFriendsAttendingInputDto:
+    client_id: int
+    # A tuple so the DTO can key the page cache.
+    event_ids: tuple[int, ...]
+
+
 @dataclass(frozen=True)
 class ValidateTicketInputDto:
     user_id: int
@@ -10,6 +20,80 @@ class ValidateTicketInputDto:
     code: str
 
 
+@dataclass(frozen=True)
+class ValidateTicketsInputDto:
+    user_id: int
+    user_role: UserRole
+    codes: list[str]
+    # When each code was scanned, checked against the event window instead of
+    # the current time; used to replay offline scans. Defaults to now.
+    scanned_at: list[datetime] | None = None
+
+
+@dataclass(frozen=True)
+class TicketValidationContextDto:
+    ticket: Ticket
+    event: Event | None
+    is_staff: bool
+
+
+@dataclass(frozen=True)
+class TicketValidationResultDto:
+    code: str
+    ticket: Ticket | None = None
+    error: Exception | None = None
+
+    @property
+    def validated(self) -> bool:
+        return self.error is None
+
+
+@dataclass(frozen=True)
+class OfflineScanDto:
+    code: str
+    event_id: int
+    scanned_at: datetime
+    device_id: str
+
+
+@dataclass(frozen=True)
+class ExportOfflineSnapshotInputDto:
+    user_id: int
+    user_role: UserRole
+    path: str
+    false_positive_rate: float = 0.01
+
+
+@dataclass(frozen=True)
+class OfflineSnapshotInfoDto:
+    path: str
+    event_ids: list[int]
+    code_count: int
+    size_bytes: int
+
+
+@dataclass(frozen=True)
+class ReconcileOfflineScansInputDto:
+    user_id: int
+    user_role: UserRole
+    scans: list[OfflineScanDto]
+
+
+@dataclass(frozen=True)
+class OfflineScanConflictDto:
+    scan: OfflineScanDto
+    # The scan that validated the ticket first in the same merge, or None
+    # when it had already been validated online or by an earlier sync.
+    first_scan: OfflineScanDto | None
+
+
+@dataclass(frozen=True)
+class ReconcileOfflineScansOutputDto:
+    validated: list[OfflineScanDto] = field(default_factory=list)
+    conflicts: list[OfflineScanConflictDto] = field(default_factory=list)
+    rejected: list[TicketValidationResultDto] = field(default_factory=list)
+
+
 @dataclass
 class RedeemTicketInputDto:
     event_id: int
@@ -35,3 +35,9 @@ class TicketValidationTimeError(AppError):
     def __init__(self, start_date: datetime, end_date: datetime, event_id: int) -> None:
         message: str = f"Ticket validation is only allowed between {start_date} and {end_date} for event ID {event_id}."
         super().__init__(message)
+
+
+class UnauthorizedSnapshotExportError(AppError):
+    def __init__(self, user_id: int, user_role: UserRole) -> None:
+        message: str = f"User with ID '{user_id}' and role '{user_role.value}' cannot export an offline validation snapshot."
+        super().__init__(message)
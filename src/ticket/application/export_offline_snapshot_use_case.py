@@ -0,0 +1,65 @@
+from __future__ import annotations
+
+from datetime import UTC, datetime
+
+from event.infra.persistence.sqlite_event_repository import SqliteEventRepository
+from ticket.domain.ticket_status import TicketStatus
+from ticket.infra.offline_snapshot import SnapshotEvent, write_offline_snapshot
+from ticket.infra.persistence.sqlite_ticket_repository import SqliteTicketsRepository
+from user.domain.user_role import UserRole
+
+from .dtos import ExportOfflineSnapshotInputDto, OfflineSnapshotInfoDto
+from .errors import UnauthorizedSnapshotExportError
+
+
+class ExportOfflineSnapshotUseCase:
+    """Writes the pending tickets a gate user may validate to a snapshot file.
+
+    Staff get the events they are assigned to, organizers the events they
+    organize; events that have already ended are left out.
+    """
+
+    def __init__(
+        self,
+        tickets_repository: SqliteTicketsRepository,
+        events_repository: SqliteEventRepository,
+    ) -> None:
+        self._tickets_repository = tickets_repository
+        self._events_repository = events_repository
+
+    def execute(
+        self, input_dto: ExportOfflineSnapshotInputDto
+    ) -> OfflineSnapshotInfoDto:
+        events = self._list_events(input_dto.user_id, input_dto.user_role)
+        event_ids = [event.id for event in events]
+        codes_by_event = self._tickets_repository.list_codes_by_event(
+            event_ids, TicketStatus.PENDING
+        )
+        size_bytes = write_offline_snapshot(
+            input_dto.path,
+            events,
+            codes_by_event,
+            false_positive_rate=input_dto.false_positive_rate,
+        )
+        return OfflineSnapshotInfoDto(
+            path=input_dto.path,
+            event_ids=event_ids,
+            code_count=sum(len(codes) for codes in codes_by_event.values()),
+            size_bytes=size_bytes,
+        )
+
+    def _list_events(self, user_id: int, user_role: UserRole) -> list[SnapshotEvent]:
+        if user_role == UserRole.STAFF:
+            event_ids = self._events_repository.list_event_ids_by_staff(user_id)
+        elif user_role == UserRole.ORGANIZER:
+            event_ids = self._events_repository.list_event_ids_by_organizer(user_id)
+        else:
+            raise UnauthorizedSnapshotExportError(user_id, user_role)
+
+        now = datetime.now(UTC)
+        events = []
+        for event_id in event_ids:
+            event = self._events_repository.get_by_id(event_id)
+            if event is not None and event.end_date >= now:
+                events.append(SnapshotEvent(event.id, event.start_date, event.end_date))
+        return events
@@ -0,0 +1,54 @@
+from __future__ import annotations
+
+from ticket.domain.errors import TicketAlreadyValidatedError
+
+from .dtos import (
+    OfflineScanConflictDto,
+    ReconcileOfflineScansInputDto,
+    ReconcileOfflineScansOutputDto,
+    ValidateTicketsInputDto,
+)
+from .validate_ticket_use_case import ValidateTicketUseCase
+
+
+class ReconcileOfflineScansUseCase:
+    """Replays offline scan logs through ``ValidateTicketUseCase.validate_many``.
+
+    Scans from every device are merged in the order they happened, and each
+    is checked against its event window at scan time. The earliest scan of
+    a code validates the ticket; any later scan of it (another gate, or a
+    ticket validated online meanwhile) is reported as a double-scan
+    conflict. Scans failing for any other reason are returned as rejected.
+    """
+
+    def __init__(self, validate_ticket_use_case: ValidateTicketUseCase) -> None:
+        self._validate_ticket_use_case = validate_ticket_use_case
+
+    def execute(
+        self, input_dto: ReconcileOfflineScansInputDto
+    ) -> ReconcileOfflineScansOutputDto:
+        scans = sorted(
+            input_dto.scans, key=lambda scan: (scan.scanned_at, scan.device_id)
+        )
+        results = self._validate_ticket_use_case.validate_many(
+            ValidateTicketsInputDto(
+                user_id=input_dto.user_id,
+                user_role=input_dto.user_role,
+                codes=[scan.code for scan in scans],
+                scanned_at=[scan.scanned_at for scan in scans],
+            )
+        )
+
+        output = ReconcileOfflineScansOutputDto()
+        first_scans = {}
+        for scan, result in zip(scans, results, strict=True):
+            if result.validated:
+                first_scans[scan.code] = scan
+                output.validated.append(scan)
+            elif isinstance(result.error, TicketAlreadyValidatedError):
+                output.conflicts.append(
+                    OfflineScanConflictDto(scan, first_scans.get(scan.code))
+                )
+            else:
+                output.rejected.append(result)
+        return output
@@ -1,52 +1,74 @@
 from __future__ import annotations
 
-import secrets
-from dataclasses import replace
 from datetime import UTC, datetime
 
 from event.domain.errors import EventHasNoTicketsAvailableError, EventNotFoundError
 from event.infra.persistence.sqlite_event_repository import SqliteEventRepository
-from shared.infra.email.smtp_ticket_email_service import SmtpEmailService
+from shared.application.page_cache import PageCache, PageCacheScope
+from shared.infra.email.email_outbox import EmailOutbox
+from shared.infra.email.sqlite_email_outbox_repository import OutboxMessage
+from shared.infra.error_logger import log_error
 from shared.infra.html_template.html_template_engine import HtmlTemplateEngine
 from ticket.application.dtos import RedeemTicketInputDto
+from ticket.application.errors import TicketCodeAlreadyExistsError
 from ticket.domain.ticket import Ticket
 from ticket.domain.ticket_status import TicketStatus
 from ticket.infra.persistence.sqlite_ticket_repository import SqliteTicketsRepository
+from ticket.infra.ticket_code_allocator import TicketCodeAllocator, generate_code
 from user.infra.persistence.sqlite_users_repository import SqliteUsersRepository
 
 
 class RedeemTicketUseCase:
+    _MAX_CODE_ATTEMPTS = 3
+
     def __init__(
         self,
         tickets_repository: SqliteTicketsRepository,
         events_repository: SqliteEventRepository,
         users_repository: SqliteUsersRepository,
-        email_service: SmtpEmailService | None = None,
+        email_outbox: EmailOutbox | None = None,
         template_engine: HtmlTemplateEngine | None = None,
+        code_allocator: TicketCodeAllocator | None = None,
+        page_cache: PageCache | None = None,
     ) -> None:
         self._tickets_repository = tickets_repository
         self._events_repository = events_repository
         self._users_repository = users_repository
-        self._email_service = email_service
+        self._email_outbox = email_outbox
         self._template_engine = template_engine
+        self._code_allocator = code_allocator
+        self._page_cache = page_cache
+
+    def _allocate_codes(self, count: int) -> list[str]:
+        if self._code_allocator is None:
+            return [generate_code() for _ in range(count)]
+        return self._code_allocator.allocate(count)
+
+    def _release_codes(self, codes: list[str]) -> None:
+        if self._code_allocator is not None:
+            self._code_allocator.release(codes)
 
-    def _generate_code(self, length: int = 6) -> str:
-        alphabet = "ABCDEFGHJKLMNPQRSTUVWXYZ23456789"  # excludes O, I, 0, 1
-        return "".join(secrets.choice(alphabet) for _ in range(length))
+    def _get_email_recipient(self, client_id: int):
+        if self._email_outbox is None:
+            return None
+        return self._users_repository.get_by_id(client_id)
 
-    def _send_email_to_client(self, client_id: int, ticket_list) -> None:
-        user = self._users_repository.get_by_id(client_id)
-        if user is not None:
-            codes_html = "<br>".join(t.code for t in ticket_list)
+    def _build_email(self, user, codes: list[str]) -> OutboxMessage | None:
+        if user is None:
+            return None
+        try:
             body = self._template_engine.render(
                 "redeem_ticket.html",
                 {
                     "user_name": getattr(user, "name", ""),
-                    "ticket_code": codes_html,
+                    "ticket_code": "<br>".join(codes),
                 },
             )
-            subject = "Your ticket(s) were redeemed"
-            self._email_service.send_email(user.email, subject, body)
+        except Exception as e:
+            # A broken template must not block the purchase itself.
+            log_error(f"Could not render ticket email for client {user.id}: {e}")
+            return None
+        return OutboxMessage(user.email, "Your ticket(s) were redeemed", body)
 
     def _get_event_or_raise(self, event_id: int):
         event = self._events_repository.get_by_id(event_id)
@@ -58,37 +80,54 @@ class RedeemTicketUseCase:
         if redeem_ticket_count > max(0, event.max_tickets - event.tickets_redeemed):
             raise EventHasNoTicketsAvailableError(event.name)
 
+    def _redeem_or_raise(
+        self, event, client_id: int, redeem_ticket_count: int, email_recipient
+    ):
+        for _ in range(self._MAX_CODE_ATTEMPTS):
+            codes = self._allocate_codes(redeem_ticket_count)
+            created_at = datetime.now(UTC)
+            ticket_list = [
+                Ticket(
+                    event_id=event.id,
+                    client_id=client_id,
+                    code=code,
+                    status=TicketStatus.PENDING,
+                    created_at=created_at,
+                )
+                for code in codes
+            ]
+            email = self._build_email(email_recipient, codes)
+            try:
+                redeemed = self._tickets_repository.redeem_many(
+                    event.id, ticket_list, email
+                )
+            except TicketCodeAlreadyExistsError:
+                self._release_codes(codes)
+                continue
+            if not redeemed:
+                self._release_codes(codes)
+                raise EventHasNoTicketsAvailableError(event.name)
+            if email is not None:
+                self._email_outbox.wake()
+            return ticket_list
+        raise TicketCodeAlreadyExistsError()
+
     def redeem_ticket(self, input_dto: RedeemTicketInputDto) -> None:
         client_id = input_dto.client_id
         redeem_ticket_count = input_dto.redeem_ticket_count
         event_id = input_dto.event_id
-        event = self._events_repository.get_by_id(event_id)
-        send_email = input_dto.send_email
-        ticket_list = []
 
         event = self._get_event_or_raise(event_id)
+        # Cheap early exit; the authoritative check happens inside redeem_many.
         self._get_ticket_available_or_raise(event, redeem_ticket_count)
 
-        for _ in range(redeem_ticket_count):
-            generated_code = self._generate_code()
-            ticket = Ticket(
-                event_id=input_dto.event_id,
-                client_id=client_id,
-                code=generated_code,
-                status=TicketStatus.PENDING,
-                created_at=datetime.now(UTC),
+        # The email is queued in the same transaction as the tickets; delivery
+        # happens on the outbox worker.
+        email_recipient = None
+        if input_dto.send_email:
+            email_recipient = self._get_email_recipient(client_id)
+        self._redeem_or_raise(event, client_id, redeem_ticket_count, email_recipient)
+        if self._page_cache is not None:
+            self._page_cache.invalidate(
+                PageCacheScope.EVENTS, PageCacheScope.FRIENDS_ATTENDING
             )
-            ticket_list.append(ticket)
-
-        self._tickets_repository.create_many(ticket_list)
-        updated_event = replace(
-            event,
-            tickets_redeemed=event.tickets_redeemed + redeem_ticket_count,
-        )
-        self._events_repository.update(updated_event)
-
-        if send_email:
-            try:
-                self._send_email_to_client(client_id, ticket_list)
-            except Exception:
-                pass
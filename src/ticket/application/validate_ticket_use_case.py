@@ -4,12 +4,19 @@ from datetime import UTC, datetime
 
 from event.domain.event import Event
 from event.infra.persistence.sqlite_event_repository import SqliteEventRepository
+from ticket.domain.errors import DomainError, TicketAlreadyValidatedError
 from ticket.domain.ticket import Ticket
 from ticket.infra.persistence.sqlite_ticket_repository import SqliteTicketsRepository
 from user.domain.user_role import UserRole
 
-from .dtos import ValidateTicketInputDto
+from .dtos import (
+    TicketValidationContextDto,
+    TicketValidationResultDto,
+    ValidateTicketInputDto,
+    ValidateTicketsInputDto,
+)
 from .errors import (
+    AppError,
     TicketEventNotFoundError,
     TicketNotFoundError,
     TicketValidationTimeError,
@@ -30,15 +37,92 @@ class ValidateTicketUseCase:
         ticket = self._get_ticket_or_raise(input_dto.code)
         event = self._get_event_or_raise(ticket.event_id)
 
-        self._validate_event_time(event)
+        self._validate_event_time(event, datetime.now(UTC))
+        is_staff = input_dto.user_role == UserRole.STAFF and (
+            self._events_repository.is_staff(event.id, input_dto.user_id)
+        )
         self._validate_authorization(
-            input_dto.user_id, input_dto.user_role, event, input_dto.code
+            input_dto.user_id, input_dto.user_role, event, input_dto.code, is_staff
         )
 
         validated_ticket = ticket.validate()
         self._tickets_repository.update(validated_ticket)
         return validated_ticket
 
+    def validate_many(
+        self, input_dto: ValidateTicketsInputDto
+    ) -> list[TicketValidationResultDto]:
+        """Validate a burst of scanned codes, returning one result per code.
+
+        All tickets, events and staff memberships are read in one query, the
+        checks run in memory and every status change is written in a single
+        transaction. A failing code does not stop the others; its result
+        carries the error ``execute`` would have raised. A code repeated in
+        the batch is checked again at each of its scan times until one
+        passes, and counts as already validated after that success.
+        """
+        contexts = self._tickets_repository.get_many_for_validation(
+            input_dto.codes, input_dto.user_id
+        )
+        now = datetime.now(UTC)
+        scanned_at = input_dto.scanned_at or [now] * len(input_dto.codes)
+        checked: list[TicketValidationResultDto | None] = []
+        passed_at: dict[str, int] = {}
+        for index, (code, at) in enumerate(
+            zip(input_dto.codes, scanned_at, strict=True)
+        ):
+            if code in passed_at:
+                checked.append(None)
+                continue
+            result = self._check(input_dto, code, contexts.get(code), at)
+            if result.validated:
+                passed_at[code] = index
+            checked.append(result)
+
+        validated_ids = self._tickets_repository.mark_validated_many([
+            checked[index].ticket.id for index in passed_at.values()
+        ])
+
+        results: list[TicketValidationResultDto] = []
+        for index, code in enumerate(input_dto.codes):
+            result = checked[index]
+            if index >= passed_at.get(code, len(checked)):
+                passed = checked[passed_at[code]]
+                if result is None or passed.ticket.id not in validated_ids:
+                    result = TicketValidationResultDto(
+                        code=code,
+                        error=TicketAlreadyValidatedError(passed.ticket.id),
+                    )
+            results.append(result)
+        return results
+
+    def _check(
+        self,
+        input_dto: ValidateTicketsInputDto,
+        code: str,
+        context: TicketValidationContextDto | None,
+        scanned_at: datetime,
+    ) -> TicketValidationResultDto:
+        try:
+            if context is None:
+                raise TicketNotFoundError(code)
+            if context.event is None:
+                raise TicketEventNotFoundError(context.ticket.event_id)
+
+            self._validate_event_time(context.event, scanned_at)
+            self._validate_authorization(
+                input_dto.user_id,
+                input_dto.user_role,
+                context.event,
+                code,
+                context.is_staff,
+            )
+            return TicketValidationResultDto(
+                code=code, ticket=context.ticket.validate()
+            )
+        except (AppError, DomainError) as e:
+            return TicketValidationResultDto(code=code, error=e)
+
     def _get_ticket_or_raise(self, code: str) -> Ticket:
         ticket = self._tickets_repository.get_by_code(code)
         if ticket is None:
@@ -51,17 +135,21 @@ class ValidateTicketUseCase:
             raise TicketEventNotFoundError(event_id)
         return event
 
-    def _validate_event_time(self, event: Event) -> None:
-        now = datetime.now(UTC)
+    def _validate_event_time(self, event: Event, now: datetime) -> None:
         if not (event.start_date <= now <= event.end_date):
             raise TicketValidationTimeError(event.start_date, event.end_date, event.id)
 
     def _validate_authorization(
-        self, user_id: int, user_role: UserRole, event: Event, code: str
+        self,
+        user_id: int,
+        user_role: UserRole,
+        event: Event,
+        code: str,
+        is_staff: bool,
     ) -> None:
         if user_role == UserRole.ORGANIZER:
             if event.organizer_id != user_id:
                 raise UnauthorizedValidationError(user_id, user_role, code)
         elif user_role == UserRole.STAFF:
-            if str(user_id) not in event.staffs_id:
+            if not is_staff:
                 raise UnauthorizedValidationError(user_id, user_role, code)
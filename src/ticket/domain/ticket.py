@@ -54,7 +54,7 @@ class Ticket:
 
     def validate(self) -> Ticket:
         if self.status == TicketStatus.VALIDATED:
-            raise TicketAlreadyValidatedError()
+            raise TicketAlreadyValidatedError(self.id or self.code)
         if self.status != TicketStatus.PENDING:
             raise TicketNotActiveError(self.id or self.code)
         return replace(self, status=TicketStatus.VALIDATED)
@@ -0,0 +1,131 @@
+from __future__ import annotations
+
+import json
+import os
+import threading
+from collections.abc import Callable
+from dataclasses import dataclass
+from datetime import UTC, datetime
+from enum import Enum
+
+from ticket.application.dtos import OfflineScanDto
+from ticket.infra.offline_snapshot import OfflineSnapshot
+
+
+class OfflineScanStatus(str, Enum):
+    ACCEPTED = "ACCEPTED"
+    UNKNOWN = "UNKNOWN"
+    ALREADY_SCANNED = "ALREADY_SCANNED"
+    OUTSIDE_EVENT_WINDOW = "OUTSIDE_EVENT_WINDOW"
+
+
+@dataclass(frozen=True)
+class OfflineScanResult:
+    code: str
+    status: OfflineScanStatus
+    event_id: int | None = None
+
+    @property
+    def accepted(self) -> bool:
+        return self.status == OfflineScanStatus.ACCEPTED
+
+
+def read_scan_log(path: str) -> list[OfflineScanDto]:
+    """Accepted scans recorded by ``OfflineGateValidator`` at ``path``.
+
+    A torn last line (the device lost power mid-write) is skipped.
+    """
+    if not os.path.exists(path):
+        return []
+
+    scans = []
+    with open(path, encoding="utf-8") as f:
+        for line in f:
+            try:
+                record = json.loads(line)
+            except json.JSONDecodeError:
+                continue
+            scans.append(
+                OfflineScanDto(
+                    code=record["code"],
+                    event_id=record["event_id"],
+                    scanned_at=datetime.fromisoformat(record["scanned_at"]),
+                    device_id=record["device_id"],
+                )
+            )
+    return scans
+
+
+class OfflineGateValidator:
+    """Validates codes on a gate device against an ``OfflineSnapshot``.
+
+    Each accepted scan is appended to a JSON-lines log at ``log_path``,
+    which is replayed on start so a restarted device still rejects codes it
+    already let in. The log is what ``ReconcileOfflineScansUseCase`` merges
+    back once the device is online; double scans across devices can only
+    be detected there.
+    """
+
+    def __init__(
+        self,
+        snapshot: OfflineSnapshot,
+        device_id: str,
+        log_path: str | None = None,
+        clock: Callable[[], datetime] | None = None,
+    ) -> None:
+        self._snapshot = snapshot
+        self._device_id = device_id
+        self._clock = clock or (lambda: datetime.now(UTC))
+        self._lock = threading.Lock()
+        self._scans = read_scan_log(log_path) if log_path else []
+        self._scanned = {scan.code for scan in self._scans}
+        self._log = open(log_path, "a", encoding="utf-8") if log_path else None
+
+    @property
+    def scans(self) -> list[OfflineScanDto]:
+        with self._lock:
+            return list(self._scans)
+
+    def close(self) -> None:
+        if self._log is not None:
+            self._log.close()
+            self._log = None
+
+    def __enter__(self) -> OfflineGateValidator:
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.close()
+
+    def scan(self, code: str) -> OfflineScanResult:
+        entry = self._snapshot.lookup(code)
+        if entry is None:
+            return OfflineScanResult(code, OfflineScanStatus.UNKNOWN)
+
+        event = entry.event
+        scanned_at = self._clock()
+        if not (event.start_date <= scanned_at <= event.end_date):
+            return OfflineScanResult(
+                code, OfflineScanStatus.OUTSIDE_EVENT_WINDOW, event.id
+            )
+
+        with self._lock:
+            if code in self._scanned:
+                return OfflineScanResult(
+                    code, OfflineScanStatus.ALREADY_SCANNED, event.id
+                )
+            scan = OfflineScanDto(code, event.id, scanned_at, self._device_id)
+            self._scanned.add(code)
+            self._scans.append(scan)
+            if self._log is not None:
+                self._log.write(
+                    json.dumps({
+                        "code": code,
+                        "event_id": event.id,
+                        "scanned_at": scanned_at.isoformat(),
+                        "device_id": self._device_id,
+                    })
+                    + "\n"
+                )
+                self._log.flush()
+        return OfflineScanResult(code, OfflineScanStatus.ACCEPTED, event.id)
@@ -0,0 +1,259 @@
+from __future__ import annotations
+
+import bisect
+import hashlib
+import math
+import mmap
+import os
+import struct
+from dataclasses import dataclass
+from datetime import UTC, datetime
+
+# File layout, all little-endian:
+#   header | event table | bloom filter bits | sorted codes | event index
+# Codes are ASCII, NUL-padded to a fixed width so the array can be binary
+# searched in place; the event index holds one u32 per code pointing into
+# the event table.
+_MAGIC = b"EMSNAP\x00\x01"
+_VERSION = 1
+_HEADER = struct.Struct("<8sIIQQIId")
+_EVENT = struct.Struct("<qdd")
+_EVENT_INDEX = struct.Struct("<I")
+# Every _FENCE_STRIDE-th code is kept in memory, so a lookup bisects that
+# list in C and then only searches one block of the mapped file.
+_FENCE_STRIDE = 64
+
+
+@dataclass(frozen=True)
+class SnapshotEvent:
+    id: int
+    start_date: datetime
+    end_date: datetime
+
+
+@dataclass(frozen=True)
+class SnapshotEntry:
+    code: str
+    event: SnapshotEvent
+
+
+class InvalidSnapshotError(Exception):
+    def __init__(self, path: str, reason: str) -> None:
+        message = f'Invalid offline snapshot "{path}": {reason}.'
+        super().__init__(message)
+
+
+class BloomFilter:
+    """Fixed-size Bloom filter over byte strings.
+
+    The ``hashes`` bit positions come from one 128-bit BLAKE2b digest split
+    into two halves (Kirsch-Mitzenmacher double hashing), so a lookup costs
+    one hash call regardless of ``hashes``.
+    """
+
+    def __init__(self, bits: int, hashes: int, data: bytearray | memoryview) -> None:
+        self.bits = bits
+        self.hashes = hashes
+        self._data = data
+
+    @classmethod
+    def for_capacity(cls, items: int, false_positive_rate: float) -> BloomFilter:
+        items = max(1, items)
+        bits = math.ceil(-items * math.log(false_positive_rate) / math.log(2) ** 2)
+        bits = max(64, (bits + 63) // 64 * 64)
+        hashes = max(1, round(bits / items * math.log(2)))
+        return cls(bits, hashes, bytearray(bits // 8))
+
+    @property
+    def data(self) -> bytes:
+        return bytes(self._data)
+
+    def _hashes(self, key: bytes) -> tuple[int, int]:
+        digest = hashlib.blake2b(key, digest_size=16).digest()
+        return (
+            int.from_bytes(digest[:8], "little"),
+            int.from_bytes(digest[8:], "little") | 1,
+        )
+
+    def add(self, key: bytes) -> None:
+        h1, h2 = self._hashes(key)
+        for i in range(self.hashes):
+            position = (h1 + i * h2) % self.bits
+            self._data[position >> 3] |= 1 << (position & 7)
+
+    def __contains__(self, key: bytes) -> bool:
+        h1, h2 = self._hashes(key)
+        data, bits = self._data, self.bits
+        for i in range(self.hashes):
+            position = (h1 + i * h2) % bits
+            if not data[position >> 3] & (1 << (position & 7)):
+                return False
+        return True
+
+
+def write_offline_snapshot(
+    path: str,
+    events: list[SnapshotEvent],
+    codes_by_event: dict[int, list[str]],
+    false_positive_rate: float = 0.01,
+    created_at: datetime | None = None,
+) -> int:
+    """Write a snapshot of ``codes_by_event`` to ``path`` and return its size.
+
+    The file is written next to ``path`` and renamed into place, so a device
+    reading the previous snapshot never sees a half-written one.
+    """
+    event_index = {event.id: i for i, event in enumerate(events)}
+    entries = sorted(
+        (code.encode("ascii"), event_index[event_id])
+        for event_id, codes in codes_by_event.items()
+        for code in codes
+    )
+    code_width = max((len(code) for code, _ in entries), default=1)
+    bloom = BloomFilter.for_capacity(len(entries), false_positive_rate)
+    for code, _ in entries:
+        bloom.add(code)
+
+    created_at = created_at or datetime.now(UTC)
+    tmp_path = f"{path}.tmp"
+    with open(tmp_path, "wb") as f:
+        f.write(
+            _HEADER.pack(
+                _MAGIC,
+                _VERSION,
+                code_width,
+                len(entries),
+                bloom.bits,
+                bloom.hashes,
+                len(events),
+                created_at.timestamp(),
+            )
+        )
+        for event in events:
+            f.write(
+                _EVENT.pack(
+                    event.id, event.start_date.timestamp(), event.end_date.timestamp()
+                )
+            )
+        f.write(bloom.data)
+        f.write(b"".join(code.ljust(code_width, b"\0") for code, _ in entries))
+        f.write(b"".join(_EVENT_INDEX.pack(index) for _, index in entries))
+    os.replace(tmp_path, path)
+    return os.path.getsize(path)
+
+
+class OfflineSnapshot:
+    """Read-only, memory-mapped view of a snapshot file.
+
+    Only the event table and one in 64 codes are read up front: a lookup
+    tests the Bloom filter, bisects those fence codes, then scans a single
+    64-code block of the mapped array. Unknown codes are usually
+    rejected by the filter alone.
+    """
+
+    def __init__(self, path: str) -> None:
+        self.path = path
+        with open(path, "rb") as f:
+            self._mm = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        try:
+            self._parse()
+        except (struct.error, InvalidSnapshotError):
+            self._mm.close()
+            raise
+
+    def _parse(self) -> None:
+        if len(self._mm) < _HEADER.size:
+            raise InvalidSnapshotError(self.path, "file too small")
+        (
+            magic,
+            version,
+            self.code_width,
+            self.code_count,
+            bloom_bits,
+            bloom_hashes,
+            event_count,
+            created_at,
+        ) = _HEADER.unpack_from(self._mm, 0)
+        if magic != _MAGIC or version != _VERSION:
+            raise InvalidSnapshotError(self.path, "unknown format")
+
+        self.created_at = datetime.fromtimestamp(created_at, UTC)
+        offset = _HEADER.size
+        self.events: list[SnapshotEvent] = []
+        for _ in range(event_count):
+            event_id, start, end = _EVENT.unpack_from(self._mm, offset)
+            self.events.append(
+                SnapshotEvent(
+                    event_id,
+                    datetime.fromtimestamp(start, UTC),
+                    datetime.fromtimestamp(end, UTC),
+                )
+            )
+            offset += _EVENT.size
+
+        self._codes_offset = offset + bloom_bits // 8
+        self._index_offset = self._codes_offset + self.code_count * self.code_width
+        expected_size = self._index_offset + self.code_count * _EVENT_INDEX.size
+        if len(self._mm) != expected_size:
+            raise InvalidSnapshotError(self.path, "truncated or corrupt")
+
+        self._bloom_view = memoryview(self._mm)[offset : self._codes_offset]
+        self._bloom = BloomFilter(bloom_bits, bloom_hashes, self._bloom_view)
+        self._fences = [
+            self._mm[start : start + self.code_width]
+            for start in range(
+                self._codes_offset,
+                self._index_offset,
+                _FENCE_STRIDE * self.code_width,
+            )
+        ]
+
+    def __enter__(self) -> OfflineSnapshot:
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.close()
+
+    def __len__(self) -> int:
+        return self.code_count
+
+    @property
+    def size_bytes(self) -> int:
+        return len(self._mm)
+
+    def close(self) -> None:
+        self._bloom = None
+        self._bloom_view.release()
+        self._mm.close()
+
+    def lookup(self, code: str) -> SnapshotEntry | None:
+        try:
+            key = code.encode("ascii")
+        except UnicodeEncodeError:
+            return None
+        if len(key) > self.code_width or key not in self._bloom:
+            return None
+
+        key = key.ljust(self.code_width, b"\0")
+        block = bisect.bisect_right(self._fences, key) - 1
+        if block < 0:
+            return None
+
+        width = self.code_width
+        start = self._codes_offset + block * _FENCE_STRIDE * width
+        codes = self._mm[start : min(start + _FENCE_STRIDE * width, self._index_offset)]
+        # Codes are fixed-width, so only a match on a code boundary counts.
+        position = codes.find(key)
+        while position > 0 and position % width:
+            position = codes.find(key, position + 1)
+        if position < 0:
+            return None
+
+        index = block * _FENCE_STRIDE + position // width
+        (event_index,) = _EVENT_INDEX.unpack_from(
+            self._mm, self._index_offset + index * _EVENT_INDEX.size
+        )
+        return SnapshotEntry(code=code, event=self.events[event_index])
+
+    def __contains__(self, code: str) -> bool:
+        return self.lookup(code) is not None
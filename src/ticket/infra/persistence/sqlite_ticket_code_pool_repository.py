@@ -0,0 +1,97 @@
+from __future__ import annotations
+
+from collections.abc import Iterable
+from datetime import UTC, datetime
+
+from shared.infra.persistence.sqlite import IN_CHUNK_SIZE, SQLiteDatabase
+
+
+def _timestamp(moment: datetime) -> str:
+    return moment.astimezone(UTC).isoformat()
+
+
+class SqliteTicketCodePoolRepository:
+    """Pool of pre-generated ticket codes.
+
+    Claimed codes stay in the table with ``claimed_at`` set until the ticket
+    that uses them is inserted (a trigger on ``tickets`` removes them), so
+    they can never be generated and pooled a second time while in flight.
+    """
+
+    def __init__(self, db: SQLiteDatabase) -> None:
+        self._db = db
+
+    def add_many(self, codes: Iterable[str]) -> int:
+        """Store unused codes, skipping ones already pooled, claimed or issued.
+
+        Returns how many codes were actually added.
+        """
+        with self._db.connect() as conn:
+            changes_before = conn.total_changes
+            conn.executemany(
+                """
+                INSERT OR IGNORE INTO ticket_code_pool (code)
+                SELECT :code
+                WHERE NOT EXISTS (SELECT 1 FROM tickets WHERE code = :code)
+                """,
+                ({"code": code} for code in codes),
+            )
+            conn.commit()
+            return conn.total_changes - changes_before
+
+    def claim(self, count: int, now: datetime, stale_before: datetime) -> list[str]:
+        """Mark up to ``count`` free codes as claimed and return them.
+
+        Claims older than ``stale_before`` belong to a process that went away
+        without issuing or releasing them, so they are handed out again.
+        """
+        with self._db.transaction() as conn:
+            rows = conn.execute(
+                """
+                UPDATE ticket_code_pool
+                SET claimed_at = ?
+                WHERE code IN (
+                    SELECT code FROM ticket_code_pool
+                    WHERE claimed_at IS NULL OR claimed_at < ?
+                    LIMIT ?
+                )
+                RETURNING code
+                """,
+                (_timestamp(now), _timestamp(stale_before), count),
+            ).fetchall()
+        return [row[0] for row in rows]
+
+    def unclaim_many(self, codes: list[str]) -> int:
+        """Put claimed codes back in the pool; returns how many were freed."""
+        with self._db.transaction() as conn:
+            changes_before = conn.total_changes
+            for start in range(0, len(codes), IN_CHUNK_SIZE):
+                chunk = codes[start : start + IN_CHUNK_SIZE]
+                placeholders = ", ".join("?" for _ in chunk)
+                conn.execute(
+                    f"""
+                    UPDATE ticket_code_pool
+                    SET claimed_at = NULL
+                    WHERE code IN ({placeholders})
+                    """,
+                    chunk,
+                )
+            return conn.total_changes - changes_before
+
+    def pooled_count(self) -> int:
+        """Codes still free to claim."""
+        with self._db.connect() as conn:
+            return conn.execute(
+                "SELECT COUNT(*) FROM ticket_code_pool WHERE claimed_at IS NULL"
+            ).fetchone()[0]
+
+    def claimed_count(self) -> int:
+        """Codes claimed by an allocator but not yet issued."""
+        with self._db.connect() as conn:
+            return conn.execute(
+                "SELECT COUNT(*) FROM ticket_code_pool WHERE claimed_at IS NOT NULL"
+            ).fetchone()[0]
+
+    def issued_count(self) -> int:
+        with self._db.connect() as conn:
+            return conn.execute("SELECT COUNT(*) FROM tickets").fetchone()[0]
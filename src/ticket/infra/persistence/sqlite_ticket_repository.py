@@ -1,10 +1,29 @@
-from datetime import datetime
+import sqlite3
+from datetime import UTC, datetime
 
-from shared.infra.persistence.sqlite import SQLiteDatabase
+from event.domain.event import Event
+from shared.infra.email.sqlite_email_outbox_repository import (
+    OutboxMessage,
+    insert_outbox_message,
+)
+from shared.infra.persistence.sqlite import IN_CHUNK_SIZE, SQLiteDatabase
+from ticket.application.dtos import TicketValidationContextDto
+from ticket.application.errors import TicketCodeAlreadyExistsError
 from ticket.domain.ticket import Ticket
 from ticket.domain.ticket_status import TicketStatus
 
 
+def _parse_created_at(value: str) -> datetime:
+    return datetime.fromisoformat(value.replace("Z", "+00:00"))
+
+
+def _is_duplicate_code(error: sqlite3.IntegrityError) -> bool:
+    return (
+        error.sqlite_errorname == "SQLITE_CONSTRAINT_UNIQUE"
+        and "tickets.code" in str(error)
+    )
+
+
 class SqliteTicketsRepository:
     def __init__(self, db: SQLiteDatabase) -> None:
         self._db = db
@@ -25,19 +44,126 @@ class SqliteTicketsRepository:
 
         id_, event_id, client_id, code, status, created_at = row
 
-        parsed_created_at = datetime.fromisoformat(
-            created_at.replace("Z", "+00:00"),
-        )
-
         return Ticket(
             event_id=event_id,
             client_id=client_id,
             code=code,
             status=TicketStatus[status],
-            created_at=parsed_created_at,
+            created_at=_parse_created_at(created_at),
             id=id_,
         )
 
+    def get_many_for_validation(
+        self, codes: list[str], user_id: int
+    ) -> dict[str, TicketValidationContextDto]:
+        """Tickets for ``codes`` with their event and whether ``user_id`` staffs it.
+
+        One joined query per 900 codes instead of a ticket, event and staff
+        lookup per code. Unknown codes are absent from the result.
+        """
+        unique_codes = list(dict.fromkeys(codes))
+        contexts: dict[str, TicketValidationContextDto] = {}
+        with self._db.connect() as conn:
+            for start in range(0, len(unique_codes), IN_CHUNK_SIZE):
+                chunk = unique_codes[start : start + IN_CHUNK_SIZE]
+                placeholders = ", ".join("?" * len(chunk))
+                rows = conn.execute(
+                    f"""
+                    SELECT t.id, t.event_id, t.client_id, t.code, t.status,
+                           t.created_at, e.id, e.name, e.location, e.created_at,
+                           e.start_date, e.end_date, e.max_tickets, e.organizer_id,
+                           e.initial_max_tickets, e.tickets_redeemed,
+                           EXISTS (
+                               SELECT 1 FROM event_staff s
+                               WHERE s.event_id = t.event_id AND s.user_id = ?
+                           )
+                    FROM tickets t
+                    LEFT JOIN events e ON e.id = t.event_id
+                    WHERE t.code IN ({placeholders})
+                    """,
+                    (user_id, *chunk),
+                ).fetchall()
+                for row in rows:
+                    context = self._row_to_validation_context(row)
+                    contexts[context.ticket.code] = context
+        return contexts
+
+    def count_friends_attending(
+        self, client_id: int, event_ids: list[int]
+    ) -> dict[int, int]:
+        """Accepted friends of ``client_id`` holding a ticket, per event.
+
+        One query per page of events: the friend list comes from the two
+        friendship indexes, and each ticket is checked through
+        ``idx_tickets_event_client``. Events nobody's friends attend are 0.
+        """
+        counts = dict.fromkeys(event_ids, 0)
+        with self._db.connect() as conn:
+            for start in range(0, len(event_ids), IN_CHUNK_SIZE):
+                chunk = event_ids[start : start + IN_CHUNK_SIZE]
+                placeholders = ", ".join("?" * len(chunk))
+                rows = conn.execute(
+                    f"""
+                    WITH friends(client_id) AS (
+                        SELECT requested_client_id FROM friendships
+                        WHERE requester_client_id = ? AND status = 'ACCEPTED'
+                        UNION ALL
+                        SELECT requester_client_id FROM friendships
+                        WHERE requested_client_id = ? AND status = 'ACCEPTED'
+                    )
+                    SELECT t.event_id, COUNT(DISTINCT t.client_id)
+                    FROM friends f
+                    JOIN tickets t
+                      ON t.event_id IN ({placeholders}) AND t.client_id = f.client_id
+                    GROUP BY t.event_id
+                    """,
+                    (client_id, client_id, *chunk),
+                )
+                counts.update(rows)
+        return counts
+
+    def list_codes_by_event(
+        self, event_ids: list[int], status: TicketStatus
+    ) -> dict[int, list[str]]:
+        codes: dict[int, list[str]] = {event_id: [] for event_id in event_ids}
+        with self._db.connect() as conn:
+            for start in range(0, len(event_ids), IN_CHUNK_SIZE):
+                chunk = event_ids[start : start + IN_CHUNK_SIZE]
+                placeholders = ", ".join("?" * len(chunk))
+                rows = conn.execute(
+                    f"""
+                    SELECT event_id, code FROM tickets
+                    WHERE status = ? AND event_id IN ({placeholders})
+                    """,
+                    (status.value, *chunk),
+                )
+                for event_id, code in rows:
+                    codes[event_id].append(code)
+        return codes
+
+    def mark_validated_many(self, ticket_ids: list[int]) -> set[int]:
+        """Flip PENDING tickets to VALIDATED in a single transaction.
+
+        Returns the ids that actually changed; a ticket validated meanwhile
+        by another scanner is left alone and missing from the result.
+        """
+        validated: set[int] = set()
+        with self._db.transaction() as conn:
+            for start in range(0, len(ticket_ids), IN_CHUNK_SIZE):
+                chunk = ticket_ids[start : start + IN_CHUNK_SIZE]
+                placeholders = ", ".join("?" * len(chunk))
+                rows = conn.execute(
+                    f"""
+                    UPDATE tickets
+                    SET status = ?
+                    WHERE status = ? AND id IN ({placeholders})
+                    RETURNING id
+                    """,
+                    (TicketStatus.VALIDATED.value, TicketStatus.PENDING.value, *chunk),
+                ).fetchall()
+                validated.update(row[0] for row in rows)
+        return validated
+
     def update(self, ticket: Ticket) -> None:
         created_at_str = ticket.created_at.isoformat().replace("+00:00", "Z")
 
@@ -60,6 +186,81 @@ class SqliteTicketsRepository:
             conn.commit()
 
     def create_many(self, ticket_list: list[Ticket]) -> None:
+        with self._db.connect() as conn:
+            self._insert_many(conn, ticket_list)
+            conn.commit()
+        self._db.count_cache.invalidate("tickets")
+        return ticket_list
+
+    def redeem_many(
+        self,
+        event_id: int,
+        ticket_list: list[Ticket],
+        email: OutboxMessage | None = None,
+    ) -> bool:
+        """Reserve ``len(ticket_list)`` seats on the event and insert the tickets.
+
+        Both writes happen in one ``BEGIN IMMEDIATE`` transaction and the seat
+        check is part of the UPDATE itself, so concurrent buyers can never push
+        ``tickets_redeemed`` past ``max_tickets``. Returns False, writing
+        nothing, when the event does not have enough tickets left. A code
+        collision rolls the seats back and raises ``TicketCodeAlreadyExistsError``.
+        Inserting a ticket removes its code from ``ticket_code_pool`` in the
+        same transaction (see migration v009), and ``email`` is queued on the
+        outbox in it too, so a crash can never lose the confirmation.
+        """
+        count = len(ticket_list)
+        try:
+            with self._db.transaction() as conn:
+                cursor = conn.execute(
+                    """
+                    UPDATE events
+                    SET tickets_redeemed = tickets_redeemed + ?
+                    WHERE id = ? AND tickets_redeemed + ? <= max_tickets
+                    """,
+                    (count, event_id, count),
+                )
+                if cursor.rowcount == 0:
+                    return False
+                self._insert_many(conn, ticket_list)
+                if email is not None:
+                    insert_outbox_message(conn, email)
+        except sqlite3.IntegrityError as e:
+            if not _is_duplicate_code(e):
+                raise
+            raise TicketCodeAlreadyExistsError() from e
+
+        self._db.count_cache.invalidate("events", "tickets")
+        return True
+
+    def _row_to_validation_context(self, row: tuple) -> TicketValidationContextDto:
+        ticket = Ticket(
+            id=row[0],
+            event_id=row[1],
+            client_id=row[2],
+            code=row[3],
+            status=TicketStatus[row[4]],
+            created_at=_parse_created_at(row[5]),
+        )
+        event = None
+        if row[6] is not None:
+            event = Event(
+                id=row[6],
+                name=row[7],
+                location=row[8],
+                created_at=datetime.fromisoformat(row[9]).replace(tzinfo=UTC),
+                start_date=datetime.fromisoformat(row[10]).replace(tzinfo=UTC),
+                end_date=datetime.fromisoformat(row[11]).replace(tzinfo=UTC),
+                max_tickets=row[12],
+                organizer_id=row[13],
+                initial_max_tickets=row[14],
+                tickets_redeemed=row[15],
+            )
+        return TicketValidationContextDto(
+            ticket=ticket, event=event, is_staff=bool(row[16])
+        )
+
+    def _insert_many(self, conn: sqlite3.Connection, ticket_list: list[Ticket]) -> None:
         rows = [
             (
                 ticket.event_id,
@@ -70,13 +271,10 @@ class SqliteTicketsRepository:
             )
             for ticket in ticket_list
         ]
-        with self._db.connect() as conn:
-            conn.executemany(
-                """
-                INSERT INTO tickets (event_id, client_id, code, status, created_at)
-                VALUES (?, ?, ?, ?, ?)
-                """,
-                rows,
-            )
-            conn.commit()
-        return ticket_list
+        conn.executemany(
+            """
+            INSERT INTO tickets (event_id, client_id, code, status, created_at)
+            VALUES (?, ?, ?, ?, ?)
+            """,
+            rows,
+        )
@@ -0,0 +1,191 @@
+from __future__ import annotations
+
+import secrets
+import threading
+from collections import deque
+from dataclasses import dataclass
+from datetime import UTC, datetime, timedelta
+
+from ticket.infra.persistence.sqlite_ticket_code_pool_repository import (
+    SqliteTicketCodePoolRepository,
+)
+
+CODE_ALPHABET = "ABCDEFGHJKLMNPQRSTUVWXYZ23456789"  # excludes O, I, 0, 1
+CODE_LENGTH = 6
+
+
+def generate_code(length: int = CODE_LENGTH) -> str:
+    # 32 symbols are exactly 5 bits each, so one randbits call yields a
+    # uniformly random code without per-character sampling.
+    value = secrets.randbits(5 * length)
+    chars = []
+    for _ in range(length):
+        chars.append(CODE_ALPHABET[value & 31])
+        value >>= 5
+    return "".join(chars)
+
+
+@dataclass(frozen=True)
+class TicketCodeSpaceStats:
+    code_space: int
+    issued: int
+    pooled: int
+    reserved: int
+
+    @property
+    def used(self) -> int:
+        return self.issued + self.pooled + self.reserved
+
+    @property
+    def utilization(self) -> float:
+        return self.used / self.code_space
+
+    @property
+    def expected_draws_per_code(self) -> float:
+        """Random draws needed on average to find one unused code."""
+        free = self.code_space - self.used
+        return float("inf") if free <= 0 else self.code_space / free
+
+
+class TicketCodeAllocator:
+    """Hands out unique ticket codes from a pre-generated pool.
+
+    Codes are claimed from ``ticket_code_pool`` in blocks of ``claim_size``
+    and served from memory, so a redemption only pops a deque. A background
+    thread tops the table back up to ``batch_size`` whenever it drops below
+    ``low_water_mark``; if it ever runs dry the caller refills inline.
+
+    A claim is a lease of ``claim_lease``: codes held in memory for half of it
+    are given back and claimed afresh, so only a crashed process's codes are
+    ever reclaimed by someone else.
+    """
+
+    def __init__(
+        self,
+        pool_repository: SqliteTicketCodePoolRepository,
+        batch_size: int = 2000,
+        low_water_mark: int = 500,
+        claim_size: int = 64,
+        code_length: int = CODE_LENGTH,
+        claim_lease: timedelta = timedelta(hours=1),
+    ) -> None:
+        if not 0 <= low_water_mark < batch_size:
+            raise ValueError(
+                f"Invalid low water mark {low_water_mark} for batch size {batch_size}."
+            )
+
+        self._pool_repository = pool_repository
+        self._batch_size = batch_size
+        self._low_water_mark = low_water_mark
+        self._claim_size = claim_size
+        self._code_length = code_length
+        self._claim_lease = claim_lease
+        self._reserved: deque[str] = deque()
+        self._reserved_at = datetime.min.replace(tzinfo=UTC)
+        self._lock = threading.Lock()
+        self._refill_requested = threading.Event()
+        self._stop_event = threading.Event()
+        self._thread: threading.Thread | None = None
+
+    @property
+    def code_space(self) -> int:
+        return len(CODE_ALPHABET) ** self._code_length
+
+    def start(self) -> None:
+        if self._thread is not None:
+            return
+        self._stop_event.clear()
+        self._thread = threading.Thread(
+            target=self._run, name="ticket-code-refill", daemon=True
+        )
+        self._thread.start()
+        self._refill_requested.set()
+
+    def stop(self) -> None:
+        """Stop the refill thread and unclaim unused reserved codes."""
+        self._stop_event.set()
+        self._refill_requested.set()
+        if self._thread is not None:
+            self._thread.join()
+            self._thread = None
+
+        with self._lock:
+            reserved, self._reserved = list(self._reserved), deque()
+        if reserved:
+            self._pool_repository.unclaim_many(reserved)
+
+    def allocate(self, count: int) -> list[str]:
+        with self._lock:
+            if self._reserved and self._lease_expiring():
+                self._pool_repository.unclaim_many(list(self._reserved))
+                self._reserved.clear()
+            while len(self._reserved) < count:
+                self._reserve(max(self._claim_size, count - len(self._reserved)))
+            return [self._reserved.popleft() for _ in range(count)]
+
+    def release(self, codes: list[str]) -> None:
+        """Unclaim codes that were allocated but never issued.
+
+        Codes that did get issued meanwhile are no longer pooled and are
+        simply dropped, so a code that collided is never handed out again.
+        """
+        if codes:
+            self._pool_repository.unclaim_many(codes)
+
+    def refill(self) -> int:
+        """Top the pool table up to ``batch_size`` codes; returns codes added."""
+        missing = self._batch_size - self._pool_repository.pooled_count()
+        if missing <= 0:
+            return 0
+        return self._pool_repository.add_many(self._generate_batch(missing))
+
+    def stats(self) -> TicketCodeSpaceStats:
+        return TicketCodeSpaceStats(
+            code_space=self.code_space,
+            issued=self._pool_repository.issued_count(),
+            pooled=self._pool_repository.pooled_count(),
+            reserved=self._pool_repository.claimed_count(),
+        )
+
+    def _lease_expiring(self) -> bool:
+        return datetime.now(UTC) - self._reserved_at > self._claim_lease / 2
+
+    def _claim(self, count: int) -> list[str]:
+        now = datetime.now(UTC)
+        if not self._reserved:
+            self._reserved_at = now
+        return self._pool_repository.claim(count, now, now - self._claim_lease)
+
+    def _reserve(self, count: int) -> None:
+        claimed = self._claim(count)
+        if len(claimed) < count:
+            # The background refill fell behind; pay for it on this call.
+            self._pool_repository.add_many(
+                self._generate_batch(count - len(claimed) + self._low_water_mark)
+            )
+            claimed += self._claim(count - len(claimed))
+        self._reserved.extend(claimed)
+
+        if self._thread is not None and (
+            self._pool_repository.pooled_count() < self._low_water_mark
+        ):
+            self._refill_requested.set()
+
+    def _generate_batch(self, count: int) -> set[str]:
+        codes: set[str] = set()
+        while len(codes) < count:
+            codes.add(generate_code(self._code_length))
+        return codes
+
+    def _run(self) -> None:
+        while True:
+            self._refill_requested.wait()
+            self._refill_requested.clear()
+            if self._stop_event.is_set():
+                return
+            try:
+                self.refill()
+            except Exception:
+                # A locked database only delays the refill; allocate() still
+                # refills inline if the pool runs dry in the meantime.
+                continue
@@ -113,7 +113,7 @@ class RedeemTicketGUI(BaseGUI):
             self.use_cases.redeem_ticket_use_case.redeem_ticket(input_dto)
             message = f"{count} ticket(s) were successfully redeemed!"
             if send_email:
-                message += "\n\nA confirmation was also sent to your email."
+                message += "\n\nA confirmation will be sent to your email shortly."
             self.show_success_popup(message)
 
         except Exception as e:
@@ -0,0 +1,18 @@
+from __future__ import annotations
+
+from dataclasses import dataclass
+
+from user.application.session_store import SessionStore
+
+
+@dataclass(frozen=True)
+class EndSessionInputDto:
+    token: str
+
+
+class EndSessionUseCase:
+    def __init__(self, session_store: SessionStore) -> None:
+        self._session_store = session_store
+
+    def execute(self, input_dto: EndSessionInputDto) -> None:
+        self._session_store.revoke(input_dto.token)
@@ -24,3 +24,10 @@ class UserNotFoundError(AppError):
 class WrongPasswordError(AppError):
     def __init__(self, message: str = "Wrong password, try again.") -> None:
         super().__init__(message)
+
+
+class InvalidSessionError(AppError):
+    def __init__(
+        self, message: str = "Session is invalid or has expired, please log in."
+    ) -> None:
+        super().__init__(message)
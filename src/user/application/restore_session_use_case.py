@@ -0,0 +1,23 @@
+from __future__ import annotations
+
+from dataclasses import dataclass
+
+from shared.domain.auth_context import AuthContext
+from user.application.errors import InvalidSessionError
+from user.application.session_store import SessionStore
+
+
+@dataclass(frozen=True)
+class RestoreSessionInputDto:
+    token: str
+
+
+class RestoreSessionUseCase:
+    def __init__(self, session_store: SessionStore) -> None:
+        self._session_store = session_store
+
+    def execute(self, input_dto: RestoreSessionInputDto) -> AuthContext:
+        auth_context = self._session_store.resolve(input_dto.token)
+        if auth_context is None:
+            raise InvalidSessionError()
+        return auth_context
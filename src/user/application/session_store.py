@@ -0,0 +1,123 @@
+from __future__ import annotations
+
+import hashlib
+import secrets
+import threading
+from collections import OrderedDict
+from dataclasses import dataclass
+from datetime import UTC, datetime, timedelta
+
+from shared.domain.auth_context import AuthContext
+from user.domain.user import User
+from user.infra.persistence.sqlite_session_repository import SqliteSessionRepository
+
+
+def _hash_token(token: str) -> str:
+    return hashlib.sha256(token.encode("utf-8")).hexdigest()
+
+
+@dataclass(frozen=True)
+class IssuedSession:
+    token: str
+    auth_context: AuthContext
+    expires_at: datetime
+
+
+@dataclass(frozen=True)
+class SessionStoreInfo:
+    hits: int
+    misses: int
+    size: int
+    max_entries: int
+
+
+class SessionStore:
+    """Opaque session tokens persisted in ``sessions`` behind a bounded LRU.
+
+    A token is 32 random bytes, URL-safe encoded; only its SHA-256 reaches
+    the database. ``resolve`` serves recently used sessions from memory and
+    falls back to one indexed lookup joined with ``users``. Cached entries
+    keep their expiry, so a session never outlives ``ttl_seconds`` even when
+    it is never looked up in the database again.
+    """
+
+    def __init__(
+        self,
+        repository: SqliteSessionRepository,
+        ttl_seconds: float = 7 * 24 * 3600,
+        max_entries: int = 1024,
+    ) -> None:
+        self._repository = repository
+        self.ttl_seconds = ttl_seconds
+        self.max_entries = max_entries
+        self._entries: OrderedDict[str, tuple[AuthContext, datetime]] = OrderedDict()
+        self._lock = threading.Lock()
+        self._hits = 0
+        self._misses = 0
+
+    def issue(self, user: User) -> IssuedSession:
+        now = datetime.now(UTC)
+        expires_at = now + timedelta(seconds=self.ttl_seconds)
+        token = secrets.token_urlsafe(32)
+        token_hash = _hash_token(token)
+
+        self._repository.delete_expired(now)
+        self._repository.add(token_hash, user.id, now, expires_at)
+        auth_context = AuthContext(
+            id=user.id, name=user.name, email=user.email, role=user.role
+        )
+        self._remember(token_hash, auth_context, expires_at)
+        return IssuedSession(token, auth_context, expires_at)
+
+    def resolve(self, token: str) -> AuthContext | None:
+        """The signed-in user for ``token``, or None if unknown or expired."""
+        token_hash = _hash_token(token)
+        now = datetime.now(UTC)
+        with self._lock:
+            entry = self._entries.get(token_hash)
+            if entry is not None:
+                auth_context, expires_at = entry
+                if expires_at > now:
+                    self._entries.move_to_end(token_hash)
+                    self._hits += 1
+                    return auth_context
+                del self._entries[token_hash]
+            self._misses += 1
+
+        active = self._repository.get_active(token_hash, now)
+        if active is None:
+            return None
+        auth_context, expires_at = active
+        self._remember(token_hash, auth_context, expires_at)
+        return auth_context
+
+    def revoke(self, token: str) -> None:
+        token_hash = _hash_token(token)
+        with self._lock:
+            self._entries.pop(token_hash, None)
+        self._repository.delete(token_hash)
+
+    def clear(self) -> None:
+        """Drop the in-memory cache; sessions stay valid in the database."""
+        with self._lock:
+            self._entries.clear()
+
+    def cache_info(self) -> SessionStoreInfo:
+        with self._lock:
+            return SessionStoreInfo(
+                hits=self._hits,
+                misses=self._misses,
+                size=len(self._entries),
+                max_entries=self.max_entries,
+            )
+
+    def _remember(
+        self, token_hash: str, auth_context: AuthContext, expires_at: datetime
+    ) -> None:
+        if self.max_entries <= 0:
+            return
+        with self._lock:
+            self._entries[token_hash] = (auth_context, expires_at)
+            self._entries.move_to_end(token_hash)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
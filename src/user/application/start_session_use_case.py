@@ -0,0 +1,23 @@
+from __future__ import annotations
+
+from user.application.authenticate_user_use_case import (
+    AuthenticateUserInputDto,
+    AuthenticateUserUseCase,
+)
+from user.application.session_store import IssuedSession, SessionStore
+
+
+class StartSessionUseCase:
+    """Log in with email and password and issue a session token."""
+
+    def __init__(
+        self,
+        authenticate_user_use_case: AuthenticateUserUseCase,
+        session_store: SessionStore,
+    ) -> None:
+        self._authenticate_user_use_case = authenticate_user_use_case
+        self._session_store = session_store
+
+    def execute(self, input_dto: AuthenticateUserInputDto) -> IssuedSession:
+        user = self._authenticate_user_use_case.execute(input_dto)
+        return self._session_store.issue(user)
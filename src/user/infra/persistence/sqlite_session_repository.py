@@ -0,0 +1,70 @@
+from __future__ import annotations
+
+from datetime import UTC, datetime
+
+from shared.domain.auth_context import AuthContext
+from shared.infra.persistence.sqlite import SQLiteDatabase
+from user.domain.user_role import UserRole
+
+
+def _timestamp(moment: datetime) -> str:
+    return moment.astimezone(UTC).isoformat()
+
+
+class SqliteSessionRepository:
+    def __init__(self, db: SQLiteDatabase) -> None:
+        self._db = db
+
+    def add(
+        self,
+        token_hash: str,
+        user_id: int,
+        created_at: datetime,
+        expires_at: datetime,
+    ) -> None:
+        with self._db.connect() as conn:
+            conn.execute(
+                """
+                INSERT INTO sessions (token_hash, user_id, created_at, expires_at)
+                VALUES (?, ?, ?, ?)
+                """,
+                (token_hash, user_id, _timestamp(created_at), _timestamp(expires_at)),
+            )
+            conn.commit()
+
+    # NOTE (Clean Architecture VIOLATION): JOIN com users para montar o AuthContext
+    def get_active(
+        self, token_hash: str, now: datetime
+    ) -> tuple[AuthContext, datetime] | None:
+        """The signed-in user and expiry of an unexpired session."""
+        with self._db.connect() as conn:
+            row = conn.execute(
+                """
+                SELECT u.id, u.name, u.email, u.role, s.expires_at
+                FROM sessions s
+                JOIN users u ON u.id = s.user_id
+                WHERE s.token_hash = ? AND s.expires_at > ?
+                """,
+                (token_hash, _timestamp(now)),
+            ).fetchone()
+        if not row:
+            return None
+
+        user_id, name, email, role, expires_at = row
+        auth_context = AuthContext(
+            id=user_id, name=name, email=email, role=UserRole(role)
+        )
+        return auth_context, datetime.fromisoformat(expires_at)
+
+    def delete(self, token_hash: str) -> None:
+        with self._db.connect() as conn:
+            conn.execute("DELETE FROM sessions WHERE token_hash = ?", (token_hash,))
+            conn.commit()
+
+    def delete_expired(self, now: datetime) -> int:
+        with self._db.connect() as conn:
+            cursor = conn.execute(
+                "DELETE FROM sessions WHERE expires_at <= ?", (_timestamp(now),)
+            )
+            conn.commit()
+            return cursor.rowcount
@@ -3,13 +3,19 @@ from __future__ import annotations
 from dataclasses import replace
 
 from event.application.dtos import PaginatedStaffsDto, StaffDto
-from shared.infra.persistence.sqlite import SQLiteDatabase
+from shared.infra.persistence.sqlite import IN_CHUNK_SIZE, SQLiteDatabase
+from shared.infra.persistence.sqlite_pagination import CountStrategy, SQLitePaginator
 from user.domain.user import User, UserRole
 
 
 class SqliteUsersRepository:
-    def __init__(self, db: SQLiteDatabase) -> None:
+    def __init__(
+        self,
+        db: SQLiteDatabase,
+        count_strategy: CountStrategy = CountStrategy.CACHED,
+    ) -> None:
         self._db = db
+        self._paginator = SQLitePaginator(db.count_cache, count_strategy)
 
     def add(self, user: User) -> User:
         with self._db.connect() as conn:
@@ -23,7 +29,8 @@ class SqliteUsersRepository:
                 ),
             )
             conn.commit()
-            return replace(user, id=cursor.lastrowid)
+        self._db.count_cache.invalidate("users")
+        return replace(user, id=cursor.lastrowid)
 
     def get_by_id(self, id: int) -> User | None:
         with self._db.connect() as conn:
@@ -67,6 +74,34 @@ class SqliteUsersRepository:
                 id=user_id,
             )
 
+    def get_many_by_emails_and_role(
+        self, emails: list[str], role: UserRole
+    ) -> dict[str, User]:
+        """Users with ``role`` keyed by email; unknown emails are left out."""
+        unique_emails = list(dict.fromkeys(emails))
+        users: dict[str, User] = {}
+        with self._db.connect() as conn:
+            for start in range(0, len(unique_emails), IN_CHUNK_SIZE):
+                chunk = unique_emails[start : start + IN_CHUNK_SIZE]
+                placeholders = ", ".join("?" * len(chunk))
+                rows = conn.execute(
+                    f"""
+                    SELECT id, name, email, hashed_password, role
+                    FROM users
+                    WHERE role = ? AND email IN ({placeholders})
+                    """,
+                    (role.value, *chunk),
+                )
+                for user_id, name, email, hashed_password, user_role in rows:
+                    users[email] = User(
+                        name=name,
+                        email=email,
+                        hashed_password=hashed_password,
+                        role=UserRole(user_role),
+                        id=user_id,
+                    )
+        return users
+
     def list_with_email_and_name(
         self,
         page: int,
@@ -81,7 +116,7 @@ class SqliteUsersRepository:
         """
         base_query = """
         FROM users u
-        INNER JOIN events e ON (',' || e.staffs_id || ',') LIKE ('%,' || CAST(u.id AS TEXT) || ',%')
+        INNER JOIN event_staff es ON es.user_id = u.id
         """
         conditions = ["1=1"]
         params = []
@@ -93,7 +128,7 @@ class SqliteUsersRepository:
             params.append(role.value)
 
         if event_id is not None:
-            conditions.append("e.id = ?")
+            conditions.append("es.event_id = ?")
             params.append(event_id)
 
         for column, value in filters.items():
@@ -102,22 +137,20 @@ class SqliteUsersRepository:
                 params.append(value)
 
         where_clause = " WHERE " + " AND ".join(conditions)
-
-        count_query = "SELECT COUNT(*) " + base_query + where_clause
-        select_query = (
-            select_columns
-            + base_query
-            + where_clause
-            + " ORDER BY u.id ASC LIMIT ? OFFSET ?"
-        )
-
-        count_params = params.copy()
-
-        params.extend([size, (page - 1) * size])
+        select_query = select_columns + base_query + where_clause
 
         with self._db.connect() as conn:
-            rows = conn.execute(select_query, params).fetchall()
-            total_count = conn.execute(count_query, count_params).fetchone()[0]
+            result_page = self._paginator.fetch_page(
+                conn,
+                select_query,
+                params,
+                tables=("users", "event_staff"),
+                order_by="id",
+                limit=size,
+                offset=(page - 1) * size,
+            )
+
+        rows, total_count = result_page.rows, result_page.total_count
 
         staffs_list: list[StaffDto] = [
             StaffDto(
@@ -0,0 +1,34 @@
+from __future__ import annotations
+
+import os
+
+
+class SessionTokenFile:
+    """The session token kept between launches, readable only by its owner."""
+
+    def __init__(self, path: str) -> None:
+        self.path = path
+
+    def read(self) -> str | None:
+        try:
+            with open(self.path, encoding="ascii") as f:
+                token = f.read().strip()
+        except (OSError, UnicodeDecodeError):
+            return None
+        return token or None
+
+    def write(self, token: str) -> None:
+        directory = os.path.dirname(self.path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        tmp_path = f"{self.path}.tmp"
+        fd = os.open(tmp_path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o600)
+        with os.fdopen(fd, "w", encoding="ascii") as f:
+            f.write(token)
+        os.replace(tmp_path, self.path)
+
+    def clear(self) -> None:
+        try:
+            os.remove(self.path)
+        except FileNotFoundError:
+            pass
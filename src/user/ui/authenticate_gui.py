@@ -2,20 +2,22 @@ import os
 
 import FreeSimpleGUI as sg
 
-from event.ui.list_event_client_gui import ListEventClientGui
-from event.ui.list_event_organizer_gui import ListEventOrganizerGui
-from shared.domain.auth_context import AuthContext
 from shared.ui.base_gui import BaseGUI
 from shared.ui.components import ActionButtonsComponent
 from shared.ui.styles import COLORS, FONTS, LABEL_SIZES, WINDOW_SIZES
-from ticket.ui.validate_ticket_gui import ValidateTicketGUI
 from user.application.authenticate_user_use_case import AuthenticateUserInputDto
-from user.domain.user import User
+from user.application.end_session_use_case import EndSessionInputDto
+from user.application.errors import InvalidSessionError
+from user.application.restore_session_use_case import RestoreSessionInputDto
 from user.domain.user_role import UserRole
-from user.ui.create_user_gui import CreateUserGUI
 
 
 class AuthenticateGUI(BaseGUI):
+    # The saved session is offered once per launch. Any later showing of this
+    # screen (back from the signed-in screens, or rebuilt after being closed
+    # to save memory) means the user logged out.
+    _saved_session_checked = False
+
     def __init__(self, use_cases=None, navigator=None):
         super().__init__(
             title="Login",
@@ -25,6 +27,7 @@ class AuthenticateGUI(BaseGUI):
         )
 
         self.roles = [role.value for role in UserRole]
+        self._session_token = None
 
         self.action_buttons = ActionButtonsComponent([
             {
@@ -149,11 +152,34 @@ class AuthenticateGUI(BaseGUI):
                     pad=((0, 30), (0, 0)),
                 ),
             ],
+            [
+                sg.Checkbox(
+                    "Keep me signed in",
+                    key="-REMEMBER-",
+                    default=True,
+                    font=FONTS["LABEL"],
+                    pad=(0, 0),
+                )
+            ],
             *self.action_buttons.create_layout(),
         ]
 
         return layout
 
+    def run(self):
+        if AuthenticateGUI._saved_session_checked:
+            self._end_session()
+        else:
+            AuthenticateGUI._saved_session_checked = True
+            self._restore_saved_session()
+        return super().run()
+
+    def on_resume(self):
+        # Back from a signed-in screen: don't leave the password filled in
+        self.window["-PASSWORD-"].update("")
+        self.auth_context = None
+        self._end_session()
+
     def handle_events(self, event, values):
         handler = self.event_map.get(event)
         if handler:
@@ -173,34 +199,74 @@ class AuthenticateGUI(BaseGUI):
                 email=email.strip().lower(), password=password, role=UserRole(role)
             )
 
-            user = self.use_cases.authenticate_user_use_case.execute(input_dto)
-
-            self._set_auth_context(user)
+            session = self.use_cases.start_session_use_case.execute(input_dto)
+            self.auth_context = session.auth_context
+            self._session_token = session.token
+            if values.get("-REMEMBER-"):
+                self.use_cases.session_token_file.write(session.token)
+            else:
+                self.use_cases.session_token_file.clear()
 
             self.show_success_popup(
                 f"Welcome, {self.auth_context.name} ({self.auth_context.role.value})!"
             )
-
-            if self.auth_context.role.value == "CLIENT":
-                self.navigator.push_screen(
-                    ListEventClientGui, auth_context=self.auth_context
-                )
-            elif self.auth_context.role.value == "ORGANIZER":
-                self.navigator.push_screen(
-                    ListEventOrganizerGui, auth_context=self.auth_context
-                )
-            else:
-                self.navigator.push_screen(
-                    ValidateTicketGUI, auth_context=self.auth_context
-                )
+            self._open_home_screen()
 
         except Exception as e:
             self.show_error_popup(f"Error authenticating user: {e}")
 
+    def _restore_saved_session(self):
+        token = self.use_cases.session_token_file.read()
+        if token is None:
+            return
+
+        try:
+            self.auth_context = self.use_cases.restore_session_use_case.execute(
+                RestoreSessionInputDto(token=token)
+            )
+        except InvalidSessionError:
+            self.use_cases.session_token_file.clear()
+            return
+        except Exception as e:
+            self.show_error_popup(f"Error restoring session: {e}")
+            return
+
+        self._session_token = token
+        self._open_home_screen()
+
+    def _end_session(self):
+        token = self._session_token or self.use_cases.session_token_file.read()
+        self._session_token = None
+        self.use_cases.session_token_file.clear()
+        if token is None:
+            return
+        try:
+            self.use_cases.end_session_use_case.execute(EndSessionInputDto(token))
+        except Exception as e:
+            self.show_error_popup(f"Error logging out: {e}")
+
+    def _open_home_screen(self):
+        # Each role's screens are imported only once someone signs in with it
+        if self.auth_context.role.value == "CLIENT":
+            from event.ui.list_event_client_gui import ListEventClientGui
+
+            self.navigator.push_screen(
+                ListEventClientGui, auth_context=self.auth_context
+            )
+        elif self.auth_context.role.value == "ORGANIZER":
+            from event.ui.list_event_organizer_gui import ListEventOrganizerGui
+
+            self.navigator.push_screen(
+                ListEventOrganizerGui, auth_context=self.auth_context
+            )
+        else:
+            from ticket.ui.validate_ticket_gui import ValidateTicketGUI
+
+            self.navigator.push_screen(
+                ValidateTicketGUI, auth_context=self.auth_context
+            )
+
     def _handle_create_user(self, values):
-        self.navigator.push_screen(CreateUserGUI)
+        from user.ui.create_user_gui import CreateUserGUI
 
-    def _set_auth_context(self, user: User):
-        self.auth_context = AuthContext(
-            id=user.id, name=user.name, email=user.email, role=user.role
-        )
+        self.navigator.push_screen(CreateUserGUI)